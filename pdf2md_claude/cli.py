@@ -47,7 +47,10 @@ DEFAULT_MODEL_ALIAS = "opus"
 """Short alias for the default model (key into ``MODELS`` dict)."""
 
 DEFAULT_IMAGE_DPI = 600
-"""Default DPI for page-region image rendering."""
+"""Page-region DPI used when ``--image-dpi`` is not given (shown in help).
+
+The option itself defaults to ``None`` so the image extractor can tell
+an explicit DPI (which also caps native rasters) from the default."""
 
 _SUMMARY_SEP = "=" * 78
 """Separator line for the conversion summary block."""
@@ -201,10 +204,13 @@ def _build_parser() -> argparse.ArgumentParser:
     processing_parent.add_argument(
         "--image-dpi",
         type=int,
-        default=DEFAULT_IMAGE_DPI,
+        default=None,
         metavar="DPI",
         help="DPI for page-region rendering — vector diagrams, composites, "
-             f"and snap/bbox modes (default: {DEFAULT_IMAGE_DPI}).",
+             "and snap/bbox modes; very large regions are rendered at a "
+             "lower DPI to bound the image size (default: "
+             f"{DEFAULT_IMAGE_DPI}).  When given, native rasters above this "
+             "resolution are rendered at it instead of extracted as-is.",
     )
     processing_parent.add_argument(
         "--strip-ai-descriptions",
@@ -638,6 +644,7 @@ def _convert_one_document(
     system_prompt: str | None,
     image_mode: ImageMode,
     image_dpi: int | None,
+    image_workers: int | None,
     no_images: bool,
     strip_ai_descriptions: bool,
     no_format: bool,
@@ -664,6 +671,7 @@ def _convert_one_document(
             system_prompt=system_prompt,
             image_mode=image_mode,
             image_dpi=image_dpi,
+            image_workers=image_workers,
             no_images=no_images,
             strip_ai_descriptions=strip_ai_descriptions,
             no_format=no_format,
@@ -856,6 +864,10 @@ def _cmd_convert(args: argparse.Namespace) -> int:
                 pdf_path, args.rules, rules_cache,
             )
 
+        # Image pages may fan out to a spawned process pool
+        # (image_workers=None): spawned workers do not re-run the CLI
+        # entry points (console script or ``python -m``).
+
         # Resolve effective worker count.
         jobs = args.jobs
         if jobs <= _JOBS_AUTO:
@@ -888,6 +900,7 @@ def _cmd_convert(args: argparse.Namespace) -> int:
                         system_prompt=system_prompts[pdf_path],
                         image_mode=image_mode,
                         image_dpi=args.image_dpi,
+                        image_workers=None,
                         no_images=args.no_images,
                         strip_ai_descriptions=args.strip_ai_descriptions,
                         no_format=args.no_format,
@@ -922,6 +935,7 @@ def _cmd_convert(args: argparse.Namespace) -> int:
                     system_prompt=system_prompts[pdf_path],
                     image_mode=image_mode,
                     image_dpi=args.image_dpi,
+                    image_workers=None,
                     no_images=args.no_images,
                     strip_ai_descriptions=args.strip_ai_descriptions,
                     no_format=args.no_format,
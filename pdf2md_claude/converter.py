@@ -16,7 +16,7 @@ from pathlib import Path
 import pymupdf
 
 from pdf2md_claude.claude_api import ApiResponse, ClaudeApi
-from pdf2md_claude.markers import PAGE_BEGIN, PAGE_END
+from pdf2md_claude.markers import PAGE_BEGIN, PAGE_MARKERS_RE
 from pdf2md_claude.models import ModelConfig, DocumentUsageStats, calculate_cost, fmt_duration
 from pdf2md_claude.workdir import ChunkUsageStats, WorkDir
 from pdf2md_claude.prompt import (
@@ -41,6 +41,23 @@ _CONTEXT_MIN_PAGES = 3
 _CONTEXT_MIN_LINES = 200
 
 
+class _Thousands:
+    """Lazy ``{n:,}`` formatter for logging arguments.
+
+    Logging defers ``str()`` on its arguments until a handler actually
+    emits the record, so wrapping counts in this class skips the
+    thousands-separator formatting entirely when INFO is disabled.
+    """
+
+    __slots__ = ("_n",)
+
+    def __init__(self, n: int) -> None:
+        self._n = n
+
+    def __str__(self) -> str:
+        return f"{self._n:,}"
+
+
 # ---------------------------------------------------------------------------
 # PDF helpers
 # ---------------------------------------------------------------------------
@@ -66,14 +83,26 @@ def extract_pdf_pages(pdf_path: Path, page_start: int, page_end: int) -> str:
     Returns:
         Base64-encoded PDF containing only the requested pages.
     """
-    doc = pymupdf.open(str(pdf_path))
+    src = pymupdf.open(str(pdf_path))
     try:
-        total_pages = len(doc)
+        total_pages = len(src)
         start_idx = max(0, page_start - 1)  # Convert to 0-indexed
         end_idx = min(total_pages, page_end)
+        if start_idx >= end_idx:
+            raise ValueError(
+                f"bad page range {page_start}-{page_end} "
+                f"(document has {total_pages} pages)"
+            )
 
-        doc.select(list(range(start_idx, end_idx)))
-        pdf_bytes = doc.tobytes()
+        # Copy the page slice into a fresh document via ``insert_pdf``
+        # instead of ``select()`` on the source: no page-number list is
+        # materialized and the source document is left untouched.
+        dst = pymupdf.open()
+        try:
+            dst.insert_pdf(src, from_page=start_idx, to_page=end_idx - 1)
+            pdf_bytes = dst.tobytes()
+        finally:
+            dst.close()
 
         actual_pages = end_idx - start_idx
         _log.debug(
@@ -83,7 +112,7 @@ def extract_pdf_pages(pdf_path: Path, page_start: int, page_end: int) -> str:
 
         return base64.standard_b64encode(pdf_bytes).decode("utf-8")
     finally:
-        doc.close()
+        src.close()
 
 
 # ---------------------------------------------------------------------------
@@ -256,12 +285,11 @@ def _remap_page_markers(markdown: str, page_start: int) -> str:
     Returns:
         Markdown with remapped page markers (or unchanged if no remap needed).
     """
-    markers = PAGE_BEGIN.re_value_groups.findall(markdown)
-    if not markers:
+    first = PAGE_BEGIN.re_value.search(markdown)
+    if first is None:
         return markdown
 
-    # markers is a list of (prefix, page_num_str, suffix) tuples.
-    first_page = int(markers[0][1])
+    first_page = int(first.group(1))
 
     if first_page >= page_start:
         # Markers already use original page numbers -- no remap needed.
@@ -276,15 +304,18 @@ def _remap_page_markers(markdown: str, page_start: int) -> str:
     )
 
     def _remap(match: re.Match) -> str:
-        page_num = int(match.group(2)) + offset
-        return f"{match.group(1)}{page_num}{match.group(3)}"
-
-    # Remap BEGIN and END markers.
+        assert match.lastindex is not None
+        value = match.lastindex + 1     # see markers_re()
+        text = match.group()
+        start = match.start(value) - match.start()
+        end = match.end(value) - match.start()
+        page_num = int(match.group(value)) + offset
+        return f"{text[:start]}{page_num}{text[end:]}"
+
+    # Remap BEGIN and END markers in one pass.
     # IMAGE_RECT no longer carries a page number — it derives the page
     # from the enclosing PAGE_BEGIN marker, so no remapping needed.
-    result = PAGE_BEGIN.re_value_groups.sub(_remap, markdown)
-    result = PAGE_END.re_value_groups.sub(_remap, result)
-    return result
+    return PAGE_MARKERS_RE.sub(_remap, markdown)
 
 
 # ---------------------------------------------------------------------------
@@ -412,21 +443,22 @@ class PdfConverter:
                 )
                 continue
 
-            # Compute ETA from freshly-converted chunks only.
-            if fresh_elapsed:
-                elapsed = time.time() - conversion_start
-                avg_time = sum(fresh_elapsed) / len(fresh_elapsed)
-                remaining_fresh = (num_chunks - chunk.index - cached_count) * avg_time
-                time_str = f" ({fmt_duration(elapsed)} elapsed, ETA ~{fmt_duration(remaining_fresh)})"
-            else:
-                time_str = ""
+            if _log.isEnabledFor(logging.INFO):
+                # Compute ETA from freshly-converted chunks only.
+                if fresh_elapsed:
+                    elapsed = time.time() - conversion_start
+                    avg_time = sum(fresh_elapsed) / len(fresh_elapsed)
+                    remaining_fresh = (num_chunks - chunk.index - cached_count) * avg_time
+                    time_str = f" ({fmt_duration(elapsed)} elapsed, ETA ~{fmt_duration(remaining_fresh)})"
+                else:
+                    time_str = ""
 
-            _log.info(
-                "  Chunk %d/%d: pages %d-%d (%d pages)%s...",
-                chunk.index + 1, num_chunks,
-                chunk.page_start, chunk.page_end, chunk.page_count,
-                time_str,
-            )
+                _log.info(
+                    "  Chunk %d/%d: pages %d-%d (%d pages)%s...",
+                    chunk.index + 1, num_chunks,
+                    chunk.page_start, chunk.page_end, chunk.page_count,
+                    time_str,
+                )
 
             # 2. Load prev_context from DISK (not from a variable).
             if chunk.index > 0:
@@ -470,28 +502,30 @@ class PdfConverter:
             # Remap page markers if Claude used sub-PDF viewer numbers.
             markdown = _remap_page_markers(resp.markdown, chunk.page_start)
 
-            total_inp = (
-                resp.input_tokens + resp.cache_creation_tokens + resp.cache_read_tokens
-            )
-            total_elapsed_so_far = time.time() - conversion_start
-            if chunk.index > 0:
-                time_done_str = (
-                    f"{fmt_duration(chunk_elapsed)}, "
-                    f"total {fmt_duration(total_elapsed_so_far)}"
+            if _log.isEnabledFor(logging.INFO):
+                total_inp = (
+                    resp.input_tokens + resp.cache_creation_tokens + resp.cache_read_tokens
                 )
-            else:
-                time_done_str = fmt_duration(chunk_elapsed)
-            _log.info(
-                "  ✓ Chunk %d/%d done (%s) (%s input, %s output)",
-                chunk.index + 1, num_chunks,
-                time_done_str, f"{total_inp:,}", f"{resp.output_tokens:,}",
-            )
-            if resp.cache_creation_tokens or resp.cache_read_tokens:
+                total_elapsed_so_far = time.time() - conversion_start
+                if chunk.index > 0:
+                    time_done_str = (
+                        f"{fmt_duration(chunk_elapsed)}, "
+                        f"total {fmt_duration(total_elapsed_so_far)}"
+                    )
+                else:
+                    time_done_str = fmt_duration(chunk_elapsed)
                 _log.info(
-                    "    Cache: %s written, %s read",
-                    f"{resp.cache_creation_tokens:,}",
-                    f"{resp.cache_read_tokens:,}",
+                    "  ✓ Chunk %d/%d done (%s) (%s input, %s output)",
+                    chunk.index + 1, num_chunks,
+                    time_done_str, f"{total_inp:,}",
+                    f"{resp.output_tokens:,}",
                 )
+                if resp.cache_creation_tokens or resp.cache_read_tokens:
+                    _log.info(
+                        "    Cache: %s written, %s read",
+                        f"{resp.cache_creation_tokens:,}",
+                        f"{resp.cache_read_tokens:,}",
+                    )
 
             # Extract context tail for the next chunk.
             context_tail = _get_context_tail(markdown)
@@ -546,10 +580,10 @@ class PdfConverter:
             _log.info(
                 "  Conversion done: %s input (%s cache-write, %s cache-read) "
                 "+ %s output tokens, cost $%.2f, time %s",
-                f"{stats.total_input_tokens:,}",
-                f"{stats.cache_creation_tokens:,}",
-                f"{stats.cache_read_tokens:,}",
-                f"{stats.output_tokens:,}",
+                _Thousands(stats.total_input_tokens),
+                _Thousands(stats.cache_creation_tokens),
+                _Thousands(stats.cache_read_tokens),
+                _Thousands(stats.output_tokens),
                 stats.cost,
                 fmt_duration(stats.elapsed_seconds),
             )
@@ -557,8 +591,8 @@ class PdfConverter:
             _log.info(
                 "  Conversion done: %s input + %s output tokens, "
                 "cost $%.2f, time %s",
-                f"{stats.total_input_tokens:,}",
-                f"{stats.output_tokens:,}",
+                _Thousands(stats.total_input_tokens),
+                _Thousands(stats.output_tokens),
                 stats.cost,
                 fmt_duration(stats.elapsed_seconds),
             )
@@ -7,48 +7,154 @@ whitespace).  Uses only Python stdlib — no external dependencies.
 The main entry point is :func:`format_markdown`, a pure function
 that is also exposed as :class:`FormatMarkdownStep` for the
 processing pipeline.
+
+The module is written to compile cleanly with mypyc (constants are
+``Final``, all state is typed).  A compiled extension built with
+``mypyc pdf2md_claude/formatter.py`` is picked up by the normal import
+system in place of this file; without it, the pure-Python code runs.
 """
 
 from __future__ import annotations
 
+import functools
+import io
+import logging
 import re
+import threading
+from collections.abc import Iterator
 from dataclasses import dataclass
-from html.parser import HTMLParser
+from html import unescape
+from typing import Final
 
 
-_log = __import__("logging").getLogger("formatter")
+_log = logging.getLogger("formatter")
 
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 
-_INDENT = "  "
+_INDENT: Final = "  "
 """Per-level indentation string (2 spaces)."""
 
-_BLOCK_TAGS = frozenset({
+_MAX_PRECOMPUTED_DEPTH: Final = 32
+"""Nesting depth up to which indentation strings are precomputed."""
+
+_INDENTS: Final = tuple(_INDENT * depth for depth in range(_MAX_PRECOMPUTED_DEPTH))
+"""``_INDENTS[depth]`` is the indentation prefix for *depth*."""
+
+_BLOCK_TAGS: Final = frozenset({
     "table", "thead", "tbody", "tfoot", "tr", "th", "td",
     "caption", "colgroup", "col",
 })
 """HTML tags that get their own line and increase/decrease indentation."""
 
-_SELF_CLOSING_TAGS = frozenset({"br", "col", "img", "hr"})
+_SELF_CLOSING_TAGS: Final = frozenset({"br", "col", "img", "hr"})
 """Tags that are self-closing (no matching end tag expected)."""
 
-_TABLE_BLOCK_RE = re.compile(
-    r"^(<table\b[^>]*>.*?</table>)",
-    re.MULTILINE | re.DOTALL,
+_CELL_TAGS: Final = frozenset({"td", "th"})
+"""Block tags that open a cell context (content stays on one line)."""
+
+_COMMON_INLINE_TAGS: Final = frozenset({
+    "em", "strong", "b", "i", "u", "sup", "sub", "small", "span", "a", "code",
+})
+"""Inline tags frequently found inside table cells."""
+
+_KNOWN_TAGS: Final = _BLOCK_TAGS | _SELF_CLOSING_TAGS | _COMMON_INLINE_TAGS
+"""Tag vocabulary with precomputed open/close strings."""
+
+_OPEN_TAGS: Final[dict[str, str]] = {tag: f"<{tag}>" for tag in _KNOWN_TAGS}
+"""Precomputed attribute-less ``<tag>`` strings (the common case for
+``<tr>``, ``<td>`` and friends)."""
+
+_CLOSE_TAGS: Final[dict[str, str]] = {tag: f"</{tag}>" for tag in _KNOWN_TAGS}
+"""Precomputed ``</tag>`` strings for the common tag vocabulary."""
+
+_TAG_BLOCK: Final = 1
+_TAG_CELL: Final = 2
+_TAG_SELF_CLOSING: Final = 4
+"""Bit flags stored in :data:`_TAG_FLAGS`."""
+
+_TAG_FLAGS: Final[dict[str, int]] = {
+    tag: (
+        _TAG_BLOCK * (tag in _BLOCK_TAGS)
+        | _TAG_CELL * (tag in _CELL_TAGS)
+        | _TAG_SELF_CLOSING * (tag in _SELF_CLOSING_TAGS)
+    )
+    for tag in _BLOCK_TAGS | _SELF_CLOSING_TAGS
+}
+"""Lowercase tag name → classification bitmask (missing = inline tag).
+
+Collapses the block / cell / self-closing membership tests into a
+single dict lookup per tag."""
+
+_MAX_TABLE_CHARS: Final[int] = 1_000_000
+"""Table blocks longer than this (in characters) are passed through
+unformatted — bounds worst-case time on malformed input, e.g. a
+``<table>`` whose ``</table>`` is missing until much later."""
+
+_PRETTIFY_CACHE_SIZE: Final = 256
+"""Number of prettified tables kept in the process-wide LRU cache."""
+
+_PRETTIFY_CACHE_MAX_LEN: Final[int] = 65536
+"""Tables longer than this (in characters) bypass the cache."""
+
+_TOK_START: Final = 0
+_TOK_END: Final = 1
+_TOK_STARTEND: Final = 2
+_TOK_TEXT: Final = 3
+_TOK_COMMENT: Final = 4
+"""Token kinds yielded by :func:`_tokenize_table`."""
+
+_NL_TO_SPACE: Final = str.maketrans({"\n": " ", "\r": " "})
+"""Translate table mapping line breaks to spaces (cell content and
+attributes must stay on one line)."""
+
+_COMMENT_OPEN: Final = "<!--"
+_COMMENT_CLOSE: Final = "-->"
+
+_START_TAG_RE: Final = re.compile(
+    r"""([^\s/>]++)((?:[^>"']++|"[^"]*+"|'[^']*+')*+)>"""
 )
-"""Regex matching a complete ``<table>...</table>`` block starting at
-the beginning of a line.  Used to extract table blocks from markdown."""
+"""Matches a start tag after its ``<``: the tag name (group 1) and the
+attribute section (group 2) up to the closing ``>``, skipping over
+quoted values that may themselves contain ``>``.  Possessive
+quantifiers (Python 3.11+) make an unterminated quote fail in linear
+time instead of backtracking through every split."""
+
+_ATTR_RE: Final = re.compile(
+    r"""([^\s/>][^\s/=>]*+)"""
+    r"""(\s*+=++\s*+('[^']*+'|"[^"]*+"|(?!['"])[^>\s]*+))?[\s/]*+"""
+)
+"""Matches one attribute in a start tag's attribute section: the name
+(group 1), the ``=`` part if present (group 2) and the raw, possibly
+quoted value (group 3).  Same tolerant grammar as ``html.parser``."""
+
+_ATTRS_CACHE_SIZE: Final = 1024
+"""Number of normalized attribute sections kept in the LRU cache."""
+
+_FLAT_TAG_RE: Final = re.compile(r"(/?)(table|tr|td|th)(?:\s([^>]*+))?")
+"""Full-match pattern for the body of a tag accepted by
+:func:`_prettify_table_fast` (``/`` prefix, name, optional attributes)."""
 
-_CONSECUTIVE_BLANK_LINES_RE = re.compile(r"\n{3,}")
-"""Matches 3+ consecutive newlines (to collapse to at most 2)."""
+_FLAT_CELL_INLINE: Final = "<br>"
+"""The only inline markup allowed inside a flat-table cell."""
 
-_TRAILING_WHITESPACE_RE = re.compile(r"[ \t]+$", re.MULTILINE)
-"""Matches trailing whitespace on any line."""
+_TABLE_OPEN: Final = "<table"
+_TABLE_CLOSE: Final = "</table>"
+"""Delimiters searched for by :func:`_iter_tables`."""
 
-_HEADING_RE = re.compile(r"^(#{1,6}\s)", re.MULTILINE)
-"""Matches markdown ATX headings at start of line."""
+_NORMALIZE_RE: Final = re.compile(r"(?:[ \t]*+\n){3,}|[ \t]++(?=\n|\Z)")
+"""Matches either a run of 3+ line ends (with any trailing whitespace
+on those lines, collapsed to one blank line) or trailing whitespace at
+the end of a single line (removed).  Lets whitespace normalization run
+as one substitution pass over the document.  Whitespace runs are
+matched possessively: a run not followed by a line end is rejected
+without giving back characters one at a time."""
+
+_NEEDS_FORMAT_RE: Final = re.compile(r"<table|\n\n\n|[ \t](?:\n|\Z)")
+"""Cheap pre-check: matches anything :func:`format_markdown` could
+change apart from the final newline (a table, a blank-line run, or
+trailing whitespace).  No match means the text is already formatted."""
 
 
 # ---------------------------------------------------------------------------
@@ -56,148 +162,254 @@ _HEADING_RE = re.compile(r"^(#{1,6}\s)", re.MULTILINE)
 # ---------------------------------------------------------------------------
 
 
-class _TablePrettifier(HTMLParser):
-    """Re-indent an HTML table block with consistent 2-space indentation.
+@functools.lru_cache(maxsize=_ATTRS_CACHE_SIZE)
+def _normalize_attrs(attrs: str) -> str:
+    """Return *attrs* in the canonical form ``html.parser`` produced.
 
-    Block-level table tags (``table``, ``thead``, ``tbody``, ``tr``,
-    ``td``, etc.) each get their own line with depth-based indentation.
-    Inline content within cells (``<em>``, ``<br>``, ``<sup>``, etc.)
-    is preserved verbatim on the same line.
+    Attribute names are lowercased, values are entity-unescaped and
+    re-quoted with ``"``, and attributes are separated by single spaces;
+    valueless attributes stay bare.  Anything the attribute grammar does
+    not match ends the scan and is kept verbatim.
+
+    >>> _normalize_attrs("COLSPAN=2  class='x'  nowrap")
+    'colspan="2" class="x" nowrap'
     """
+    parts: list[str] = []
+    pos = 0
+    n = len(attrs)
+    while pos < n:
+        m = _ATTR_RE.match(attrs, pos)
+        if m is None:
+            parts.append(attrs[pos:].strip())
+            break
+        name, rest, value = m.groups()
+        if not rest:
+            parts.append(name.lower())
+        else:
+            if value[:1] in ("'", '"') and value[:1] == value[-1:]:
+                value = value[1:-1]
+            parts.append(f'{name.lower()}="{unescape(value)}"')
+        pos = m.end()
+    return " ".join(parts)
 
-    def __init__(self) -> None:
-        super().__init__(convert_charrefs=False)
-        self._lines: list[str] = []
-        self._depth: int = 0
-        self._current_line: str = ""
-        self._in_cell: bool = False
-        self._cell_depth: int = 0
-
-    # -- helpers -----------------------------------------------------------
-
-    def _flush_line(self) -> None:
-        """Append the current line buffer (if non-empty) to output."""
-        stripped = self._current_line.rstrip()
-        if stripped:
-            self._lines.append(stripped)
-        self._current_line = ""
-
-    def _indent(self) -> str:
-        return _INDENT * self._depth
-
-    # -- parser callbacks --------------------------------------------------
-
-    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
-        tag_lower = tag.lower()
-
-        if tag_lower in _BLOCK_TAGS:
-            if self._in_cell and tag_lower not in ("td", "th"):
-                # Inline block tag inside a cell — treat as inline
-                self._current_line += self._build_tag(tag, attrs)
-                return
 
-            # Flush any pending content before the block tag
-            self._flush_line()
+def _tokenize_table(html: str) -> Iterator[tuple[int, str, str]]:
+    """Split an HTML table block into ``(kind, value, attrs)`` tokens.
 
-            if tag_lower in ("td", "th"):
-                # Cell tags: start a cell context
-                self._current_line = self._indent() + self._build_tag(tag, attrs)
-                self._in_cell = True
-                self._cell_depth = self._depth
-            else:
-                self._lines.append(self._indent() + self._build_tag(tag, attrs))
+    A single forward scan using ``str.find("<")`` to locate markup.
+    Tag names are lowercased and the attribute section is normalized by
+    :func:`_normalize_attrs`.  ``value`` is
+    the tag name for tag tokens and the raw text for text and comment
+    tokens (``attrs`` is ``""`` for those).
 
-            if tag_lower not in _SELF_CLOSING_TAGS:
-                self._depth += 1
+    Anything that does not look like a tag (a bare ``<``, an
+    unterminated tag or comment) is passed through as text.
+    """
+    pos = 0
+    n = len(html)
+    while pos < n:
+        lt = html.find("<", pos)
+        if lt < 0:
+            yield (_TOK_TEXT, html[pos:], "")
+            return
+        if lt > pos:
+            yield (_TOK_TEXT, html[pos:lt], "")
+
+        nxt = html[lt + 1:lt + 2]
+        if nxt == "!" and html.startswith(_COMMENT_OPEN, lt):
+            end = html.find(_COMMENT_CLOSE, lt + len(_COMMENT_OPEN))
+            if end < 0:
+                yield (_TOK_TEXT, html[lt:], "")
+                return
+            yield (_TOK_COMMENT, html[lt + len(_COMMENT_OPEN):end], "")
+            pos = end + len(_COMMENT_CLOSE)
+        elif nxt == "/":
+            gt = html.find(">", lt + 2)
+            if gt < 0:
+                yield (_TOK_TEXT, html[lt:], "")
+                return
+            name = html[lt + 2:gt].split(None, 1)
+            if name:
+                yield (_TOK_END, name[0].lower(), "")
+            pos = gt + 1
+        elif nxt.isascii() and nxt.isalpha():
+            m = _START_TAG_RE.match(html, lt + 1)
+            if m is None:
+                yield (_TOK_TEXT, html[lt:], "")
+                return
+            tag = m.group(1).lower()
+            attrs = m.group(2).strip()
+            if "\n" in attrs or "\r" in attrs:
+                attrs = attrs.translate(_NL_TO_SPACE)
+            if attrs.endswith("/"):
+                yield (_TOK_STARTEND, tag, _normalize_attrs(attrs[:-1]))
+            else:
+                yield (_TOK_START, tag, _normalize_attrs(attrs))
+            pos = m.end()
         else:
-            # Inline tag — append to current line
-            self._current_line += self._build_tag(tag, attrs)
-
-    def handle_endtag(self, tag: str) -> None:
-        tag_lower = tag.lower()
-
-        if tag_lower in _BLOCK_TAGS:
-            if self._in_cell and tag_lower not in ("td", "th"):
-                # Inline block end inside a cell
-                self._current_line += f"</{tag}>"
+            # Not markup (e.g. "1 < 2") — emit up to the next candidate.
+            nxt_lt = html.find("<", lt + 1)
+            if nxt_lt < 0:
+                yield (_TOK_TEXT, html[lt:], "")
                 return
+            yield (_TOK_TEXT, html[lt:nxt_lt], "")
+            pos = nxt_lt
 
-            self._depth = max(0, self._depth - 1)
 
-            if tag_lower in ("td", "th"):
-                # Close cell on the same line
-                self._current_line += f"</{tag}>"
-                self._flush_line()
-                self._in_cell = False
-            else:
-                self._flush_line()
-                self._lines.append(self._indent() + f"</{tag}>")
-        else:
-            # Inline end tag
-            self._current_line += f"</{tag}>"
+class _TablePrettifier:
+    """Re-indent an HTML table block with consistent 2-space indentation.
 
-    def handle_data(self, data: str) -> None:
-        if self._in_cell:
-            # Inside a cell: preserve content inline (strip newlines)
-            self._current_line += data.replace("\n", " ")
-        else:
-            # Outside cells: handle HTML comments / text between tags
-            stripped = data.strip()
-            if stripped:
-                self._flush_line()
-                self._current_line = self._indent() + stripped
-
-    def handle_comment(self, data: str) -> None:
-        comment = f"<!--{data}-->"
-        if self._in_cell:
-            self._current_line += comment
-        else:
-            self._flush_line()
-            self._lines.append(self._indent() + comment)
+    Block-level table tags (``table``, ``thead``, ``tbody``, ``tr``,
+    ``td``, etc.) each get their own line with depth-based indentation.
+    Inline content within cells (``<em>``, ``<br>``, ``<sup>``, etc.)
+    is preserved verbatim on the same line.
 
-    def handle_entityref(self, name: str) -> None:
-        self._current_line += f"&{name};"
+    Driven by :func:`_tokenize_table` rather than ``html.parser``: the
+    hand-written scanner avoids the generic tokenizer and per-event
+    callback overhead.
+    """
 
-    def handle_charref(self, name: str) -> None:
-        self._current_line += f"&#{name};"
+    __slots__ = ("_out", "_cur")
 
-    def handle_startendtag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
-        tag_str = self._build_tag(tag, attrs, self_closing=True)
-        if tag.lower() in _BLOCK_TAGS:
-            self._flush_line()
-            self._lines.append(self._indent() + tag_str)
-        else:
-            self._current_line += tag_str
+    def __init__(self) -> None:
+        self._out: io.StringIO = io.StringIO()
+        self._cur: list[str] = []
 
     # -- tag building ------------------------------------------------------
 
     @staticmethod
-    def _build_tag(
-        tag: str,
-        attrs: list[tuple[str, str | None]],
-        self_closing: bool = False,
-    ) -> str:
-        parts = [tag]
-        for key, value in attrs:
-            if value is None:
-                parts.append(key)
-            else:
-                parts.append(f'{key}="{value}"')
+    def _build_tag(tag: str, attrs: str, self_closing: bool = False) -> str:
+        if not attrs and not self_closing:
+            return _OPEN_TAGS.get(tag) or f"<{tag}>"
         close = " />" if self_closing else ">"
-        return "<" + " ".join(parts) + close
+        if attrs:
+            return f"<{tag} {attrs}{close}"
+        return f"<{tag}{close}"
 
     # -- public API --------------------------------------------------------
 
     def prettify(self, html: str) -> str:
-        """Parse *html* and return a prettified version."""
-        self._lines = []
-        self._depth = 0
-        self._current_line = ""
-        self._in_cell = False
-        self._cell_depth = 0
-        self.feed(html)
-        self._flush_line()
-        return "\n".join(self._lines)
+        """Parse *html* and return a prettified version.
+
+        Per-parse state (depth, cell flag) lives in local variables of
+        this single dispatch loop rather than in instance attributes;
+        the instance only owns the reusable output buffers.
+        """
+        out = self._out
+        out.seek(0)
+        out.truncate()
+        write = out.write
+        cur = self._cur  # fragments of the line being built
+        cur.clear()
+        build_tag = self._build_tag
+        depth = 0
+        in_cell = False
+
+        def flush() -> None:
+            """Write the current line fragments (if non-empty) to output.
+
+            Lines are built without trailing whitespace (text outside
+            cells is stripped, closed cells end with ``</td>``), so only
+            a cell flushed before its end tag needs ``rstrip()``.
+            """
+            if cur:
+                line = "".join(cur)
+                cur.clear()
+                if in_cell:
+                    line = line.rstrip()
+                if line:
+                    write(line)
+                    write("\n")
+
+        for kind, value, attrs in _tokenize_table(html):
+            indent = (
+                _INDENTS[depth] if depth < _MAX_PRECOMPUTED_DEPTH
+                else _INDENT * depth
+            )
+
+            if kind == _TOK_TEXT:
+                if in_cell:
+                    # Inside a cell: preserve content inline (strip newlines)
+                    if "\n" in value or "\r" in value:
+                        value = value.translate(_NL_TO_SPACE)
+                    cur.append(value)
+                else:
+                    # Outside cells: text between tags
+                    stripped = value.strip()
+                    if stripped:
+                        flush()
+                        cur.append(indent)
+                        cur.append(stripped)
+
+            elif kind == _TOK_START:
+                flags = _TAG_FLAGS.get(value, 0)
+                tag_str = build_tag(value, attrs)
+                if not flags & _TAG_BLOCK or (in_cell and not flags & _TAG_CELL):
+                    # Inline tag (or block tag nested inside a cell)
+                    cur.append(tag_str)
+                    continue
+
+                # Flush any pending content before the block tag
+                flush()
+                if flags & _TAG_CELL:
+                    # Cell tags: start a cell context
+                    cur.append(indent)
+                    cur.append(tag_str)
+                    in_cell = True
+                else:
+                    write(indent)
+                    write(tag_str)
+                    write("\n")
+                if not flags & _TAG_SELF_CLOSING:
+                    depth += 1
+
+            elif kind == _TOK_END:
+                flags = _TAG_FLAGS.get(value, 0)
+                close = _CLOSE_TAGS.get(value) or f"</{value}>"
+                if not flags & _TAG_BLOCK or (in_cell and not flags & _TAG_CELL):
+                    # Inline end tag (or block end nested inside a cell)
+                    cur.append(close)
+                    continue
+
+                if depth:
+                    depth -= 1
+                if flags & _TAG_CELL:
+                    # Close cell on the same line
+                    cur.append(close)
+                    in_cell = False
+                    flush()
+                else:
+                    flush()
+                    write(
+                        _INDENTS[depth] if depth < _MAX_PRECOMPUTED_DEPTH
+                        else _INDENT * depth
+                    )
+                    write(close)
+                    write("\n")
+
+            elif kind == _TOK_STARTEND:
+                tag_str = build_tag(value, attrs, self_closing=True)
+                if _TAG_FLAGS.get(value, 0) & _TAG_BLOCK:
+                    flush()
+                    write(indent)
+                    write(tag_str)
+                    write("\n")
+                else:
+                    cur.append(tag_str)
+
+            else:  # _TOK_COMMENT
+                comment = f"<!--{value}-->"
+                if in_cell:
+                    cur.append(comment)
+                else:
+                    flush()
+                    write(indent)
+                    write(comment)
+                    write("\n")
+
+        flush()
+        # Drop the newline written after the last line.
+        return out.getvalue()[:-1]
 
 
 def prettify_table(html: str) -> str:
@@ -206,8 +418,181 @@ def prettify_table(html: str) -> str:
     Block-level tags get their own line with 2-space depth indentation.
     Cell content (including inline HTML) is preserved on one line.
     HTML comments (e.g. page markers) are preserved at correct depth.
+
+    Results for tables up to ``_PRETTIFY_CACHE_MAX_LEN`` characters are
+    memoized, so re-formatting a document (or repeated boilerplate
+    tables) does not re-parse identical HTML.
+    """
+    if len(html) <= _PRETTIFY_CACHE_MAX_LEN:
+        return _prettify_table_cached(html)
+    return _prettify_table_uncached(html)
+
+
+@functools.lru_cache(maxsize=_PRETTIFY_CACHE_SIZE)
+def _prettify_table_cached(html: str) -> str:
+    """Memoized :func:`prettify_table` for tables below the size limit."""
+    return _prettify_table_uncached(html)
+
+
+def _prettify_table_uncached(html: str) -> str:
+    """Prettify via the flat-table fast path, else the general parser."""
+    result = _prettify_table_fast(html)
+    if result is None:
+        result = _get_prettifier().prettify(html)
+    return result
+
+
+def _is_flat_table(html: str) -> bool:
+    """Cheap pre-check for :func:`_prettify_table_fast`.
+
+    Rejects tables with section tags, comments (page markers) or a
+    nested table.  Passing this check does not guarantee the fast path
+    applies — the scanner itself bails out on anything unexpected.
+    """
+    return (
+        "<thead" not in html
+        and "<tbody" not in html
+        and "<!--" not in html
+        and _TABLE_OPEN not in html[len(_TABLE_OPEN):]
+    )
+
+
+def _prettify_table_fast(html: str) -> str | None:
+    """Prettify a flat ``table > tr > td/th`` block without the tokenizer.
+
+    Handles the dominant shape of converted tables: rows of cells whose
+    content is plain text (optionally with ``<br>``).  Tags are copied
+    from the source with fixed indentation per level, and each cell is
+    emitted as one line.  Output is identical to :class:`_TablePrettifier`
+    for every table it accepts.
+
+    Returns:
+        The prettified table, or ``None`` if *html* has any other
+        structure (section tags, comments, inline markup, stray text,
+        unbalanced tags, uppercase names) — the caller then falls back
+        to the general prettifier.
+    """
+    if not _is_flat_table(html):
+        return None
+
+    lines: list[str] = []
+    level = 0  # 0 = outside table, 1 = inside table, 2 = inside row
+    pos = 0
+    while True:
+        lt = html.find("<", pos)
+        if lt < 0:
+            if html[pos:].strip():
+                return None
+            break
+        if html[pos:lt].strip():
+            return None  # text outside cells
+        gt = html.find(">", lt)
+        if gt < 0:
+            return None
+        body = html[lt + 1:gt]
+        if body.count('"') % 2 or body.count("'") % 2:
+            return None  # a quoted value may contain ">"
+        m = _FLAT_TAG_RE.fullmatch(body)
+        if m is None:
+            return None
+        closing, tag, attrs = m.groups()
+        if attrs:
+            attrs = attrs.strip()
+            if attrs.endswith("/"):
+                return None
+            if "\n" in attrs or "\r" in attrs:
+                attrs = attrs.translate(_NL_TO_SPACE)
+            attrs = _normalize_attrs(attrs)
+        open_tag = f"<{tag} {attrs}>" if attrs else _OPEN_TAGS[tag]
+        pos = gt + 1
+
+        if closing:
+            if tag == "tr" and level == 2:
+                lines.append(_INDENTS[1] + "</tr>")
+            elif tag == "table" and level == 1:
+                lines.append("</table>")
+            else:
+                return None
+            level -= 1
+        elif tag == "table" and level == 0:
+            lines.append(open_tag)
+            level = 1
+        elif tag == "tr" and level == 1:
+            lines.append(_INDENTS[1] + open_tag)
+            level = 2
+        elif tag in _CELL_TAGS and level == 2:
+            close_tag = _CLOSE_TAGS[tag]
+            close = html.find(close_tag, pos)
+            if close < 0:
+                return None
+            content = html[pos:close]
+            if "<" in content and "<" in content.replace(_FLAT_CELL_INLINE, ""):
+                return None
+            if "\n" in content or "\r" in content:
+                content = content.translate(_NL_TO_SPACE)
+            lines.append(_INDENTS[2] + open_tag + content + close_tag)
+            pos = close + len(close_tag)
+        else:
+            return None
+
+    if level:
+        return None
+    return "\n".join(lines)
+
+
+_TLS = threading.local()
+"""Per-thread storage for the reusable :class:`_TablePrettifier`."""
+
+
+def _get_prettifier() -> _TablePrettifier:
+    """Return this thread's :class:`_TablePrettifier`, creating it once.
+
+    ``prettify()`` resets all parser state on entry, so one instance can
+    serve every table; it is kept per-thread because documents are
+    converted in parallel worker threads (``-j``).
     """
-    return _TablePrettifier().prettify(html)
+    prettifier = getattr(_TLS, "prettifier", None)
+    if prettifier is None:
+        prettifier = _TLS.prettifier = _TablePrettifier()
+    return prettifier
+
+
+# ---------------------------------------------------------------------------
+# Table block detection
+# ---------------------------------------------------------------------------
+
+
+def _iter_tables(text: str) -> Iterator[tuple[int, int]]:
+    """Yield ``(start, end)`` spans of ``<table>...</table>`` blocks.
+
+    A block starts with a ``<table`` tag at the beginning of a line and
+    ends at the first ``</table>`` after that tag.  Uses ``str.find``
+    only, so there is no regex backtracking on large or malformed input.
+    """
+    n = len(text)
+    pos = 0
+    while True:
+        start = text.find(_TABLE_OPEN, pos)
+        if start < 0:
+            return
+        after = start + len(_TABLE_OPEN)
+        if start and text[start - 1] != "\n":
+            # Not at the beginning of a line.
+            pos = after
+            continue
+        if after < n and (text[after].isalnum() or text[after] == "_"):
+            # A longer tag name (e.g. ``<tablex``).
+            pos = after
+            continue
+        gt = text.find(">", after)
+        if gt < 0:
+            return
+        close = text.find(_TABLE_CLOSE, gt + 1)
+        if close < 0:
+            return
+        end = close + len(_TABLE_CLOSE)
+        yield start, end
+        pos = end
 
 
 # ---------------------------------------------------------------------------
@@ -215,21 +600,31 @@ def prettify_table(html: str) -> str:
 # ---------------------------------------------------------------------------
 
 
-def _normalize_blank_lines(text: str) -> str:
-    """Ensure consistent blank lines around structural elements.
+def _normalize_sub(m: re.Match[str]) -> str:
+    """Replacement callback for :data:`_NORMALIZE_RE`."""
+    return "\n\n" if m.group().endswith("\n") else ""
+
+
+def _normalize_whitespace(text: str) -> str:
+    """Strip trailing whitespace and collapse runs of blank lines.
 
-    - Exactly one blank line before/after ``<table>`` blocks.
-    - Exactly one blank line before headings (``## ...``).
-    - Collapse 3+ consecutive blank lines to exactly one blank line.
+    Single pass that removes trailing spaces/tabs from every line and
+    collapses 3+ consecutive line ends (including whitespace-only
+    lines) to exactly one blank line.  Returns *text* itself when
+    there is nothing to change.
     """
-    # Collapse excessive blank lines first
-    text = _CONSECUTIVE_BLANK_LINES_RE.sub("\n\n", text)
-    return text
+    if _NORMALIZE_RE.search(text) is None:
+        return text
+    return _NORMALIZE_RE.sub(_normalize_sub, text)
 
 
-def _strip_trailing_whitespace(text: str) -> str:
-    """Remove trailing spaces/tabs from every line."""
-    return _TRAILING_WHITESPACE_RE.sub("", text)
+def _ensure_final_newline(text: str) -> str:
+    """Return *text* ending with exactly one newline."""
+    if text.endswith("\n\n"):
+        return text.rstrip("\n") + "\n"
+    if not text.endswith("\n"):
+        return text + "\n"
+    return text
 
 
 # ---------------------------------------------------------------------------
@@ -246,27 +641,48 @@ def format_markdown(text: str) -> str:
     Operations (in order):
 
     1. Prettify all ``<table>...</table>`` blocks (consistent indentation).
-    2. Normalize blank lines around structural elements.
-    3. Strip trailing whitespace from all lines.
-    4. Ensure file ends with a single newline.
-    """
-
-    # 1. Prettify HTML tables
-    def _prettify_match(m: re.Match[str]) -> str:
-        return prettify_table(m.group(1))
-
-    text = _TABLE_BLOCK_RE.sub(_prettify_match, text)
+    2. Strip trailing whitespace and collapse excessive blank lines.
+    3. Ensure file ends with a single newline.
 
-    # 2. Normalize blank lines
-    text = _normalize_blank_lines(text)
+    Steps 1-2 run as one streaming pass: each segment is written once
+    into an output buffer.
 
-    # 3. Strip trailing whitespace
-    text = _strip_trailing_whitespace(text)
-
-    # 4. Ensure single trailing newline
-    text = text.rstrip("\n") + "\n"
+    Text that is already formatted (no tables, blank-line runs or
+    trailing whitespace) skips steps 1-2 entirely.  Tables longer than
+    ``_MAX_TABLE_CHARS`` are not prettified (a warning is logged).
+    """
+    if _NEEDS_FORMAT_RE.search(text) is None:
+        return _ensure_final_newline(text)
+
+    # Stream segments into a single buffer: text between tables is
+    # normalized, tables are prettified (their lines are already
+    # stripped, so normalization is a no-op unless a comment inside
+    # carries whitespace).  Tables always start at a line boundary, so
+    # no blank-line run or trailing whitespace spans two segments.
+    spans = list(_iter_tables(text))
+    if not spans:
+        return _ensure_final_newline(_normalize_whitespace(text))
+
+    out = io.StringIO()
+    write = out.write
+    normalize = _normalize_whitespace
+    prettify = prettify_table
+    pos = 0
+    for start, end in spans:
+        write(normalize(text[pos:start]))
+        table = text[start:end]
+        if len(table) > _MAX_TABLE_CHARS:
+            _log.warning(
+                "  Skipping oversize table at offset %d (%d chars > %d)",
+                start, len(table), _MAX_TABLE_CHARS,
+            )
+            write(normalize(table))
+        else:
+            write(normalize(prettify(table)))
+        pos = end
+    write(normalize(text[pos:]))
 
-    return text
+    return _ensure_final_newline(out.getvalue())
 
 
 # ---------------------------------------------------------------------------
@@ -274,7 +690,7 @@ def format_markdown(text: str) -> str:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class FormatMarkdownStep:
     """Prettify HTML tables and normalize markdown spacing.
 
@@ -15,8 +15,16 @@ vector diagrams, composite/tiled figures, and mixed content.
 
 from __future__ import annotations
 
+import bisect
+import hashlib
+import io
 import logging
+import multiprocessing
+import os
 import re
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -25,12 +33,15 @@ import pymupdf
 
 from pdf2md_claude.markers import (
     IMAGE_BEGIN,
+    IMAGE_BLOCK_EVENTS_RE,
     IMAGE_END,
+    IMAGE_EVENTS_RE,
     IMAGE_FILENAME_FORMAT,
     IMAGE_FILENAME_RE,
     IMAGE_RECT,
     IMAGE_REF_RE,
     PAGE_BEGIN,
+    iter_markers,
 )
 
 _log = logging.getLogger("images")
@@ -42,6 +53,21 @@ _RENDER_DPI = 600
 # to account for imprecision in Claude's coordinate estimates.
 _RECT_PADDING = 0.01
 
+_PARALLEL_MIN_PAGES = 4
+"""Pages with IMAGE blocks needed before rendering moves to a process pool.
+
+Below this, worker start-up (a fresh interpreter importing pymupdf)
+costs more than the rasterization it would parallelize.
+"""
+
+_POOL_START_METHOD = "spawn"
+"""Start method for render worker processes.
+
+Forking would copy a parent whose ``-j`` threads may be inside MuPDF
+calls at that moment (and warns on Python 3.12+); spawned workers start
+from a fresh interpreter instead.
+"""
+
 _DEBUG_VARIANT_NAMES = ("auto", "snap", "bbox")
 """Variant names produced per IMAGE block in debug mode."""
 
@@ -127,6 +153,8 @@ class PageRaster:
     """Native pixel height of the embedded image."""
     rect: pymupdf.Rect
     """Placement rectangle on the page (absolute points)."""
+    stream_filter: str = ""
+    """PDF stream filter of the image (e.g. ``"DCTDecode"`` for JPEG)."""
 
 
 # ---------------------------------------------------------------------------
@@ -152,54 +180,53 @@ def parse_image_rects(markdown: str) -> list[ImageRect]:
     Returns a list of :class:`ImageRect` in document order.
     """
     rects: list[ImageRect] = []
+    if IMAGE_BEGIN.tag not in markdown:
+        return rects
 
-    # Split into IMAGE blocks and extract rect + caption from each.
-    lines = markdown.split("\n")
+    # Walk marker / caption events in one regex pass over the text.
     in_block = False
-    block_rect_match: re.Match[str] | None = None
+    block_rect: str | None = None
     block_caption = ""
     current_page: int | None = None
 
-    for line in lines:
+    for m in IMAGE_EVENTS_RE.finditer(markdown):
+        kind, index = m.lastgroup, m.lastindex
+        assert index is not None  # every event is a named group
+        value = m.group(index + 1)
+
         # Track current page from PAGE_BEGIN markers.
-        page_match = PAGE_BEGIN.re_value.search(line)
-        if page_match:
-            current_page = int(page_match.group(1))
+        if kind == PAGE_BEGIN.tag:
+            current_page = int(value)
+            continue
 
-        if IMAGE_BEGIN.re.search(line):
+        if kind == IMAGE_BEGIN.tag:
             in_block = True
-            block_rect_match = None
+            block_rect = None
             block_caption = ""
             continue
 
-        if in_block and IMAGE_END.re.search(line):
+        if not in_block:
+            continue
+
+        if kind == IMAGE_END.tag:
             # Flush block: if we found an IMAGE_RECT, emit it.
-            if block_rect_match is not None and current_page is not None:
-                m = block_rect_match
+            if block_rect is not None and current_page is not None:
+                x0, y0, x1, y1 = map(float, block_rect.split(","))
                 rects.append(ImageRect(
                     page_num=current_page,
-                    x0=float(m.group(1)),
-                    y0=float(m.group(2)),
-                    x1=float(m.group(3)),
-                    y1=float(m.group(4)),
+                    x0=x0, y0=y0, x1=x1, y1=y1,
                     caption=block_caption,
                 ))
-            elif block_rect_match is not None and current_page is None:
+            elif block_rect is not None and current_page is None:
                 _log.warning(
                     "IMAGE_RECT found but no preceding PAGE_BEGIN — skipping"
                 )
             in_block = False
-            continue
-
-        if in_block:
-            # Look for IMAGE_RECT marker.
-            rm = IMAGE_RECT.re_value.search(line)
-            if rm:
-                block_rect_match = rm
-            # Look for bold caption line.
-            cm = _BOLD_LINE_RE.match(line.strip())
-            if cm and not block_caption:
-                block_caption = cm.group(1)
+        elif kind == IMAGE_RECT.tag:
+            block_rect = value
+        elif not block_caption:
+            # Bold caption line — the first one in the block wins.
+            block_caption = value
 
     return rects
 
@@ -209,25 +236,12 @@ def parse_image_rects(markdown: str) -> list[ImageRect]:
 # ---------------------------------------------------------------------------
 
 
-def _clamp(v: float, lo: float = 0.0, hi: float = 1.0) -> float:
-    """Clamp *v* to [lo, hi]."""
-    return max(lo, min(hi, v))
-
-
 # Minimum image area as fraction of page area to be considered
 # "significant" (filters out tiny icons, bullets, decorations).
 _MIN_IMAGE_AREA_FRACTION = 0.02
 
-
-def _rects_overlap_area(a: pymupdf.Rect, b: pymupdf.Rect) -> float:
-    """Return the area of intersection between two rects (0 if no overlap)."""
-    ix0 = max(a.x0, b.x0)
-    iy0 = max(a.y0, b.y0)
-    ix1 = min(a.x1, b.x1)
-    iy1 = min(a.y1, b.y1)
-    if ix1 <= ix0 or iy1 <= iy0:
-        return 0.0
-    return (ix1 - ix0) * (iy1 - iy0)
+_RASTER_INDEX_MIN_PAIRS = 64
+"""Block × raster pair count above which matching switches to a sweep line."""
 
 
 def _index_page_rasters(page: pymupdf.Page) -> list[PageRaster]:
@@ -252,13 +266,15 @@ def _index_page_rasters(page: pymupdf.Page) -> list[PageRaster]:
         return []
 
     # get_images(full=True) returns tuples:
-    # (xref, smask, width, height, bpc, colorspace, ...)
+    # (xref, smask, width, height, bpc, colorspace, alt. colorspace,
+    #  name, filter, referencer)
     rasters: list[PageRaster] = []
     for img in images:
         xref = img[0]
         smask = img[1]
         img_width = img[2]
         img_height = img[3]
+        stream_filter = img[8]
 
         try:
             img_rects = page.get_image_rects(img)
@@ -275,6 +291,7 @@ def _index_page_rasters(page: pymupdf.Page) -> list[PageRaster]:
                     width=img_width,
                     height=img_height,
                     rect=r,
+                    stream_filter=stream_filter,
                 ))
 
     return rasters
@@ -300,30 +317,87 @@ def _match_rasters_to_blocks(
         ``{block_index: [overlapping PageRasters]}`` — empty list means
         no rasters overlap the block (pure vector / no rasters on page).
     """
+    # Unpack raster coordinates once so the per-clip scan compares plain
+    # floats instead of going through Rect attribute lookups for every
+    # (block, raster) pair; rects that only share an edge do not overlap.
+    # Degenerate rects can never have a positive overlap area, so they
+    # are dropped up front.
+    boxes = [
+        (r.rect.x0, r.rect.y0, r.rect.x1, r.rect.y1, i)
+        for i, r in enumerate(rasters)
+        if r.rect.x1 > r.rect.x0 and r.rect.y1 > r.rect.y0
+    ]
+
     result: dict[int, list[PageRaster]] = {
-        i: [] for i in range(len(clips))
+        bi: [] for bi in range(len(clips))
     }
-
-    for bi, clip in enumerate(clips):
-        for raster in rasters:
-            if _rects_overlap_area(clip, raster.rect) > 0:
-                result[bi].append(raster)
+    if not boxes:
+        return result
+
+    # Small pages: test every (block, raster) pair directly.
+    if len(boxes) * len(clips) <= _RASTER_INDEX_MIN_PAIRS:
+        for bi, clip in enumerate(clips):
+            cx0, cy0, cx1, cy1 = clip.x0, clip.y0, clip.x1, clip.y1
+            if cx1 <= cx0 or cy1 <= cy0:
+                continue
+            result[bi] = [
+                rasters[i] for rx0, ry0, rx1, ry1, i in boxes
+                if rx0 < cx1 and cx0 < rx1 and ry0 < cy1 and cy0 < ry1
+            ]
+        return result
+
+    # Dense pages: sweep left to right.  Clips are visited in x0 order;
+    # rasters enter the active list once they start left of the widest
+    # right edge seen so far and leave it for good once they end left of
+    # the current clip (later clips start no further left).  Each clip
+    # then only tests rasters whose x-span can still reach it.
+    boxes.sort()
+    order = sorted(range(len(clips)), key=lambda bi: clips[bi].x0)
+    active: list[tuple[float, float, float, float, int]] = []
+    nxt = 0
+    reach = float("-inf")
+    for bi in order:
+        clip = clips[bi]
+        cx0, cy0, cx1, cy1 = clip.x0, clip.y0, clip.x1, clip.y1
+        if cx1 <= cx0 or cy1 <= cy0:
+            continue
+        reach = max(reach, cx1)
+        while nxt < len(boxes) and boxes[nxt][0] < reach:
+            active.append(boxes[nxt])
+            nxt += 1
+        active = [b for b in active if b[2] > cx0]
+        hits = sorted(
+            i for rx0, ry0, rx1, ry1, i in active
+            if rx0 < cx1 and ry0 < cy1 and cy0 < ry1
+        )
+        result[bi] = [rasters[i] for i in hits]   # page order
 
     return result
 
 
-def _compute_padded_clip(
-    ir: ImageRect,
+def _compute_padded_clips(
+    blocks: list[ImageRect],
     page: pymupdf.Page,
-) -> pymupdf.Rect:
-    """Convert normalized ``ImageRect`` coords to a padded pymupdf Rect."""
-    pw = page.rect.width
-    ph = page.rect.height
-    x0 = _clamp(ir.x0 - _RECT_PADDING) * pw
-    y0 = _clamp(ir.y0 - _RECT_PADDING) * ph
-    x1 = _clamp(ir.x1 + _RECT_PADDING) * pw
-    y1 = _clamp(ir.y1 + _RECT_PADDING) * ph
-    return pymupdf.Rect(x0, y0, x1, y1)
+) -> list[pymupdf.Rect]:
+    """Convert normalized ``ImageRect`` coords to padded pymupdf Rects.
+
+    Handles all blocks of a page in one pass: the page size is read once
+    (``page.rect`` builds a new Rect on every access) and the padding and
+    clamping are applied inline.
+    """
+    page_rect = page.rect
+    pw = page_rect.width
+    ph = page_rect.height
+    pad = _RECT_PADDING
+    return [
+        pymupdf.Rect(
+            min(max(ir.x0 - pad, 0.0), 1.0) * pw,
+            min(max(ir.y0 - pad, 0.0), 1.0) * ph,
+            min(max(ir.x1 + pad, 0.0), 1.0) * pw,
+            min(max(ir.y1 + pad, 0.0), 1.0) * ph,
+        )
+        for ir in blocks
+    ]
 
 
 def _compute_render_dpi(override: int | None = None) -> int:
@@ -351,25 +425,152 @@ def _pixmap_to_png(pix: pymupdf.Pixmap) -> bytes:
     return pix.tobytes("png")
 
 
+_POINTS_PER_INCH = 72
+"""PDF user-space units per inch."""
+
+_FULL_PAGE_MIN_RENDERS = 3
+"""Region renders on one page before the page is rendered once and cropped."""
+
+_FULL_PAGE_MAX_PIXELS = 25_000_000
+"""Largest full-page pixmap (pixels) kept in memory for cropping.
+
+About 75 MB as RGB: an A4/Letter page up to roughly 400 DPI.
+"""
+
+
+def _full_page_pixmap(
+    page: pymupdf.Page,
+    dpi: int,
+    n_renders: int,
+) -> pymupdf.Pixmap | None:
+    """Render the whole page once when several regions will be cropped.
+
+    MuPDF re-runs the page's display list for every ``get_pixmap`` call;
+    with :data:`_FULL_PAGE_MIN_RENDERS` or more regions on a page it is
+    cheaper to rasterize the page once and copy the regions out of it.
+    Returns ``None`` (render regions individually) for few regions,
+    rotated pages, or when the page pixmap would exceed
+    :data:`_FULL_PAGE_MAX_PIXELS`.
+    """
+    if n_renders < _FULL_PAGE_MIN_RENDERS or page.rotation:
+        return None
+    scale = dpi / _POINTS_PER_INCH
+    page_rect = page.rect
+    n_pixels = page_rect.width * scale * page_rect.height * scale
+    if n_pixels > _FULL_PAGE_MAX_PIXELS:
+        return None
+    _log.debug("      full-page render for %d region(s)", n_renders)
+    return page.get_pixmap(dpi=dpi, colorspace=pymupdf.csRGB, alpha=False)
+
+
+_MAX_RENDER_SIDE_PX = 4096
+"""Longest side (pixels) of a page-region render.
+
+Regions that would come out larger at the requested DPI (a full Letter
+page at 600 DPI is 6600 px tall) are rendered at the highest DPI that
+fits instead.
+"""
+
+
+def _region_dpi(clip: pymupdf.Rect, dpi: int) -> int:
+    """Return *dpi*, lowered if needed to fit :data:`_MAX_RENDER_SIDE_PX`."""
+    long_side = max(clip.width, clip.height)
+    if long_side * dpi <= _MAX_RENDER_SIDE_PX * _POINTS_PER_INCH:
+        return dpi
+    return max(1, int(_MAX_RENDER_SIDE_PX * _POINTS_PER_INCH / long_side))
+
+
+def _region_pixmap(
+    page: pymupdf.Page,
+    clip: pymupdf.Rect,
+    dpi: int,
+    page_pix: pymupdf.Pixmap | None = None,
+) -> pymupdf.Pixmap:
+    """Return the pixmap of *clip* at *dpi*, cropped from *page_pix* if given.
+
+    The crop uses the same pixel grid as ``page.get_pixmap(clip=...)``
+    (the clip transformed by the DPI matrix, rounded outward).  The
+    result is always RGB without alpha — MuPDF converts while
+    rasterizing, so no CMYK pixmap needs a second conversion pass.
+
+    Regions too large for :data:`_MAX_RENDER_SIDE_PX` at *dpi* are
+    rendered directly at the lower :func:`_region_dpi`.
+    """
+    region_dpi = _region_dpi(clip, dpi)
+    if page_pix is not None and region_dpi == dpi:
+        scale = dpi / _POINTS_PER_INCH
+        irect = (clip * pymupdf.Matrix(scale, scale)).irect & page_pix.irect
+        if not irect.is_empty:
+            pix = pymupdf.Pixmap(page_pix.colorspace, irect, page_pix.alpha)
+            pix.copy(page_pix, irect)
+            pix.set_dpi(dpi, dpi)
+            return pix
+    return page.get_pixmap(
+        clip=clip, dpi=region_dpi, colorspace=pymupdf.csRGB, alpha=False,
+    )
+
+
 def _render_region(
     page: pymupdf.Page,
     clip: pymupdf.Rect,
     dpi: int,
+    page_pix: pymupdf.Pixmap | None = None,
+    ext: str = "png",
 ) -> tuple[bytes, str]:
-    """Render a page region to PNG at the given DPI.
+    """Render a page region to PNG (or JPEG) at the given DPI.
+
+    When *page_pix* (from :func:`_full_page_pixmap`) is given, the region
+    is cropped from it instead of rendered.
 
-    Handles CMYK→RGB conversion via :func:`_pixmap_to_png`.
+    Args:
+        ext: ``"png"`` or ``"jpeg"``, see :func:`_region_ext`.
 
     Returns:
-        ``(png_bytes, "png")``.
+        ``(image_bytes, ext)``.
+    """
+    pix = _region_pixmap(page, clip, dpi, page_pix)
+    return pix.tobytes(ext, jpg_quality=_JPEG_QUALITY), ext
+
+
+_PHOTO_FILTERS = frozenset({"DCTDecode", "JPXDecode"})
+"""Stream filters of lossy (photographic) embedded images."""
+
+_JPEG_QUALITY = 85
+"""JPEG quality for page regions rendered from photographic rasters."""
+
+
+def _region_ext(matched: list[PageRaster]) -> str:
+    """Return the file format for rendering a region covering *matched*.
+
+    A region snapped to a single opaque JPEG/JPEG 2000 raster is
+    photographic content: JPEG encodes it faster and much smaller than
+    PNG.  Everything else (vector art, composites, masked images) stays
+    PNG to keep edges sharp.
     """
-    pix = page.get_pixmap(clip=clip, dpi=dpi)
-    return _pixmap_to_png(pix), "png"
+    if (
+        len(matched) == 1
+        and matched[0].smask == 0
+        and matched[0].stream_filter in _PHOTO_FILTERS
+    ):
+        return "jpeg"
+    return "png"
+
+
+def _footprint_pixels(rect: pymupdf.Rect, dpi: int) -> int:
+    """Return the pixel count of *rect* rendered at *dpi*."""
+    scale = dpi / _POINTS_PER_INCH
+    return round(rect.width * scale) * round(rect.height * scale)
+
+
+_NativeCache = dict[tuple[int, int], tuple[bytes, str] | None]
+"""Native extraction results keyed by ``(xref, smask)``, one per document."""
 
 
 def _extract_native(
     doc: pymupdf.Document,
     raster: PageRaster,
+    cache: _NativeCache | None = None,
+    max_pixels: int | None = None,
 ) -> tuple[bytes, str] | None:
     """Try to extract a raster image natively from the PDF.
 
@@ -379,35 +580,83 @@ def _extract_native(
     are already compressed and optimal.
 
     When the image has a soft mask, compositing is attempted and the
-    result is returned as PNG.
+    result is returned as PNG.  The compositing path does not need the
+    encoded bytes, so ``doc.extract_image()`` is skipped for it.
 
     Falls back to ``None`` (caller should render the raster rect) when:
 
     - ``doc.extract_image()`` fails
     - Soft-mask compositing fails (transparency mask cannot be applied)
+    - The image has more than *max_pixels* pixels
+
+    Args:
+        doc: Open pymupdf Document.
+        raster: The raster to extract.
+        cache: Optional per-document memo.  The same xref is often
+            placed several times (logos, repeated headers); with a cache
+            it is decoded only once.
+        max_pixels: Optional size cap, checked against the raster's
+            native dimensions before anything is decoded.
 
     Returns:
         ``(image_bytes, extension)`` on success, or ``None``.
     """
-    img_data = doc.extract_image(raster.xref)
-    if img_data is None:
+    if max_pixels is not None and raster.width * raster.height > max_pixels:
+        _log.debug(
+            "      native %dx%d px exceeds %d px cap for xref %d",
+            raster.width, raster.height, max_pixels, raster.xref,
+        )
         return None
 
-    # Soft mask requires compositing via Pixmap → always PNG.
+    key = (raster.xref, raster.smask)
+    if cache is not None and key in cache:
+        return cache[key]
+
+    result: tuple[bytes, str] | None = None
     if raster.smask != 0:
+        # Soft mask requires compositing via Pixmap → always PNG.
         try:
             base_pix = pymupdf.Pixmap(doc, raster.xref)
-            mask_pix = pymupdf.Pixmap(doc, raster.smask)
-            combined = pymupdf.Pixmap(base_pix, mask_pix)
         except Exception:
-            _log.debug("      smask compositing failed for xref %d", raster.xref)
-            return None
-        return _pixmap_to_png(combined), "png"
+            _log.debug("      base pixmap failed for xref %d", raster.xref)
+        else:
+            try:
+                mask_pix = pymupdf.Pixmap(doc, raster.smask)
+                combined = pymupdf.Pixmap(base_pix, mask_pix)
+            except Exception:
+                _log.debug(
+                    "      smask compositing failed for xref %d (smask %d)",
+                    raster.xref, raster.smask,
+                )
+            else:
+                result = _pixmap_to_png(combined), "png"
+    else:
+        # Native extraction — return original bytes and format.
+        # No DPI cap beyond *max_pixels*: native bytes are already
+        # compressed (JPEG/PNG) and optimal.
+        img_data = doc.extract_image(raster.xref)
+        if img_data is not None:
+            result = img_data["image"], img_data["ext"]
+
+    if cache is not None:
+        cache[key] = result
+    return result
+
+
+_RENDER_KEY_DIGITS = 2
+"""Decimal places (in points) kept when deduplicating debug renders."""
 
-    # Native extraction — return original bytes and format.
-    # No DPI cap: native bytes are already compressed (JPEG/PNG) and
-    # optimal.  Capping would require re-rendering, losing quality.
-    return img_data["image"], img_data["ext"]
+
+_RenderKey = tuple[float, float, float, float]
+"""Rounded ``(x0, y0, x1, y1)`` of a render region, see :func:`_render_key`."""
+
+
+def _render_key(rect: pymupdf.Rect) -> _RenderKey:
+    """Return a dedupe key for rendering *rect* (rounded coordinates)."""
+    return (
+        round(rect.x0, _RENDER_KEY_DIGITS), round(rect.y0, _RENDER_KEY_DIGITS),
+        round(rect.x1, _RENDER_KEY_DIGITS), round(rect.y1, _RENDER_KEY_DIGITS),
+    )
 
 
 def _render_debug_variants(
@@ -417,6 +666,9 @@ def _render_debug_variants(
     ir: ImageRect,
     matched: list[PageRaster],
     dpi: int,
+    native_cache: _NativeCache | None = None,
+    page_pix: pymupdf.Pixmap | None = None,
+    cap_native: bool = False,
 ) -> list[tuple[str, bytes, str, str]]:
     """Produce all image variants for debug mode.
 
@@ -430,9 +682,11 @@ def _render_debug_variants(
         ir: Original ImageRect with normalized coordinates.
         matched: Rasters overlapping the clip.
         dpi: DPI for page-region renders.
+        native_cache: Per-document memo for :func:`_extract_native`.
+        page_pix: Optional full-page pixmap to crop regions from.
+        cap_native: Same native size cap as :func:`_plan_single_block`,
+            so the ``auto`` variant shows what ``AUTO`` mode writes.
     """
-    variants: list[tuple[str, bytes, str, str]] = []
-
     # Determine snap rect (raster placement or union or clip fallback).
     if len(matched) == 1:
         snap_rect = matched[0].rect
@@ -445,115 +699,149 @@ def _render_debug_variants(
     else:
         snap_rect = clip  # no rasters → snap falls back to clip
 
-    # --- auto variant: native extract or snap fallback ---
-    auto_info = ""
+    # --- auto variant source: native extract or a rect to render ---
+    native: tuple[bytes, str] | None = None
     if len(matched) == 1:
-        result = _extract_native(doc, matched[0])
-        if result is not None:
-            auto_bytes, auto_ext = result
+        max_pixels = (
+            _footprint_pixels(matched[0].rect, dpi) if cap_native else None
+        )
+        native = _extract_native(doc, matched[0], native_cache, max_pixels)
+        auto_rect = snap_rect
+    elif len(matched) > 1:
+        auto_rect = snap_rect
+    else:
+        auto_rect = clip
+
+    # Rasterize each distinct region once: snap == clip when no rasters
+    # match, and the auto fallback always reuses the snap rect.  The auto
+    # and snap renders use the AUTO/SNAP output format; bbox stays PNG
+    # like BBOX mode, which never matches rasters.
+    ext = _region_ext(matched)
+    wanted = [(snap_rect, ext), (clip, "png")]
+    if native is None:
+        wanted.insert(0, (auto_rect, ext))
+    renders: dict[tuple[str, float, float, float, float],
+                  tuple[bytes, str]] = {}
+    for rect, rect_ext in wanted:
+        key = (rect_ext, *_render_key(rect))
+        if key not in renders:
+            renders[key] = _render_region(page, rect, dpi, page_pix, rect_ext)
+
+    variants: list[tuple[str, bytes, str, str]] = []
+
+    if native is not None:
+        auto_bytes, auto_ext = native
+        auto_info = (
+            f"native {auto_ext} {matched[0].width}x{matched[0].height} px"
+        )
+    else:
+        auto_bytes, auto_ext = renders[(ext, *_render_key(auto_rect))]
+        if len(matched) == 1:
             auto_info = (
-                f"native {auto_ext} {matched[0].width}x{matched[0].height} px"
+                f"native fallback → snap rect "
+                f"({snap_rect.x0:.0f},{snap_rect.y0:.0f},"
+                f"{snap_rect.x1:.0f},{snap_rect.y1:.0f}) "
+                f"@ {_region_dpi(snap_rect, dpi)} DPI"
             )
-        else:
-            auto_bytes, auto_ext = _render_region(page, snap_rect, dpi)
+        elif len(matched) > 1:
             auto_info = (
-                f"native fallback → snap rect "
+                f"composite ({len(matched)} rasters) → union rect "
                 f"({snap_rect.x0:.0f},{snap_rect.y0:.0f},"
-                f"{snap_rect.x1:.0f},{snap_rect.y1:.0f}) @ {dpi} DPI"
+                f"{snap_rect.x1:.0f},{snap_rect.y1:.0f}) "
+                f"@ {_region_dpi(snap_rect, dpi)} DPI"
+            )
+        else:
+            auto_info = (
+                f"no rasters → bbox "
+                f"({clip.x0:.0f},{clip.y0:.0f},"
+                f"{clip.x1:.0f},{clip.y1:.0f}) @ {_region_dpi(clip, dpi)} DPI"
             )
-    elif len(matched) > 1:
-        auto_bytes, auto_ext = _render_region(page, snap_rect, dpi)
-        auto_info = (
-            f"composite ({len(matched)} rasters) → union rect "
-            f"({snap_rect.x0:.0f},{snap_rect.y0:.0f},"
-            f"{snap_rect.x1:.0f},{snap_rect.y1:.0f}) @ {dpi} DPI"
-        )
-    else:
-        auto_bytes, auto_ext = _render_region(page, clip, dpi)
-        auto_info = (
-            f"no rasters → bbox "
-            f"({clip.x0:.0f},{clip.y0:.0f},"
-            f"{clip.x1:.0f},{clip.y1:.0f}) @ {dpi} DPI"
-        )
     variants.append(("auto", auto_bytes, auto_ext, auto_info))
 
     # --- snap variant: render raster rect (or clip if no rasters) ---
-    snap_bytes, snap_ext = _render_region(page, snap_rect, dpi)
+    snap_bytes, snap_ext = renders[(ext, *_render_key(snap_rect))]
     snap_info = (
         f"snap rect ({snap_rect.x0:.0f},{snap_rect.y0:.0f},"
-        f"{snap_rect.x1:.0f},{snap_rect.y1:.0f}) @ {dpi} DPI"
+        f"{snap_rect.x1:.0f},{snap_rect.y1:.0f}) "
+        f"@ {_region_dpi(snap_rect, dpi)} DPI"
     )
     variants.append(("snap", snap_bytes, snap_ext, snap_info))
 
     # --- bbox variant: render Claude's raw padded bbox ---
-    bbox_bytes, bbox_ext = _render_region(page, clip, dpi)
+    bbox_bytes, bbox_ext = renders[("png", *_render_key(clip))]
     bbox_info = (
         f"bbox ({clip.x0:.0f},{clip.y0:.0f},"
         f"{clip.x1:.0f},{clip.y1:.0f}) "
         f"padded from ({ir.x0:.2f},{ir.y0:.2f},"
-        f"{ir.x1:.2f},{ir.y1:.2f}) @ {dpi} DPI"
+        f"{ir.x1:.2f},{ir.y1:.2f}) @ {_region_dpi(clip, dpi)} DPI"
     )
     variants.append(("bbox", bbox_bytes, bbox_ext, bbox_info))
 
     return variants
 
 
-def _render_single_block(
+def _plan_single_block(
     doc: pymupdf.Document,
-    page: pymupdf.Page,
     clip: pymupdf.Rect,
     matched_list: list[PageRaster],
     page_rasters: list[PageRaster],
     image_mode: ImageMode,
     dpi: int,
-) -> tuple[bytes, str]:
-    """Render or extract a single IMAGE block based on mode and raster matches.
+    native_cache: _NativeCache | None = None,
+    cap_native: bool = False,
+) -> tuple[bytes, str] | pymupdf.Rect:
+    """Decide how a single IMAGE block is produced.
 
-    Encapsulates the per-block rendering decision tree: BBOX renders the
-    AI bounding box directly; AUTO tries native extraction then falls back
+    Encapsulates the per-block decision tree: BBOX renders the AI
+    bounding box directly; AUTO tries native extraction then falls back
     to rendering; SNAP always renders snapped to raster bounds.
 
     Args:
         doc: Open pymupdf Document (needed for native extraction).
-        page: The PDF page being rendered.
         clip: Claude's padded bounding-box rect (absolute points).
         matched_list: Rasters overlapping the clip.
         page_rasters: All significant rasters on the page (for logging).
         image_mode: ``BBOX``, ``AUTO``, or ``SNAP``.
-        dpi: DPI for page-region renders.
+        dpi: DPI for page-region renders (for logging).
+        native_cache: Per-document memo for :func:`_extract_native`.
+        cap_native: Render instead of extracting when the native raster
+            has more pixels than its placement rect rendered at *dpi*.
+            Set only when the DPI was chosen explicitly (``--image-dpi``
+            given, i.e. ``render_dpi`` is not ``None``); with the default
+            DPI native rasters are always passed through.
 
     Returns:
-        ``(image_bytes, extension)`` tuple.
+        Native ``(image_bytes, extension)`` when the raster could be
+        extracted as-is, otherwise the page rect to render (in the format
+        chosen by :func:`_region_ext`).
     """
     # BBOX mode: render raw AI bounding box, skip matching.
     if image_mode is ImageMode.BBOX:
-        img_bytes, ext = _render_region(page, clip, dpi)
         _log.debug("      bbox → render at %d DPI", dpi)
-        return img_bytes, ext
+        return clip
 
     if len(matched_list) == 1:
         if image_mode is ImageMode.AUTO:
-            result = _extract_native(doc, matched_list[0])
+            raster = matched_list[0]
+            max_pixels = (
+                _footprint_pixels(raster.rect, dpi) if cap_native else None
+            )
+            result = _extract_native(doc, raster, native_cache, max_pixels)
             if result is not None:
                 _log.debug(
                     "      native extract: xref=%d, format=%s, "
                     "%dx%d px",
-                    matched_list[0].xref, result[1],
-                    matched_list[0].width, matched_list[0].height,
+                    raster.xref, result[1], raster.width, raster.height,
                 )
                 return result
-            snap = matched_list[0].rect
-            img_bytes, ext = _render_region(page, snap, dpi)
             _log.debug(
                 "      native fallback → render raster rect at %d DPI", dpi,
             )
-            return img_bytes, ext
+            return raster.rect
 
         # SNAP mode.
-        snap = matched_list[0].rect
-        img_bytes, ext = _render_region(page, snap, dpi)
         _log.debug("      snap raster rect at %d DPI", dpi)
-        return img_bytes, ext
+        return matched_list[0].rect
 
     if len(matched_list) > 1:
         union = pymupdf.Rect(matched_list[0].rect)
@@ -561,18 +849,270 @@ def _render_single_block(
             union |= r.rect
         if union.is_empty or union.is_infinite:
             union = clip
-        img_bytes, ext = _render_region(page, union, dpi)
         _log.debug(
             "      composite (%d rasters) → render union at %d DPI",
             len(matched_list), dpi,
         )
-        return img_bytes, ext
+        return union
 
     # No rasters matched (or none on page) — render the AI bbox.
-    img_bytes, ext = _render_region(page, clip, dpi)
     reason = "no rasters on page" if not page_rasters else "unmatched"
     _log.debug("      %s → render bbox at %d DPI", reason, dpi)
-    return img_bytes, ext
+    return clip
+
+
+def _group_rects_by_page(
+    rects: list[ImageRect],
+) -> dict[int, list[ImageRect]]:
+    """Group *rects* by 1-indexed page number, preserving document order."""
+    page_groups: dict[int, list[ImageRect]] = {}
+    for ir in rects:
+        page_groups.setdefault(ir.page_num, []).append(ir)
+    return page_groups
+
+
+_PAGE_CACHE_SIZE = 8
+"""Pages kept by a caller-owned page cache (least recently used evicted)."""
+
+_RasterCache = dict[int, list[PageRaster]]
+"""Significant rasters per 0-based page index, see :func:`_page_rasters`."""
+
+
+def _load_page(
+    doc: pymupdf.Document,
+    page_idx: int,
+    page_cache: dict[int, pymupdf.Page] | None = None,
+) -> pymupdf.Page:
+    """Return ``doc[page_idx]``, reusing a loaded page from *page_cache*.
+
+    ``doc[i]`` parses the page anew on every call.  The cache is a plain
+    dict owned by the caller together with *doc* (so entries can never
+    outlive the document) and is kept in LRU order, bounded to
+    :data:`_PAGE_CACHE_SIZE` pages.
+    """
+    if page_cache is None:
+        return doc[page_idx]
+    page = page_cache.pop(page_idx, None)
+    if page is None:
+        page = doc[page_idx]
+    page_cache[page_idx] = page     # most recently used goes last
+    if len(page_cache) > _PAGE_CACHE_SIZE:
+        del page_cache[next(iter(page_cache))]
+    return page
+
+
+def _page_rasters(
+    page: pymupdf.Page,
+    raster_cache: _RasterCache | None = None,
+) -> list[PageRaster]:
+    """Return :func:`_index_page_rasters` for *page*, memoized per page.
+
+    ``get_image_rects()`` walks the page content stream for every image,
+    so the index is worth keeping when the same document is processed
+    more than once.  The cache is owned by the caller and must only be
+    shared between opens of the same PDF file.
+    """
+    if raster_cache is None:
+        return _index_page_rasters(page)
+    rasters = raster_cache.get(page.number)
+    if rasters is None:
+        rasters = raster_cache[page.number] = _index_page_rasters(page)
+    return rasters
+
+
+def _match_page_blocks(
+    doc: pymupdf.Document,
+    page_num: int,
+    blocks: list[ImageRect],
+    image_mode: ImageMode,
+    page_cache: dict[int, pymupdf.Page] | None = None,
+    raster_cache: _RasterCache | None = None,
+) -> tuple[
+    pymupdf.Page, list[pymupdf.Rect], list[PageRaster],
+    dict[int, list[PageRaster]],
+] | None:
+    """Load one page and match its rasters to the IMAGE blocks.
+
+    Returns ``(page, clips, page_rasters, matches)``, or ``None`` when
+    *page_num* is outside the document.
+    """
+    page_idx = page_num - 1
+    if page_idx < 0 or page_idx >= len(doc):
+        _log.warning(
+            "IMAGE_RECT references page %d but PDF has %d pages — skipping",
+            page_num, len(doc),
+        )
+        return None
+
+    page = _load_page(doc, page_idx, page_cache)
+    clips = _compute_padded_clips(blocks, page)
+
+    # In BBOX mode, skip raster indexing/matching entirely.
+    if image_mode is not ImageMode.BBOX:
+        page_rasters = _page_rasters(page, raster_cache)
+        if page_rasters:
+            matches = _match_rasters_to_blocks(page_rasters, clips)
+        else:
+            # No rasters on the page: every block goes straight to a
+            # region render of its own clip.
+            matches = {i: [] for i in range(len(clips))}
+        _log.debug(
+            "    page %d: %d raster(s), %d block(s)",
+            page_num, len(page_rasters), len(blocks),
+        )
+    else:
+        page_rasters = []
+        matches = {i: [] for i in range(len(clips))}
+        _log.debug(
+            "    page %d: %d block(s) [bbox mode]",
+            page_num, len(blocks),
+        )
+    return page, clips, page_rasters, matches
+
+
+def _valid_block_indices(
+    clips: list[pymupdf.Rect],
+    page_num: int,
+) -> list[int]:
+    """Return indices of usable clips, warning about the invalid ones."""
+    valid: list[int] = []
+    for i, clip in enumerate(clips):
+        if clip.is_empty or clip.is_infinite:
+            _log.warning(
+                "IMAGE_RECT on page %d produced invalid clip rect — skipping",
+                page_num,
+            )
+            continue
+        valid.append(i)
+    return valid
+
+
+def _plan_page_blocks(
+    doc: pymupdf.Document,
+    page_num: int,
+    blocks: list[ImageRect],
+    image_mode: ImageMode,
+    render_dpi: int | None,
+    native_cache: _NativeCache | None = None,
+    page_cache: dict[int, pymupdf.Page] | None = None,
+    raster_cache: _RasterCache | None = None,
+) -> Iterator[tuple[str, bytes]]:
+    """Yield ``(filename, image_bytes)`` for every IMAGE block on one page.
+
+    The single-image modes (``AUTO``, ``SNAP``, ``BBOX``) share this
+    planner whether the images are kept in memory
+    (:func:`_render_page_blocks`) or written as they come
+    (:func:`_save_page_blocks`).  Native rasters pass through as-is;
+    page regions are rendered in the format from :func:`_region_ext`.
+    Image indices restart at 1 on every page, so pages can be processed
+    independently and in any order.
+    """
+    matched_page = _match_page_blocks(
+        doc, page_num, blocks, image_mode, page_cache, raster_cache,
+    )
+    if matched_page is None:
+        return
+    page, clips, page_rasters, matches = matched_page
+
+    dpi = _compute_render_dpi(render_dpi)
+    valid = _valid_block_indices(clips, page_num)
+    plans = [
+        _plan_single_block(
+            doc, clips[i], matches[i], page_rasters, image_mode, dpi,
+            native_cache, cap_native=render_dpi is not None,
+        )
+        for i in valid
+    ]
+    page_pix = _full_page_pixmap(
+        page, dpi, sum(not isinstance(plan, tuple) for plan in plans),
+    )
+    # Blocks that resolve to the same region (a figure marked twice) are
+    # rendered once; each still gets its own filename.
+    renders: dict[tuple[str, float, float, float, float],
+                  tuple[bytes, str]] = {}
+    for img_idx, (i, plan) in enumerate(zip(valid, plans)):
+        if isinstance(plan, tuple):
+            img_bytes, ext = plan
+        else:
+            ext = _region_ext(matches[i])
+            key = (ext, *_render_key(plan))
+            if key in renders:
+                _log.debug("      duplicate region → reusing render")
+            else:
+                renders[key] = _render_region(page, plan, dpi, page_pix, ext)
+            img_bytes, ext = renders[key]
+
+        filename = IMAGE_FILENAME_FORMAT.format(
+            page=page_num, idx=img_idx + 1, ext=ext,
+        )
+        yield filename, img_bytes
+
+
+def _render_page_blocks(
+    doc: pymupdf.Document,
+    page_num: int,
+    blocks: list[ImageRect],
+    image_mode: ImageMode,
+    render_dpi: int | None,
+    native_cache: _NativeCache | None = None,
+    page_cache: dict[int, pymupdf.Page] | None = None,
+    raster_cache: _RasterCache | None = None,
+) -> list[RenderedImage]:
+    """Extract or render every IMAGE block on one page.
+
+    Indexes the page rasters, matches them to the blocks and produces one
+    :class:`RenderedImage` per block (three in ``DEBUG`` mode).  Image
+    indices restart at 0 on every page, so pages can be processed
+    independently and in any order.
+    """
+    if image_mode is not ImageMode.DEBUG:
+        return [
+            RenderedImage(
+                page_num=page_num,
+                index=img_idx,
+                image_bytes=img_bytes,
+                filename=filename,
+            )
+            for img_idx, (filename, img_bytes) in enumerate(_plan_page_blocks(
+                doc, page_num, blocks, image_mode, render_dpi,
+                native_cache, page_cache, raster_cache,
+            ))
+        ]
+
+    # --- DEBUG mode: produce all 3 variants per block ------------
+    matched_page = _match_page_blocks(
+        doc, page_num, blocks, image_mode, page_cache, raster_cache,
+    )
+    if matched_page is None:
+        return []
+    page, clips, _, matches = matched_page
+
+    dpi = _compute_render_dpi(render_dpi)
+    valid = _valid_block_indices(clips, page_num)
+    rendered: list[RenderedImage] = []
+    page_pix = _full_page_pixmap(
+        page, dpi, len(valid) * len(_DEBUG_VARIANT_NAMES),
+    )
+    for img_idx, i in enumerate(valid):
+        base_idx = img_idx + 1      # 1-based index for filenames
+        _log.debug("      debug mode: generating all variants")
+        variants = _render_debug_variants(
+            doc, page, clips[i], blocks[i], matches[i], dpi,
+            native_cache, page_pix, cap_native=render_dpi is not None,
+        )
+        for variant_name, img_bytes, ext, info in variants:
+            fname = IMAGE_FILENAME_FORMAT.format(
+                page=page_num, idx=base_idx,
+                ext=f"{variant_name}.{ext}",
+            )
+            rendered.append(RenderedImage(
+                page_num=page_num,
+                index=img_idx,
+                image_bytes=img_bytes,
+                filename=fname,
+                info=info,
+            ))
+    return rendered
 
 
 def render_image_rects(
@@ -580,6 +1120,8 @@ def render_image_rects(
     rects: list[ImageRect],
     image_mode: ImageMode = ImageMode.AUTO,
     render_dpi: int | None = None,
+    page_cache: dict[int, pymupdf.Page] | None = None,
+    raster_cache: _RasterCache | None = None,
 ) -> list[RenderedImage]:
     """Extract or render image regions from a PDF, page by page.
 
@@ -601,7 +1143,14 @@ def render_image_rects(
         rects: Parsed bounding boxes from ``IMAGE_RECT`` markers.
         image_mode: Extraction strategy (default ``AUTO``).
         render_dpi: Explicit DPI override for page-region renders.
-            When ``None``, uses the module-level ``_RENDER_DPI``.
+            When ``None``, uses the module-level ``_RENDER_DPI``; an
+            explicit value also caps native rasters at that resolution.
+        page_cache: Optional dict, owned by the caller alongside *doc*,
+            that keeps recently loaded pages across calls (useful when
+            rects are rendered in several batches).
+        raster_cache: Optional dict that keeps each page's raster index
+            across calls.  Unlike *page_cache* it may outlive *doc*, but
+            only for reopened copies of the same PDF file.
 
     Returns:
         List of :class:`RenderedImage` with image data and filenames.
@@ -610,94 +1159,123 @@ def render_image_rects(
         return []
 
     rendered: list[RenderedImage] = []
+    native_cache: _NativeCache = {}
+    page_groups = _group_rects_by_page(rects)
+    for page_num in sorted(page_groups):
+        rendered.extend(_render_page_blocks(
+            doc, page_num, page_groups[page_num], image_mode, render_dpi,
+            native_cache, page_cache, raster_cache,
+        ))
+    return rendered
 
-    # Group rects by page number.
-    page_groups: dict[int, list[tuple[int, ImageRect]]] = {}
-    for idx, ir in enumerate(rects):
-        page_groups.setdefault(ir.page_num, []).append((idx, ir))
 
-    page_counters: dict[int, int] = {}
+_worker_doc: pymupdf.Document | None = None
+"""The PDF opened by :func:`_init_worker` in a pool worker process.
 
-    for page_num in sorted(page_groups):
-        blocks = page_groups[page_num]
-        page_idx = page_num - 1
-        if page_idx < 0 or page_idx >= len(doc):
-            _log.warning(
-                "IMAGE_RECT references page %d but PDF has %d pages — skipping",
-                page_num, len(doc),
-            )
-            continue
+Only ever set in a spawned worker (see :func:`_render_pool`); the parent
+process never assigns it, so there is no document state to inherit."""
 
-        page = doc[page_idx]
-        clips = [_compute_padded_clip(ir, page) for _, ir in blocks]
+_worker_native_cache: _NativeCache = {}
+"""Per-worker :func:`_extract_native` memo, shared by its page tasks."""
 
-        # In BBOX mode, skip raster indexing/matching entirely.
-        if image_mode is not ImageMode.BBOX:
-            page_rasters = _index_page_rasters(page)
-            matches = _match_rasters_to_blocks(page_rasters, clips)
-            _log.debug(
-                "    page %d: %d raster(s), %d block(s)",
-                page_num, len(page_rasters), len(blocks),
-            )
-        else:
-            page_rasters = []
-            matches = {i: [] for i in range(len(clips))}
-            _log.debug(
-                "    page %d: %d block(s) [bbox mode]",
-                page_num, len(blocks),
-            )
 
-        for i, (idx, ir) in enumerate(blocks):
-            clip = clips[i]
-            if clip.is_empty or clip.is_infinite:
-                _log.warning(
-                    "IMAGE_RECT on page %d produced invalid clip rect — skipping",
-                    page_num,
-                )
-                continue
+def _init_worker(pdf_path: Path) -> None:
+    """Pool initializer: open *pdf_path* once per worker process.
 
-            dpi = _compute_render_dpi(render_dpi)
-            matched_list = matches[i]
-            img_idx = page_counters.get(page_num, 0)
-            base_idx = img_idx + 1          # 1-based index for filenames
-            page_counters[page_num] = base_idx
-
-            # --- DEBUG mode: produce all 3 variants per block --------
-            if image_mode is ImageMode.DEBUG:
-                _log.debug("      debug mode: generating all variants")
-                variants = _render_debug_variants(
-                    doc, page, clip, ir, matched_list, dpi,
-                )
-                for variant_name, img_bytes, ext, info in variants:
-                    fname = IMAGE_FILENAME_FORMAT.format(
-                        page=page_num, idx=base_idx,
-                        ext=f"{variant_name}.{ext}",
-                    )
-                    rendered.append(RenderedImage(
-                        page_num=page_num,
-                        index=img_idx,
-                        image_bytes=img_bytes,
-                        filename=fname,
-                        info=info,
-                    ))
-                continue
+    Runs in a worker started by :func:`_render_pool` with the
+    ``spawn`` method (:data:`_POOL_START_METHOD`), i.e. a fresh
+    interpreter holding no MuPDF state copied from the parent — a forked
+    worker could inherit a snapshot taken while a ``-j`` thread was
+    inside a MuPDF call.  MuPDF documents cannot be shared across
+    processes, but each worker handles many pages; opening the PDF per
+    task would parse its xref table again for every page.  The document
+    lives until the worker exits.
+    """
+    global _worker_doc
+    _worker_doc = pymupdf.open(str(pdf_path))
 
-            # --- Normal modes: single image per block ----------------
-            img_bytes, ext = _render_single_block(
-                doc, page, clip, matched_list, page_rasters,
-                image_mode, dpi,
-            )
 
-            filename = IMAGE_FILENAME_FORMAT.format(
-                page=page_num, idx=base_idx, ext=ext,
-            )
-            rendered.append(RenderedImage(
-                page_num=page_num,
-                index=img_idx,
-                image_bytes=img_bytes,
-                filename=filename,
-            ))
+def _render_page(
+    page_num: int,
+    blocks: list[ImageRect],
+    image_mode: ImageMode,
+    render_dpi: int | None,
+) -> list[RenderedImage]:
+    """Worker entry point for :func:`render_image_rects_parallel`."""
+    assert _worker_doc is not None, "worker not initialized"
+    return _render_page_blocks(
+        _worker_doc, page_num, blocks, image_mode, render_dpi,
+        _worker_native_cache,
+    )
+
+
+def _get_max_workers() -> int:
+    """Return the worker count for parallel page rendering.
+
+    Documents converted in parallel (``-j``) run in worker threads and
+    already keep the cores busy; a process pool per document there would
+    start ``jobs × cpu_count`` processes, so pages are rendered in-process
+    (one worker) off the main thread.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return 1
+    return max(1, os.cpu_count() or 1)
+
+
+def _render_pool(pdf_path: Path, workers: int) -> ProcessPoolExecutor:
+    """Return a pool of *workers* spawned processes that each open *pdf_path*.
+
+    See :data:`_POOL_START_METHOD` and :func:`_init_worker`.
+    """
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context(_POOL_START_METHOD),
+        initializer=_init_worker,
+        initargs=(pdf_path,),
+    )
+
+
+def render_image_rects_parallel(
+    pdf_path: Path,
+    rects: list[ImageRect],
+    image_mode: ImageMode = ImageMode.AUTO,
+    render_dpi: int | None = None,
+    max_workers: int | None = None,
+) -> list[RenderedImage]:
+    """Process-parallel variant of :func:`render_image_rects`.
+
+    Each page with IMAGE blocks is rendered in a worker process; every
+    worker opens *pdf_path* once (see :func:`_init_worker`).  Results are
+    collected in page order, so the output is identical to
+    :func:`render_image_rects`.
 
+    Args:
+        pdf_path: Path to the source PDF.
+        rects: Parsed bounding boxes from ``IMAGE_RECT`` markers.
+        image_mode: Extraction strategy (default ``AUTO``).
+        render_dpi: Explicit DPI override for page-region renders.
+        max_workers: Worker process count.  When ``None``, uses
+            :func:`_get_max_workers`.
+
+    Returns:
+        List of :class:`RenderedImage` with image data and filenames.
+    """
+    if not rects:
+        return []
+
+    page_groups = _group_rects_by_page(rects)
+    workers = min(max_workers or _get_max_workers(), len(page_groups))
+    with _render_pool(pdf_path, workers) as executor:
+        futures = {
+            page_num: executor.submit(
+                _render_page, page_num, blocks,
+                image_mode, render_dpi,
+            )
+            for page_num, blocks in page_groups.items()
+        }
+        rendered: list[RenderedImage] = []
+        for page_num in sorted(futures):
+            rendered.extend(futures[page_num].result())
     return rendered
 
 
@@ -706,6 +1284,87 @@ def render_image_rects(
 # ---------------------------------------------------------------------------
 
 
+_MAX_WRITE_WORKERS = 32
+"""Upper bound on threads used by :func:`save_images` for file writes."""
+
+_IMAGE_FILENAME_PREFIX = IMAGE_FILENAME_FORMAT.partition("{")[0]
+"""Literal prefix of every extracted-image filename (``img_p``)."""
+
+
+def _prepare_output_dir(output_dir: Path) -> None:
+    """Create *output_dir* and remove image files from previous runs.
+
+    Only deletes files whose names match ``IMAGE_FILENAME_RE`` (e.g.
+    ``img_p003_01.png``) to avoid accidentally removing unrelated files
+    if *output_dir* is mispointed.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    # scandir reports the file type from the directory listing, and the
+    # literal prefix check keeps the regex off unrelated files.
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            if (
+                entry.name.startswith(_IMAGE_FILENAME_PREFIX)
+                and IMAGE_FILENAME_RE.match(entry.name)
+                and entry.is_file()
+            ):
+                os.unlink(entry.path)
+
+
+_WRITE_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+)
+"""``os.open`` flags for :func:`_write_file` (binary mode on Windows)."""
+
+
+def _write_file(path: Path, data: bytes) -> None:
+    """Write *data* to *path* through a raw file descriptor.
+
+    Same result as ``path.write_bytes(data)`` without setting up a
+    buffered file object for what is always a single write.
+    """
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _link(src: Path, dst: Path) -> bool:
+    """Hard-link *dst* to *src*; return ``False`` if that is not possible.
+
+    Hard links are unavailable across filesystems and on some platforms.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        return False
+    return True
+
+
+def _link_or_write(src: Path, dst: Path, data: bytes) -> None:
+    """Hard-link *dst* to *src* (same content), or write *data* to *dst*.
+
+    Falls back to a plain write where hard links are unavailable (other
+    filesystem, unsupported platform).
+    """
+    if not _link(src, dst):
+        _write_file(dst, data)
+
+
+def _relink(src: Path, dst: Path) -> None:
+    """Replace *dst*, a copy of *src*, with a hard link to *src*.
+
+    The link is made under a temporary name and renamed over *dst*, so
+    *dst* never goes missing; it is kept as written if linking fails.
+    """
+    tmp = dst.with_name(f".{dst.name}.link")
+    if _link(src, tmp):
+        os.replace(tmp, dst)
+
+
 def save_images(
     rendered: list[RenderedImage],
     output_dir: Path,
@@ -727,19 +1386,41 @@ def save_images(
     if not rendered:
         return {}
 
-    output_dir.mkdir(parents=True, exist_ok=True)
+    _prepare_output_dir(output_dir)
+
+    # Identical images (a logo placed on every page) are written once;
+    # later copies become hard links to the first file.
+    first_by_digest: dict[bytes, str] = {}
+    unique: list[RenderedImage] = []
+    duplicates: list[tuple[str, RenderedImage]] = []
+    for ri in rendered:
+        digest = hashlib.sha256(ri.image_bytes).digest()
+        first = first_by_digest.setdefault(digest, ri.filename)
+        if first == ri.filename:
+            unique.append(ri)
+        else:
+            duplicates.append((first, ri))
+
+    def write(ri: RenderedImage) -> None:
+        _write_file(output_dir / ri.filename, ri.image_bytes)
+
+    # File writes release the GIL, so a small thread pool overlaps the
+    # open/write/close round-trips (noticeable on network filesystems).
+    workers = min(_MAX_WRITE_WORKERS, len(unique))
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for _ in executor.map(write, unique):
+                pass
+    else:
+        write(unique[0])
 
-    # Remove image files from previous runs.  Only deletes files whose
-    # names match IMAGE_FILENAME_RE (e.g. img_p003_01.png) to avoid
-    # accidentally removing unrelated files if output_dir is mispointed.
-    for old in output_dir.iterdir():
-        if old.is_file() and IMAGE_FILENAME_RE.match(old.name):
-            old.unlink()
+    for first, ri in duplicates:
+        _link_or_write(
+            output_dir / first, output_dir / ri.filename, ri.image_bytes,
+        )
 
     page_filenames: dict[int, list[str]] = {}
     for ri in rendered:
-        path = output_dir / ri.filename
-        path.write_bytes(ri.image_bytes)
         page_filenames.setdefault(ri.page_num, []).append(ri.filename)
 
     total = sum(len(v) for v in page_filenames.values())
@@ -747,6 +1428,193 @@ def save_images(
     return page_filenames
 
 
+def _save_page_blocks(
+    doc: pymupdf.Document,
+    page_num: int,
+    blocks: list[ImageRect],
+    image_mode: ImageMode,
+    render_dpi: int | None,
+    output_dir: Path,
+    native_cache: _NativeCache | None = None,
+    first_by_digest: dict[bytes, str] | None = None,
+    page_cache: dict[int, pymupdf.Page] | None = None,
+    raster_cache: _RasterCache | None = None,
+) -> list[tuple[str, bytes]]:
+    """Extract or render every IMAGE block on one page straight to disk.
+
+    Writes each image from :func:`_plan_page_blocks` as soon as it is
+    produced.  Same dedupe rule as :func:`save_images`: an image whose
+    SHA-256 is already in *first_by_digest* (shared across pages) is
+    hard-linked to the first file instead of written again.
+
+    Returns:
+        ``(filename, digest)`` for each image written for the page, in
+        block order.
+    """
+    if first_by_digest is None:
+        first_by_digest = {}
+    saved: list[tuple[str, bytes]] = []
+    for filename, img_bytes in _plan_page_blocks(
+        doc, page_num, blocks, image_mode, render_dpi,
+        native_cache, page_cache, raster_cache,
+    ):
+        digest = hashlib.sha256(img_bytes).digest()
+        first = first_by_digest.setdefault(digest, filename)
+        if first == filename:
+            _write_file(output_dir / filename, img_bytes)
+        else:
+            _link_or_write(
+                output_dir / first, output_dir / filename, img_bytes,
+            )
+        saved.append((filename, digest))
+    return saved
+
+
+def render_and_save(
+    doc: pymupdf.Document,
+    rects: list[ImageRect],
+    output_dir: Path,
+    image_mode: ImageMode = ImageMode.AUTO,
+    render_dpi: int | None = None,
+    page_cache: dict[int, pymupdf.Page] | None = None,
+    raster_cache: _RasterCache | None = None,
+) -> dict[int, list[str]]:
+    """Extract or render image regions and write them to *output_dir*.
+
+    Equivalent to :func:`render_image_rects` followed by
+    :func:`save_images`, but each image is written as soon as it is
+    produced instead of holding every encoded image in memory first.
+    ``DEBUG`` mode is not supported — its per-variant info strings need
+    the :class:`RenderedImage` list.
+
+    Args:
+        doc: An open pymupdf Document.
+        rects: Parsed bounding boxes from ``IMAGE_RECT`` markers.
+        output_dir: Directory to save image files into.
+        image_mode: ``AUTO``, ``SNAP`` or ``BBOX``.
+        render_dpi: Explicit DPI override for page-region renders.
+        page_cache: Optional caller-owned page cache, see
+            :func:`render_image_rects`.
+        raster_cache: Optional caller-owned raster index cache, see
+            :func:`render_image_rects`.
+
+    Returns:
+        Mapping of 1-indexed page number to list of filenames saved
+        for that page.
+    """
+    if image_mode is ImageMode.DEBUG:
+        raise ValueError(
+            "render_and_save() does not support debug mode — "
+            "use render_image_rects() and save_images()"
+        )
+    if not rects:
+        return {}
+
+    _prepare_output_dir(output_dir)
+
+    page_filenames: dict[int, list[str]] = {}
+    native_cache: _NativeCache = {}
+    first_by_digest: dict[bytes, str] = {}
+    page_groups = _group_rects_by_page(rects)
+    for page_num in sorted(page_groups):
+        saved = _save_page_blocks(
+            doc, page_num, page_groups[page_num],
+            image_mode, render_dpi, output_dir, native_cache, first_by_digest,
+            page_cache, raster_cache,
+        )
+        if saved:
+            page_filenames[page_num] = [filename for filename, _ in saved]
+
+    if page_filenames:
+        total = sum(len(v) for v in page_filenames.values())
+        _log.info("  Saved %d image(s) to %s", total, output_dir)
+    return page_filenames
+
+
+def _save_page(
+    page_num: int,
+    blocks: list[ImageRect],
+    image_mode: ImageMode,
+    render_dpi: int | None,
+    output_dir: Path,
+) -> list[tuple[str, bytes]]:
+    """Worker entry point for :func:`render_and_save_parallel`."""
+    assert _worker_doc is not None, "worker not initialized"
+    return _save_page_blocks(
+        _worker_doc, page_num, blocks, image_mode, render_dpi, output_dir,
+        _worker_native_cache,
+    )
+
+
+def render_and_save_parallel(
+    pdf_path: Path,
+    rects: list[ImageRect],
+    output_dir: Path,
+    image_mode: ImageMode = ImageMode.AUTO,
+    render_dpi: int | None = None,
+    max_workers: int | None = None,
+) -> dict[int, list[str]]:
+    """Process-parallel variant of :func:`render_and_save`.
+
+    Each worker renders one page and writes its images directly, so only
+    filenames and SHA-256 digests travel back to the parent process.
+    The parent then hard-links images repeated across pages, so the
+    output directory matches :func:`render_and_save` exactly.
+
+    PyMuPDF keeps global MuPDF state and is not thread-safe, so page
+    work is spread over processes rather than threads (the same
+    spawned pool as :func:`render_image_rects_parallel`).
+
+    Args:
+        pdf_path: Path to the source PDF.
+        rects: Parsed bounding boxes from ``IMAGE_RECT`` markers.
+        output_dir: Directory to save image files into.
+        image_mode: ``AUTO``, ``SNAP`` or ``BBOX``.
+        render_dpi: Explicit DPI override for page-region renders.
+        max_workers: Worker process count.  When ``None``, uses
+            :func:`_get_max_workers`.
+
+    Returns:
+        Mapping of 1-indexed page number to list of filenames saved
+        for that page.
+    """
+    if image_mode is ImageMode.DEBUG:
+        raise ValueError(
+            "render_and_save_parallel() does not support debug mode — "
+            "use render_image_rects_parallel() and save_images()"
+        )
+    if not rects:
+        return {}
+
+    _prepare_output_dir(output_dir)
+
+    page_groups = _group_rects_by_page(rects)
+    workers = min(max_workers or _get_max_workers(), len(page_groups))
+    page_filenames: dict[int, list[str]] = {}
+    first_by_digest: dict[bytes, str] = {}
+    with _render_pool(pdf_path, workers) as executor:
+        futures = {
+            page_num: executor.submit(
+                _save_page, page_num, blocks,
+                image_mode, render_dpi, output_dir,
+            )
+            for page_num, blocks in page_groups.items()
+        }
+        for page_num in sorted(futures):
+            saved = futures[page_num].result()
+            for filename, digest in saved:
+                first = first_by_digest.setdefault(digest, filename)
+                if first != filename:
+                    _relink(output_dir / first, output_dir / filename)
+            if saved:
+                page_filenames[page_num] = [filename for filename, _ in saved]
+
+    if page_filenames:
+        total = sum(len(v) for v in page_filenames.values())
+        _log.info("  Saved %d image(s) to %s", total, output_dir)
+    return page_filenames
+
+
 # ---------------------------------------------------------------------------
 # Injection
 # ---------------------------------------------------------------------------
@@ -782,11 +1650,15 @@ def inject_image_refs(
     Returns:
         Updated markdown with image references injected.
     """
-    if not image_map:
+    if not image_map or IMAGE_BEGIN.tag not in markdown:
         return markdown
 
-    lines = markdown.split("\n")
-    result: list[str] = []
+    # Text outside IMAGE blocks is copied through verbatim by slicing
+    # between marker events; only the blocks themselves are split into
+    # lines for _process_image_block.
+    out = io.StringIO()
+    written = 0          # markdown[:written] has been emitted
+    block_start = -1     # start of the open IMAGE block's first line
 
     # Track current page from PAGE_BEGIN markers.
     current_page: int | None = None
@@ -794,47 +1666,43 @@ def inject_image_refs(
     # Track how many images we've consumed per page.
     page_consumed: dict[int, int] = {}
 
-    # Buffer for lines inside an IMAGE block — we collect the whole block
-    # before deciding whether to inject, so that the idempotency check
-    # can see existing refs even if they appear after the caption.
-    block_buffer: list[str] | None = None
-
-    for line in lines:
+    for marker, value, m in iter_markers(markdown, IMAGE_BLOCK_EVENTS_RE):
         # Track page number.
-        page_match = PAGE_BEGIN.re_value.search(line)
-        if page_match:
-            current_page = int(page_match.group(1))
-
-        # Detect IMAGE_BEGIN — start buffering.
-        if IMAGE_BEGIN.re.search(line):
-            block_buffer = [line]
+        if marker is PAGE_BEGIN:
+            assert value is not None
+            current_page = int(value)
             continue
 
-        # Detect IMAGE_END — flush the buffered block.
-        if block_buffer is not None and IMAGE_END.re.search(line):
-            block_buffer.append(line)
-            result.extend(
-                _process_image_block(
-                    block_buffer, current_page, image_map,
-                    page_consumed, rel_prefix,
-                    image_mode=image_mode, info_map=info_map,
-                )
-            )
-            block_buffer = None
+        # Detect IMAGE_BEGIN — the block starts at the beginning of its
+        # line.  A repeated IMAGE_BEGIN restarts the block; the lines
+        # before it are passed through unchanged.
+        if marker is IMAGE_BEGIN:
+            line_start = markdown.rfind("\n", 0, m.start()) + 1
+            if line_start >= written:
+                block_start = line_start
             continue
 
-        # Inside an IMAGE block — keep buffering.
-        if block_buffer is not None:
-            block_buffer.append(line)
-            continue
-
-        result.append(line)
-
-    # Flush any unclosed block (shouldn't happen in valid markdown).
-    if block_buffer is not None:
-        result.extend(block_buffer)
-
-    return "\n".join(result)
+        # Detect IMAGE_END — process the whole block through the end of
+        # its line.  The block is collected before deciding whether to
+        # inject, so that the idempotency check can see existing refs
+        # even if they appear after the caption.
+        if marker is IMAGE_END and block_start >= 0:
+            line_end = markdown.find("\n", m.end())
+            if line_end < 0:
+                line_end = len(markdown)
+            out.write(markdown[written:block_start])
+            out.write("\n".join(_process_image_block(
+                markdown[block_start:line_end].split("\n"),
+                current_page, image_map, page_consumed, rel_prefix,
+                image_mode=image_mode, info_map=info_map,
+            )))
+            written = line_end
+            block_start = -1
+
+    # Remaining text, including any unclosed block (shouldn't happen in
+    # valid markdown), is passed through unchanged.
+    out.write(markdown[written:])
+    return out.getvalue()
 
 
 def _process_image_block(
@@ -854,8 +1722,9 @@ def _process_image_block(
     In debug mode, injects an HTML comparison table with all 3 variants.
     """
     # Check idempotency: if block already has an image ref, return as-is.
+    # Every ref contains "![", so most lines skip the regex entirely.
     for line in block_lines:
-        if IMAGE_REF_RE.search(line):
+        if "![" in line and IMAGE_REF_RE.search(line):
             return block_lines
 
     if current_page is None:
@@ -879,8 +1748,12 @@ def _process_image_block(
     injected = False
     for line in block_lines:
         output.append(line)
-        if not injected:
-            bold_match = _BOLD_LINE_RE.match(line.strip())
+        if not injected and "**" in line:
+            stripped = line.strip()
+            bold_match = (
+                stripped.startswith("**") and stripped.endswith("**")
+                and _BOLD_LINE_RE.match(stripped)
+            )
             if bold_match:
                 caption_text = bold_match.group(1)
 
@@ -906,6 +1779,19 @@ def _process_image_block(
     return output
 
 
+_DEBUG_TABLE_HEAD = (
+    "<table>\n<tr><th>Mode</th><th>Image</th><th>Info</th></tr>\n"
+)
+"""Opening tag and header row of the debug comparison table."""
+
+_DEBUG_TABLE_ROW = (
+    '<tr><td>{variant}</td>'
+    '<td><img src="{prefix}/{fname}"></td>'
+    '<td><small>{info}</small></td></tr>\n'
+)
+"""One variant row of the debug comparison table."""
+
+
 def _build_debug_table(
     filenames: list[str],
     rel_prefix: str,
@@ -918,24 +1804,17 @@ def _build_debug_table(
         rel_prefix: Relative path prefix for image src.
         info_map: ``{filename: info_string}`` with debug metadata.
     """
-    rows: list[str] = []
-    rows.append("<table>")
-    rows.append("<tr><th>Mode</th><th>Image</th><th>Info</th></tr>")
-
-    for fname in filenames:
-        # Extract variant name from sub-extension: img_p004_01.auto.png → "auto"
-        parts = fname.split(".")
-        variant = parts[1] if len(parts) >= 3 else "?"
-        info = info_map.get(fname, "")
-        src = f"{rel_prefix}/{fname}"
-        rows.append(
-            f'<tr><td>{variant}</td>'
-            f'<td><img src="{src}"></td>'
-            f'<td><small>{info}</small></td></tr>'
+    # Variant name is the sub-extension: img_p004_01.auto.png → "auto".
+    body = "".join(
+        _DEBUG_TABLE_ROW.format(
+            variant=fname.split(".", 2)[1] if fname.count(".") >= 2 else "?",
+            prefix=rel_prefix,
+            fname=fname,
+            info=info_map.get(fname, ""),
         )
-
-    rows.append("</table>")
-    return "\n".join(rows)
+        for fname in filenames
+    )
+    return f"{_DEBUG_TABLE_HEAD}{body}</table>"
 
 
 # ---------------------------------------------------------------------------
@@ -949,6 +1828,11 @@ class ImageExtractor:
     Holds the image extraction configuration (PDF path, output directory,
     extraction mode, DPI) so callers only need to pass the markdown text.
 
+    Pages are rendered in-process unless *max_workers* allows a process
+    pool.  The pool uses the ``spawn`` start method, which re-imports the
+    caller's main module in every worker: scripts that enable it must
+    keep their entry code under ``if __name__ == "__main__":``.
+
     Usage::
 
         extractor = ImageExtractor(pdf_path, output_dir, image_mode=ImageMode.AUTO)
@@ -961,17 +1845,39 @@ class ImageExtractor:
         output_dir: Path,
         image_mode: ImageMode = ImageMode.AUTO,
         render_dpi: int | None = None,
+        max_workers: int | None = 1,
     ) -> None:
+        """Store the extraction settings; the PDF is opened per call.
+
+        Args:
+            pdf_path: Path to the source PDF.
+            output_dir: Directory to save image files into.
+            image_mode: Extraction strategy (default ``AUTO``).
+            render_dpi: Explicit DPI override for page-region renders.
+            max_workers: Worker processes for documents whose blocks span
+                at least ``_PARALLEL_MIN_PAGES`` pages.  ``1`` (default)
+                renders in-process; ``None`` uses
+                :func:`_get_max_workers`.
+        """
         self._pdf_path = pdf_path
         self._output_dir = output_dir
         self._image_mode = image_mode
         self._render_dpi = render_dpi
+        self._max_workers = max_workers
+        # Raster index per page, kept across calls on the same PDF.
+        self._raster_cache: _RasterCache = {}
 
     def extract_and_inject(self, markdown: str) -> str:
         """Parse IMAGE_RECT markers, extract/render images, save, inject refs.
 
-        Opens the PDF once and passes the document to
-        :func:`render_image_rects` for page-by-page processing.
+        Opens the PDF once and renders page by page, writing each image
+        as it is produced via :func:`render_and_save` (``DEBUG`` mode
+        goes through :func:`render_image_rects` and :func:`save_images`
+        to keep the variant info).  When blocks span at least
+        ``_PARALLEL_MIN_PAGES`` pages and *max_workers* allows more than
+        one worker, pages are rendered in worker processes via
+        :func:`render_and_save_parallel` (or
+        :func:`render_image_rects_parallel` in ``DEBUG`` mode) instead.
 
         Args:
             markdown: Merged markdown containing ``IMAGE_RECT`` markers.
@@ -986,21 +1892,52 @@ class ImageExtractor:
 
         _log.info("  Found %d IMAGE_RECT marker(s), rendering...", len(rects))
 
-        doc = pymupdf.open(str(self._pdf_path))
-        try:
-            rendered = render_image_rects(
-                doc, rects,
+        n_pages = len({ir.page_num for ir in rects})
+        workers = self._max_workers or _get_max_workers()
+        parallel = n_pages >= _PARALLEL_MIN_PAGES and workers > 1
+        debug = self._image_mode is ImageMode.DEBUG
+        rendered: list[RenderedImage] = []
+        if parallel and debug:
+            rendered = render_image_rects_parallel(
+                self._pdf_path, rects,
                 image_mode=self._image_mode,
                 render_dpi=self._render_dpi,
+                max_workers=workers,
             )
-        finally:
-            doc.close()
+            image_map = save_images(rendered, self._output_dir)
+        elif parallel:
+            image_map = render_and_save_parallel(
+                self._pdf_path, rects, self._output_dir,
+                image_mode=self._image_mode,
+                render_dpi=self._render_dpi,
+                max_workers=workers,
+            )
+        else:
+            doc = pymupdf.open(str(self._pdf_path))
+            try:
+                if debug:
+                    rendered = render_image_rects(
+                        doc, rects,
+                        image_mode=self._image_mode,
+                        render_dpi=self._render_dpi,
+                        raster_cache=self._raster_cache,
+                    )
+                    image_map = save_images(rendered, self._output_dir)
+                else:
+                    # Stream each image to disk as it is produced.
+                    image_map = render_and_save(
+                        doc, rects, self._output_dir,
+                        image_mode=self._image_mode,
+                        render_dpi=self._render_dpi,
+                        raster_cache=self._raster_cache,
+                    )
+            finally:
+                doc.close()
 
-        if not rendered:
+        if not image_map:
             _log.warning("  All IMAGE_RECT markers failed to render")
             return markdown
 
-        image_map = save_images(rendered, self._output_dir)
         rel_prefix = self._output_dir.name
 
         # Build debug info map if needed.
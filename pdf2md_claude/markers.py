@@ -16,6 +16,7 @@ Usage::
     # Valueless marker
     PAGE_SKIP.marker            # '<!-- PDF_PAGE_SKIP -->'
     PAGE_SKIP.re.search(text)   # match valueless form
+    PAGE_SKIP.count(text)       # fast literal scan, same result as .re
 
     # Integer-valued marker
     PAGE_BEGIN.format(42)       # '<!-- PDF_PAGE_BEGIN 42 -->'
@@ -33,19 +34,75 @@ Usage::
 
 from __future__ import annotations
 
+import bisect
 import re
+from collections.abc import Iterator
 from dataclasses import dataclass
 from functools import cached_property
 
 
 def _to_non_capturing(pattern: str) -> str:
-    """Convert all capturing groups in *pattern* to non-capturing.
+    r"""Convert all capturing groups in *pattern* to non-capturing.
 
     Replaces ``(`` that starts a capturing group with ``(?:``.
     Already non-capturing groups (``(?:``), lookaheads (``(?=``),
-    and other special groups (``(?...``) are left untouched.
+    and other special groups (``(?...``) are left untouched, as are
+    escaped parentheses and parentheses inside character classes.
+
+    >>> print(_to_non_capturing(r"(\d+)"))
+    (?:\d+)
+    >>> print(_to_non_capturing(r"\("))
+    \(
+    >>> print(_to_non_capturing(r"[()]"))
+    [()]
+    >>> print(_to_non_capturing(r"(?:x)(y)"))
+    (?:x)(?:y)
     """
-    return re.sub(r"\((?!\?)", "(?:", pattern)
+    out: list[str] = []
+    in_class = False
+    i = 0
+    n = len(pattern)
+    while i < n:
+        char = pattern[i]
+        if char == "\\":
+            out.append(pattern[i:i + 2])
+            i += 2
+            continue
+        if in_class:
+            if char == "]":
+                in_class = False
+        elif char == "[":
+            in_class = True
+            # A ``]`` right after ``[`` or ``[^`` is a literal member.
+            end = i + 1
+            if pattern.startswith("^", end):
+                end += 1
+            if pattern.startswith("]", end):
+                end += 1
+            out.append(pattern[i:end])
+            i = end
+            continue
+        elif char == "(" and not pattern.startswith("?", i + 1):
+            out.append("(?:")
+            i += 1
+            continue
+        out.append(char)
+        i += 1
+    return "".join(out)
+
+
+_CLOSE_RE = r"\s*-->"
+"""Regex fragment closing any marker comment (tolerates inner spaces)."""
+
+
+_LITERALS = ("marker", "example", "prompt_template")
+"""Literal-string properties every ``MarkerDef`` builds up front."""
+
+_EAGER_ATTRS = {
+    False: (*_LITERALS, "re"),
+    True: (*_LITERALS, "re", "re_value", "re_value_groups", "re_value_line"),
+}
+"""Cached properties each ``MarkerDef`` fills in up front, by ``has_value``."""
 
 
 @dataclass(frozen=True)
@@ -82,9 +139,18 @@ class MarkerDef:
     _example_value: str = ""
     _prompt_value: str = ""
 
+    def __post_init__(self) -> None:
+        # Markers are module-level singletons used on hot paths: build
+        # every literal and compile every applicable regex at import
+        # rather than on first use.  cached_property stores each result
+        # in the instance __dict__, so later accesses are plain
+        # attribute reads.
+        for name in _EAGER_ATTRS[self.has_value]:
+            getattr(self, name)
+
     # -- Valueless form (always available) ---------------------------------
 
-    @property
+    @cached_property
     def marker(self) -> str:
         """Literal valueless marker string.
 
@@ -93,6 +159,19 @@ class MarkerDef:
         """
         return f"<!-- {self.tag} -->"
 
+    @cached_property
+    def _open_re(self) -> str:
+        """Regex fragment opening this marker's comment, up to the tag.
+
+        Shared by every regex variant so the tag is escaped only once.
+        """
+        return rf"<!--\s*{re.escape(self.tag)}"
+
+    @cached_property
+    def _value_re_nc(self) -> str:
+        """:attr:`_value_re` with its capture groups made non-capturing."""
+        return _to_non_capturing(self._value_re)
+
     @cached_property
     def re(self) -> re.Pattern[str]:
         """Regex matching the valueless form (no capture groups).
@@ -100,7 +179,58 @@ class MarkerDef:
         >>> TABLE_CONTINUE.re.search('<!-- TABLE_CONTINUE -->') is not None
         True
         """
-        return re.compile(rf"<!--\s*{re.escape(self.tag)}\s*-->")
+        return re.compile(self._open_re + _CLOSE_RE)
+
+    def _literal_only(self, text: str) -> bool:
+        """Whether every occurrence of the tag in *text* is the exact marker.
+
+        When true, plain substring scans give the same answer as
+        :attr:`re` without entering the regex engine.
+        """
+        return text.count(self.tag) == text.count(self.marker)
+
+    def contains(self, text: str) -> bool:
+        """Whether *text* contains the valueless form.
+
+        Equivalent to ``self.re.search(text) is not None``; the regex is
+        only consulted when the tag occurs in a non-canonical spelling.
+
+        >>> TABLE_CONTINUE.contains('a <!--TABLE_CONTINUE--> b')
+        True
+        """
+        if self.marker in text:
+            return True
+        return self.tag in text and self.re.search(text) is not None
+
+    def count(self, text: str) -> int:
+        """Number of valueless-form occurrences in *text*.
+
+        Equivalent to ``len(self.re.findall(text))``.
+
+        >>> PAGE_SKIP.count(PAGE_SKIP.marker * 2)
+        2
+        """
+        if self._literal_only(text):
+            return text.count(self.marker)
+        return len(self.re.findall(text))
+
+    def find_all_spans(self, text: str) -> list[tuple[int, int]]:
+        """``(start, end)`` offsets of each valueless-form occurrence.
+
+        Equivalent to ``[m.span() for m in self.re.finditer(text)]``.
+
+        >>> IMAGE_END.find_all_spans('ab' + IMAGE_END.marker)
+        [(2, 20)]
+        """
+        if not self._literal_only(text):
+            return [m.span() for m in self.re.finditer(text)]
+        spans = []
+        size = len(self.marker)
+        pos = text.find(self.marker)
+        while pos != -1:
+            spans.append((pos, pos + size))
+            pos = text.find(self.marker, pos + size)
+        return spans
 
     # -- Valued form -------------------------------------------------------
 
@@ -109,10 +239,16 @@ class MarkerDef:
         """Whether this marker carries a value payload."""
         return bool(self._value_re)
 
+    @cached_property
+    def _marker_fmt(self) -> str:
+        """Full marker template, e.g. ``'<!-- PDF_PAGE_BEGIN {0} -->'``."""
+        return f"<!-- {self.tag} {self._value_fmt} -->"
+
     def format(self, *args: object, **kwargs: object) -> str:
         """Generate a marker string with a formatted value.
 
-        Delegates to ``self._value_fmt.format(*args, **kwargs)``.
+        A single ``str.format`` call on the prebuilt full-marker
+        template, using ``_value_fmt`` placeholders.
 
         >>> PAGE_BEGIN.format(42)
         '<!-- PDF_PAGE_BEGIN 42 -->'
@@ -125,15 +261,14 @@ class MarkerDef:
                 f"use .marker instead of .format()"
             )
         try:
-            value = self._value_fmt.format(*args, **kwargs)
+            return self._marker_fmt.format(*args, **kwargs)
         except (IndexError, KeyError) as exc:
             raise TypeError(
                 f"Marker {self.tag!r} format {self._value_fmt!r} "
                 f"called with args={args}, kwargs={kwargs}"
             ) from exc
-        return f"<!-- {self.tag} {value} -->"
 
-    @property
+    @cached_property
     def example(self) -> str:
         """Human-readable example for use in prompts.
 
@@ -148,7 +283,7 @@ class MarkerDef:
             return f"<!-- {self.tag} {self._example_value} -->"
         return self.marker
 
-    @property
+    @cached_property
     def prompt_template(self) -> str:
         """Prompt-ready template showing the value format.
 
@@ -178,7 +313,7 @@ class MarkerDef:
                 f"Marker {self.tag!r} is valueless — use .re instead"
             )
         return re.compile(
-            rf"<!--\s*{re.escape(self.tag)}\s+{self._value_re}\s*-->"
+            rf"{self._open_re}\s+{self._value_re}{_CLOSE_RE}"
         )
 
     @cached_property
@@ -193,9 +328,8 @@ class MarkerDef:
             raise TypeError(
                 f"Marker {self.tag!r} is valueless — use .re instead"
             )
-        nc = _to_non_capturing(self._value_re)
         return re.compile(
-            rf"(<!--\s*{re.escape(self.tag)}\s+)({nc})(\s*-->)"
+            rf"({self._open_re}\s+)({self._value_re_nc})({_CLOSE_RE})"
         )
 
     @cached_property
@@ -210,7 +344,7 @@ class MarkerDef:
                 f"Marker {self.tag!r} is valueless — use .re instead"
             )
         return re.compile(
-            rf"^<!--\s*{re.escape(self.tag)}\s+{self._value_re}\s*-->$",
+            rf"^{self._open_re}\s+{self._value_re}{_CLOSE_RE}$",
             re.MULTILINE,
         )
 
@@ -273,9 +407,17 @@ IMAGE_AI_DESC_END = MarkerDef("IMAGE_AI_GENERATED_DESCRIPTION_END")
 
 # -- Coordinate-valued marker (4-float payload) ----------------------------
 
+_COORD_RE = r"(\d+(?:\.\d*)?|\.\d+)"
+"""One unsigned decimal coordinate (``0``, ``0.25``, ``1.``, ``.5``).
+
+Each input has a single derivation, so malformed runs such as
+``0.....`` fail fast instead of backtracking, and every match is
+accepted by ``float()``.
+"""
+
 IMAGE_RECT = MarkerDef(
     "IMAGE_RECT",
-    _value_re=r"([0-9.]+),([0-9.]+),([0-9.]+),([0-9.]+)",
+    _value_re=",".join([_COORD_RE] * 4),
     _value_fmt="{x0},{y0},{x1},{y1}",
     _example_value="0.02,0.15,0.98,0.65",
     _prompt_value="<x0>,<y0>,<x1>,<y1>",
@@ -288,20 +430,195 @@ The page number is derived from the enclosing ``PAGE_BEGIN`` marker,
 so it is NOT repeated here.
 """
 
+# ---------------------------------------------------------------------------
+# Combined marker scanning
+# ---------------------------------------------------------------------------
+
+ALL_MARKERS: tuple[MarkerDef, ...] = (
+    PAGE_BEGIN, PAGE_END, PAGE_SKIP, TABLE_CONTINUE,
+    IMAGE_BEGIN, IMAGE_END, IMAGE_AI_DESC_BEGIN, IMAGE_AI_DESC_END,
+    IMAGE_RECT,
+)
+"""Every marker defined in this module."""
+
+_VALUE_GROUP_SUFFIX = "_value"
+"""Suffix of the named group holding a valued marker's raw value."""
+
+
+def markers_re(*markers: MarkerDef) -> re.Pattern[str]:
+    """Compile one regex matching any of *markers* in a single pass.
+
+    Each alternative is a named group called after the marker's tag, so
+    ``m.lastgroup`` identifies the marker.  Valued markers match their
+    valued form and expose the raw value (inner capture groups made
+    non-capturing) as the group ``<tag>_value``, which directly follows
+    the marker's group — ``m.lastindex + 1``.  Use with
+    :func:`iter_markers`.
+
+    >>> pattern = markers_re(PAGE_BEGIN, PAGE_SKIP)
+    >>> pattern.match('<!-- PDF_PAGE_SKIP -->').lastgroup
+    'PDF_PAGE_SKIP'
+    """
+    alternatives = []
+    for marker in markers:
+        if marker.has_value:
+            group = marker.tag + _VALUE_GROUP_SUFFIX
+            body = (
+                rf"{marker._open_re}\s+"
+                rf"(?P<{group}>{marker._value_re_nc}){_CLOSE_RE}"
+            )
+        else:
+            body = marker.re.pattern
+        alternatives.append(f"(?P<{marker.tag}>{body})")
+    return re.compile("|".join(alternatives))
+
+
+ALL_MARKERS_RE = markers_re(*ALL_MARKERS)
+"""Single-pass regex over every marker in :data:`ALL_MARKERS`."""
+
+_MARKERS_BY_TAG = {marker.tag: marker for marker in ALL_MARKERS}
+"""Lookup from tag (the group name in :func:`markers_re`) to marker."""
+
+
+def iter_markers(
+    text: str,
+    pattern: re.Pattern[str] = ALL_MARKERS_RE,
+) -> Iterator[tuple[MarkerDef, str | None, re.Match[str]]]:
+    """Yield ``(marker, raw_value, match)`` for each marker in *text*.
+
+    Scans *text* once with *pattern* (:data:`ALL_MARKERS_RE` or a
+    narrower :func:`markers_re` result), in document order.
+    *raw_value* is the value string of a valued marker (``"42"``,
+    ``"0.1,0.2,0.5,0.6"``) and ``None`` for valueless ones.
+
+    >>> text = PAGE_BEGIN.format(3) + PAGE_SKIP.marker
+    >>> [(marker.tag, value) for marker, value, _ in iter_markers(text)]
+    [('PDF_PAGE_BEGIN', '3'), ('PDF_PAGE_SKIP', None)]
+    """
+    for m in pattern.finditer(text):
+        tag, index = m.lastgroup, m.lastindex
+        assert tag is not None and index is not None  # every branch is named
+        marker = _MARKERS_BY_TAG[tag]
+        value = m.group(index + 1) if marker.has_value else None
+        yield marker, value, m
+
+
 # ---------------------------------------------------------------------------
 # Composite / utility regexes (not single-marker patterns)
 # ---------------------------------------------------------------------------
 
+PAGE_MARKERS_RE = markers_re(PAGE_BEGIN, PAGE_END)
+"""``PAGE_BEGIN`` and ``PAGE_END`` in one pass.
+
+Use with :func:`iter_markers`, or with ``sub()`` where the page number
+is group ``m.lastindex + 1``."""
+
+IMAGE_BLOCK_EVENTS_RE = markers_re(PAGE_BEGIN, IMAGE_BEGIN, IMAGE_END)
+"""Image block boundaries plus ``PAGE_BEGIN`` (to track the current page).
+
+Use with :func:`iter_markers`."""
+
+IMAGE_CAPTION = "IMAGE_CAPTION"
+"""Group name of the bold caption line in :data:`IMAGE_EVENTS_RE`."""
+
+IMAGE_EVENTS_RE = re.compile(
+    markers_re(PAGE_BEGIN, IMAGE_BEGIN, IMAGE_END, IMAGE_RECT).pattern
+    + rf"|(?P<{IMAGE_CAPTION}>^[^\S\n]*\*\*"
+    rf"(?P<{IMAGE_CAPTION}{_VALUE_GROUP_SUFFIX}>.+)\*\*[^\S\n]*$)",
+    re.MULTILINE,
+)
+"""Single-pass scanner for everything inside and around image blocks.
+
+:data:`IMAGE_BLOCK_EVENTS_RE` plus ``IMAGE_RECT`` and a bold
+``**caption**`` line (surrounding spaces allowed).  As with
+:func:`markers_re`, ``m.lastgroup`` names the event (a marker tag or
+:data:`IMAGE_CAPTION`) and its raw value is group ``m.lastindex + 1``.
+"""
+
 TABLE_BLOCK_RE = re.compile(
     r"<table\b[^>]*>.*?</table>",
     re.DOTALL | re.IGNORECASE,
 )
 """Regex matching a full ``<table>...</table>`` HTML block (no capture groups)."""
 
+_TABLE_OPEN = "<table"
+"""Lower-case start of an HTML table opening tag."""
+
+TABLE_CLOSE_TAG = "</table>"
+"""Lower-case HTML table closing tag."""
+
+_TABLE_OPEN_RE = re.compile(rf"{_TABLE_OPEN}\b", re.IGNORECASE)
+"""Regex fallback for ``<table`` tags in :func:`table_tag_offsets`."""
+
+_TABLE_CLOSE_RE = re.compile(TABLE_CLOSE_TAG, re.IGNORECASE)
+"""Regex fallback for ``</table>`` tags in :func:`table_tag_offsets`."""
+
+
+def _find_all(text: str, sub: str) -> list[int]:
+    """Return start offsets of non-overlapping occurrences of *sub*."""
+    offsets: list[int] = []
+    pos = text.find(sub)
+    while pos != -1:
+        offsets.append(pos)
+        pos = text.find(sub, pos + len(sub))
+    return offsets
+
+
+def table_tag_offsets(text: str) -> tuple[list[int], list[int]]:
+    """Return sorted start offsets of ``<table`` and ``</table>`` tags.
+
+    Tags match case-insensitively, and ``<table`` only as a whole tag
+    name (``<table\\b``, so not ``<tablex``).  Offsets are found with
+    ``str.find`` over one lower-cased copy of *text*; when lower-casing
+    changes the text length (some non-ASCII characters) the copy's
+    offsets would not line up, so the regexes are used instead.
+
+    >>> table_tag_offsets("<TABLE><tablex></Table>")
+    ([0], [15])
+    """
+    lower = text.lower()
+    if len(lower) != len(text):
+        return (
+            [m.start() for m in _TABLE_OPEN_RE.finditer(text)],
+            [m.start() for m in _TABLE_CLOSE_RE.finditer(text)],
+        )
+
+    after = len(_TABLE_OPEN)
+    opens: list[int] = []
+    for i in _find_all(lower, _TABLE_OPEN):
+        # The tag name must not run on (e.g. ``<tablex``).
+        nxt = lower[i + after:i + after + 1]
+        if not (nxt.isalnum() or nxt == "_"):
+            opens.append(i)
+    return opens, _find_all(lower, TABLE_CLOSE_TAG)
+
+
+def iter_table_blocks(text: str) -> Iterator[tuple[int, int]]:
+    """Yield ``(start, end)`` spans of each ``<table>...</table>`` block.
+
+    Same spans as ``TABLE_BLOCK_RE.finditer(text)``, built from the tag
+    offsets of :func:`table_tag_offsets` instead of the regex engine.
+
+    >>> text = "a <TABLE border=1><tr></tr></Table> b"
+    >>> [text[s:e] for s, e in iter_table_blocks(text)]
+    ['<TABLE border=1><tr></tr></Table>']
+    """
+    opens, closes = table_tag_offsets(text)
+    pos = 0
+    for start in opens:
+        if start < pos:
+            continue        # nested or stray ``<table`` inside a block
+        tag_end = text.find(">", start + len(_TABLE_OPEN))
+        if tag_end == -1:
+            return
+        i = bisect.bisect_right(closes, tag_end)
+        if i == len(closes):
+            return
+        pos = closes[i] + len(TABLE_CLOSE_TAG)
+        yield start, pos
+
 IMAGE_AI_DESCRIPTION_BLOCK_RE = re.compile(
-    rf"<!--\s*{re.escape(IMAGE_AI_DESC_BEGIN.tag)}\s*-->"
-    r".*?"
-    rf"<!--\s*{re.escape(IMAGE_AI_DESC_END.tag)}\s*-->",
+    rf"{IMAGE_AI_DESC_BEGIN.re.pattern}.*?{IMAGE_AI_DESC_END.re.pattern}",
     re.DOTALL,
 )
 """Regex matching a full AI-generated description block (begin through end).
@@ -309,6 +626,45 @@ IMAGE_AI_DESCRIPTION_BLOCK_RE = re.compile(
 Use for stripping AI-generated content before fidelity checks.
 """
 
+
+def strip_ai_description_blocks(text: str, repl: str = "") -> str:
+    """Replace every AI-generated description block in *text* with *repl*.
+
+    Same result as ``IMAGE_AI_DESCRIPTION_BLOCK_RE.sub(repl, text)``.
+    When both markers only occur in their canonical spelling the blocks
+    are located with ``str.find`` in one linear pass; otherwise the
+    whitespace-tolerant regex is used.
+
+    >>> strip_ai_description_blocks(
+    ...     "a" + IMAGE_AI_DESC_BEGIN.marker + "x" + IMAGE_AI_DESC_END.marker
+    ... )
+    'a'
+    """
+    begin_marker = IMAGE_AI_DESC_BEGIN.marker
+    end_marker = IMAGE_AI_DESC_END.marker
+    if IMAGE_AI_DESC_BEGIN.tag not in text:
+        return text
+    if not (IMAGE_AI_DESC_BEGIN._literal_only(text)
+            and IMAGE_AI_DESC_END._literal_only(text)):
+        return IMAGE_AI_DESCRIPTION_BLOCK_RE.sub(repl, text)
+
+    parts: list[str] = []
+    pos = 0
+    while True:
+        begin = text.find(begin_marker, pos)
+        if begin == -1:
+            break
+        end = text.find(end_marker, begin + len(begin_marker))
+        if end == -1:
+            break
+        parts.append(text[pos:begin])
+        parts.append(repl)
+        pos = end + len(end_marker)
+    if not parts:
+        return text
+    parts.append(text[pos:])
+    return "".join(parts)
+
 # ---------------------------------------------------------------------------
 # Extracted-image file naming
 # ---------------------------------------------------------------------------
@@ -329,11 +685,18 @@ IMAGE_FILENAME_RE = re.compile(r"img_p(\d{3})_(\d{2})\.(\w+)")
 Captures ``(page, index, extension)``.
 """
 
-IMAGE_REF_RE = re.compile(r"!\[([^\]]*)\]\(([^)]*?/img_p\d{3}_\d{2}\.[\w.]+)\)")
+IMAGE_REF_RE = re.compile(r"!\[([^\]]*)\]\(([^)]*/img_p\d{3}_\d{2}\.[\w.]+)\)")
 """Regex matching a markdown image reference to an extracted image.
 
 Captures ``(alt_text, full_path)``.  Matches both single-extension
 filenames (``img_p001_01.png``) and sub-extension filenames used by
 debug mode (``img_p001_01.auto.png``).  Used for idempotent injection
-(skip blocks that already contain a reference).
+(skip blocks that already contain a reference).  The path scan is
+greedy: ``[^)]`` cannot cross the closing parenthesis, so there is
+nothing for a lazy quantifier to disambiguate.
+
+>>> IMAGE_REF_RE.search("![Fig](../images/img_p001_01.png)").group(2)
+'../images/img_p001_01.png'
+>>> IMAGE_REF_RE.search("![A (b)](x.png) (img_p001_01.png)") is None
+True
 """
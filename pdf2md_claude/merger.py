@@ -12,6 +12,7 @@ preserving page-boundary markers inside the merged ``<tbody>``.
 
 from __future__ import annotations
 
+import bisect
 import logging
 import re
 
@@ -19,19 +20,13 @@ from pdf2md_claude.markers import (
     PAGE_BEGIN,
     PAGE_END,
     TABLE_BLOCK_RE,
+    TABLE_CLOSE_TAG,
     TABLE_CONTINUE,
+    table_tag_offsets,
 )
 
 _log = logging.getLogger("merger")
 
-# Regex that matches from a PAGE_BEGIN marker through its PAGE_END marker
-# (inclusive), capturing the page number.
-_PAGE_BLOCK_RE = re.compile(
-    rf"(<!--\s*{re.escape(PAGE_BEGIN.tag)}\s+(\d+)\s*-->)"
-    r"(.*?)"
-    rf"(<!--\s*{re.escape(PAGE_END.tag)}\s+\d+\s*-->)",
-    re.DOTALL,
-)
 
 # Regex helpers for table merging.
 _TBODY_ROWS_RE = re.compile(
@@ -39,6 +34,14 @@ _TBODY_ROWS_RE = re.compile(
     re.DOTALL | re.IGNORECASE,
 )
 _TR_RE = re.compile(r"<tr\b[^>]*>.*?</tr>", re.DOTALL | re.IGNORECASE)
+# A line starting with a PAGE_BEGIN / PAGE_END marker; captures the line
+# with surrounding whitespace stripped.
+_PAGE_MARKER_LINE_RE = re.compile(
+    r"^[^\S\n]*("
+    rf"(?:{PAGE_BEGIN.re_value.pattern}|{PAGE_END.re_value.pattern})"
+    r"[^\n]*?)\s*$",
+    re.MULTILINE,
+)
 
 
 def _extract_pages(markdown: str) -> dict[int, str]:
@@ -47,12 +50,23 @@ def _extract_pages(markdown: str) -> dict[int, str]:
     Each value includes the PAGE_BEGIN and PAGE_END markers.
     Content outside any page markers (between pages or before the first
     marker) is dropped.
+
+    Each block runs from a PAGE_BEGIN marker to the first PAGE_END
+    marker after it.  Blocks are found by slicing between marker
+    offsets rather than matching the page body with a regex.
     """
     pages: dict[int, str] = {}
-    for match in _PAGE_BLOCK_RE.finditer(markdown):
-        page_num = int(match.group(2))
-        if page_num not in pages:
-            pages[page_num] = match.group(0)
+    end_spans = [m.span() for m in PAGE_END.re_value.finditer(markdown)]
+    end_starts = [start for start, _ in end_spans]
+    pos = 0
+    for begin in PAGE_BEGIN.re_value.finditer(markdown):
+        if begin.start() < pos:
+            continue
+        i = bisect.bisect_left(end_starts, begin.end())
+        if i == len(end_spans):
+            break
+        pos = end_spans[i][1]
+        pages.setdefault(int(begin[1]), markdown[begin.start():pos])
     return pages
 
 
@@ -79,12 +93,10 @@ def merge_chunks(markdown_parts: list[str]) -> str:
     chunk_summaries: list[tuple[int, int, int]] = []
     for i, part in enumerate(markdown_parts):
         chunk_pages = _extract_pages(part)
-        new_pages = 0
+        before = len(all_pages)
         for page_num, content in chunk_pages.items():
-            if page_num not in all_pages:
-                all_pages[page_num] = content
-                new_pages += 1
-        chunk_summaries.append((i, len(chunk_pages), new_pages))
+            all_pages.setdefault(page_num, content)
+        chunk_summaries.append((i, len(chunk_pages), len(all_pages) - before))
 
     if not all_pages:
         _log.warning("    No page markers found — falling back to simple join")
@@ -99,7 +111,7 @@ def merge_chunks(markdown_parts: list[str]) -> str:
     for i, total, new in chunk_summaries:
         _log.info("    Chunk %d: %d pages (%d new)", i + 1, total, new)
 
-    merged = "\n\n".join(all_pages[p] for p in sorted_pages)
+    merged = "\n\n".join([all_pages[p] for p in sorted_pages])
     return merged
 
 
@@ -134,32 +146,41 @@ def merge_continued_tables(markdown: str) -> str:
     """
     # Find all TABLE_CONTINUE markers.  Process from last to first so
     # that string indices remain valid after each splice.
-    markers = list(TABLE_CONTINUE.re.finditer(markdown))
+    markers = TABLE_CONTINUE.find_all_spans(markdown)
     if not markers:
         return markdown
 
     _log.info("  Merging %d continued table(s)...", len(markers))
 
-    for match in reversed(markers):
-        marker_start = match.start()
-        marker_end = match.end()
+    # Table tag offsets, scanned once.  Splices only rewrite text from
+    # ``edited_from`` onward, so the offsets stay exact for every marker
+    # before that point.  A marker past it (its original offset no
+    # longer lines up with the spliced text) is counted directly.
+    open_offsets, close_offsets = table_tag_offsets(markdown)
+    edited_from = len(markdown)
+
+    for marker_start, marker_end in reversed(markers):
 
         # --- Check if marker is already inside an open <table> -----------
         # Count <table> and </table> tags up to the marker.  If there are
         # more opens than closes, the marker sits inside an already-open
         # table (intra-chunk continuation) — just strip the marker.
-        prefix = markdown[:marker_start]
-        opens = len(re.findall(r"<table\b", prefix, re.IGNORECASE))
-        closes = len(re.findall(r"</table>", prefix, re.IGNORECASE))
+        if marker_start <= edited_from:
+            opens = bisect.bisect_left(open_offsets, marker_start)
+            closes = bisect.bisect_left(close_offsets, marker_start)
+        else:
+            prefix = markdown[:marker_start]
+            opens, closes = map(len, table_tag_offsets(prefix))
         if opens > closes:
             _log.info(
                 "    TABLE_CONTINUE inside open table — removing marker only",
             )
             markdown = markdown[:marker_start] + markdown[marker_end:]
+            edited_from = min(edited_from, marker_start)
             continue
 
         # --- Locate the preceding table's </tbody></table> ---------------
-        preceding_table_end = markdown.rfind("</table>", 0, marker_start)
+        preceding_table_end = markdown.rfind(TABLE_CLOSE_TAG, 0, marker_start)
         if preceding_table_end == -1:
             _log.warning(
                 "    TABLE_CONTINUE at offset %d: no preceding </table>, skipping",
@@ -202,13 +223,13 @@ def merge_continued_tables(markdown: str) -> str:
             continue
 
         cont_rows = tbody_match.group(1).strip()
-        row_count = len(_TR_RE.findall(cont_rows))
 
         # --- Collect page markers between the two tables ------------------
         # The region between the preceding </table> and the continuation
         # <table> may contain PDF_PAGE_END / PDF_PAGE_BEGIN markers as well
         # as the TABLE_CONTINUE marker and an optional "(continued)" title.
-        between = markdown[preceding_table_end + len("</table>"):cont_table_start]
+        after_preceding_table = preceding_table_end + len(TABLE_CLOSE_TAG)
+        between = markdown[after_preceding_table:cont_table_start]
         page_markers = _extract_page_markers(between)
 
         # Build the text to insert into the preceding table's <tbody>.
@@ -219,29 +240,27 @@ def merge_continued_tables(markdown: str) -> str:
         insert_text = "\n\n".join(insert_parts)
 
         # --- Splice -------------------------------------------------------
-        # 1. Insert rows (+ page markers) into the preceding table's <tbody>
-        #    right before the closing </tbody>.
-        new_markdown = (
-            markdown[:preceding_tbody_end]
-            + "\n"
-            + insert_text
-            + "\n"
-            + markdown[preceding_tbody_end:preceding_table_end + len("</table>")]
-        )
-
-        # 2. Remove everything from after the preceding </table> through
-        #    the end of the continuation </table>, EXCEPT content that
-        #    comes after the continuation table on the same page.
-        after_preceding_table = preceding_table_end + len("</table>")
-        # Offset shift: new_markdown is longer than the original prefix.
-        shift = len(new_markdown) - (after_preceding_table)
-        # The tail starts right after the continuation table in the
-        # original string.
-        tail = markdown[cont_table_end_pos:]
-        new_markdown = new_markdown + tail
-
-        markdown = new_markdown
-
+        # Insert rows (+ page markers) into the preceding table's <tbody>
+        # right before the closing </tbody>, then drop everything from
+        # after the preceding </table> through the end of the
+        # continuation </table>.  Content after the continuation table
+        # is kept.  Built with one join so the document is copied once
+        # per splice.
+        markdown = "".join((
+            markdown[:preceding_tbody_end],
+            "\n",
+            insert_text,
+            "\n",
+            markdown[preceding_tbody_end:after_preceding_table],
+            markdown[cont_table_end_pos:],
+        ))
+        edited_from = min(edited_from, preceding_tbody_end)
+
+        # The row count and boundary description only feed the log, so
+        # skip those scans when INFO is off.
+        if not _log.isEnabledFor(logging.INFO):
+            continue
+        row_count = len(_TR_RE.findall(cont_rows))
         # Build a compact description of which page boundary was stitched.
         end_pages = PAGE_END.re_value.findall(page_markers)
         begin_pages = PAGE_BEGIN.re_value.findall(page_markers)
@@ -257,11 +276,11 @@ def merge_continued_tables(markdown: str) -> str:
             )
 
     # Final sanity: no TABLE_CONTINUE markers should remain.
-    remaining = len(TABLE_CONTINUE.re.findall(markdown))
-    if remaining:
+    # Only count when something is left.
+    if TABLE_CONTINUE.contains(markdown):
         _log.warning(
             "    %d TABLE_CONTINUE marker(s) still present after merging",
-            remaining,
+            TABLE_CONTINUE.count(markdown),
         )
 
     return markdown
@@ -274,9 +293,6 @@ def _extract_page_markers(text: str) -> str:
     preserving their order.  Non-marker content (TABLE_CONTINUE marker,
     "(continued)" titles, whitespace) is discarded.
     """
-    markers: list[str] = []
-    for line in text.splitlines():
-        stripped = line.strip()
-        if PAGE_BEGIN.re_value.match(stripped) or PAGE_END.re_value.match(stripped):
-            markers.append(stripped)
-    return "\n\n".join(markers)
+    return "\n\n".join(
+        [m[1] for m in _PAGE_MARKER_LINE_RE.finditer(text)]
+    )
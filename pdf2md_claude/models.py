@@ -10,6 +10,10 @@ Last verified: 2026-02-08
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import cached_property
+
+_TOKENS_PER_MTOK = 1_000_000
+"""Tokens per million — the unit pricing is quoted in."""
 
 
 @dataclass
@@ -63,6 +67,30 @@ class ModelPricing:
     cache_write_multiplier: float = 2.0  # 1h TTL: 2x base input rate
     cache_read_multiplier: float = 0.1  # cache hit: 0.1x base input rate
 
+    def _per_token_rates(
+        self, input_per_mtok: float, output_per_mtok: float,
+    ) -> tuple[float, float, float, float]:
+        """Per-token ``(input, cache_write, cache_read, output)`` USD rates."""
+        input_rate = input_per_mtok / _TOKENS_PER_MTOK
+        return (
+            input_rate,
+            input_rate * self.cache_write_multiplier,
+            input_rate * self.cache_read_multiplier,
+            output_per_mtok / _TOKENS_PER_MTOK,
+        )
+
+    @cached_property
+    def base_rates(self) -> tuple[float, float, float, float]:
+        """Per-token ``(input, cache_write, cache_read, output)`` base rates."""
+        return self._per_token_rates(self.input_per_mtok, self.output_per_mtok)
+
+    @cached_property
+    def long_ctx_rates(self) -> tuple[float, float, float, float]:
+        """Per-token long-context rates, same layout as :attr:`base_rates`."""
+        return self._per_token_rates(
+            self.long_ctx_input_per_mtok, self.long_ctx_output_per_mtok,
+        )
+
 
 @dataclass(frozen=True)
 class ModelConfig:
@@ -234,22 +262,16 @@ def calculate_cost(
     total_input = input_tokens + cache_creation_tokens + cache_read_tokens
 
     if total_input > p.long_ctx_threshold:
-        base_input_rate = p.long_ctx_input_per_mtok
-        output_rate = p.long_ctx_output_per_mtok
+        input_rate, write_rate, read_rate, output_rate = p.long_ctx_rates
     else:
-        base_input_rate = p.input_per_mtok
-        output_rate = p.output_per_mtok
+        input_rate, write_rate, read_rate, output_rate = p.base_rates
 
-    input_cost = input_tokens * base_input_rate / 1_000_000
-    cache_write_cost = (
-        cache_creation_tokens * base_input_rate * p.cache_write_multiplier / 1_000_000
+    return (
+        input_tokens * input_rate
+        + cache_creation_tokens * write_rate
+        + cache_read_tokens * read_rate
+        + output_tokens * output_rate
     )
-    cache_read_cost = (
-        cache_read_tokens * base_input_rate * p.cache_read_multiplier / 1_000_000
-    )
-    output_cost = output_tokens * output_rate / 1_000_000
-
-    return input_cost + cache_write_cost + cache_read_cost + output_cost
 
 
 def fmt_duration(seconds: float) -> str:
@@ -269,6 +291,18 @@ def fmt_duration(seconds: float) -> str:
     return f"{h}h {m:02d}m {s:02d}s"
 
 
+_SUMMARY_ROW_CACHE = (
+    "{label:<30s} {pages:>5} {inp:>9,} {cw:>9,} {cr:>9,} {out:>9,} "
+    "{time:>8s} ${cost:>6.2f}"
+)
+"""Summary row template with separate cache write/read columns."""
+
+_SUMMARY_ROW_PLAIN = (
+    "{label:<35s} {pages:>5} {inp:>10,} {out:>10,} {time:>10s} ${cost:>7.2f}"
+)
+"""Summary row template without cache columns (``cw``/``cr`` ignored)."""
+
+
 def format_summary(model: ModelConfig, stats: list[DocumentUsageStats]) -> str:
     """Format a summary table of token usage and costs across all documents.
 
@@ -299,18 +333,21 @@ def format_summary(model: ModelConfig, stats: list[DocumentUsageStats]) -> str:
 
     lines.append("")
     if has_cache:
+        row_fmt = _SUMMARY_ROW_CACHE
         lines.append(
             f"{'Document':<30s} {'Pages':>5s} {'Input':>9s} "
             f"{'CacheWr':>9s} {'CacheRd':>9s} {'Output':>9s} "
             f"{'Time':>8s} {'Cost':>8s}"
         )
-        lines.append("-" * 100)
+        rule = "-" * 100
     else:
+        row_fmt = _SUMMARY_ROW_PLAIN
         lines.append(
             f"{'Document':<35s} {'Pages':>5s} {'Input':>10s} {'Output':>10s} "
             f"{'Time':>10s} {'Cost':>9s}"
         )
-        lines.append("-" * 85)
+        rule = "-" * 85
+    lines.append(rule)
 
     total_pages = 0
     total_input = 0
@@ -321,21 +358,19 @@ def format_summary(model: ModelConfig, stats: list[DocumentUsageStats]) -> str:
     total_elapsed = 0.0
 
     for s in stats:
+        # Grand totals walk the stage list; compute each once per document.
+        doc_input = s.total_all_input_tokens
+        doc_output = s.total_all_output_tokens
+        doc_cost = s.total_cost
+        doc_elapsed = s.total_elapsed
+
         # Document row uses grand totals
-        if has_cache:
-            lines.append(
-                f"{s.doc_name:<30s} {s.pages:>5d} {s.total_all_input_tokens:>9,} "
-                f"{s.cache_creation_tokens:>9,} {s.cache_read_tokens:>9,} "
-                f"{s.total_all_output_tokens:>9,} "
-                f"{fmt_duration(s.total_elapsed):>8s} ${s.total_cost:>6.2f}"
-            )
-        else:
-            lines.append(
-                f"{s.doc_name:<35s} {s.pages:>5d} {s.total_all_input_tokens:>10,} "
-                f"{s.total_all_output_tokens:>10,} {fmt_duration(s.total_elapsed):>10s} "
-                f"${s.total_cost:>7.2f}"
-            )
-        
+        lines.append(row_fmt.format(
+            label=s.doc_name, pages=s.pages, inp=doc_input,
+            cw=s.cache_creation_tokens, cr=s.cache_read_tokens,
+            out=doc_output, time=fmt_duration(doc_elapsed), cost=doc_cost,
+        ))
+
         # Conversion sub-line (only when stages exist, for breakdown clarity)
         if s.stages:
             conv_label = "  conversion"
@@ -343,20 +378,16 @@ def format_summary(model: ModelConfig, stats: list[DocumentUsageStats]) -> str:
                 conv_label += f" ({s.chunks} chunks)"
             elif s.chunks == 1:
                 conv_label += " (1 chunk)"
-            if has_cache:
-                lines.append(
-                    f"{conv_label:<30s} {'':>5s} {s.input_tokens:>9,} "
-                    f"{s.cache_creation_tokens:>9,} {s.cache_read_tokens:>9,} "
-                    f"{s.output_tokens:>9,} "
-                    f"{fmt_duration(s.elapsed_seconds):>8s} ${s.cost:>6.2f}"
-                )
-            else:
-                lines.append(
-                    f"{conv_label:<35s} {'':>5s} {s.total_input_tokens:>10,} "
-                    f"{s.output_tokens:>10,} {fmt_duration(s.elapsed_seconds):>10s} "
-                    f"${s.cost:>7.2f}"
-                )
-        
+            # With cache columns the cache tokens are shown separately;
+            # without them they are rolled into the input column.
+            lines.append(row_fmt.format(
+                label=conv_label, pages="",
+                inp=s.input_tokens if has_cache else s.total_input_tokens,
+                cw=s.cache_creation_tokens, cr=s.cache_read_tokens,
+                out=s.output_tokens,
+                time=fmt_duration(s.elapsed_seconds), cost=s.cost,
+            ))
+
         # Stage sub-lines (if any)
         # Note: Stage Input column includes rolled-in cache tokens (since stages
         # don't use prompt caching separately), while document row separates them
@@ -365,44 +396,28 @@ def format_summary(model: ModelConfig, stats: list[DocumentUsageStats]) -> str:
             stage_label = f"  {stage.name}"
             if stage.detail:
                 stage_label += f" ({stage.detail})"
-            if has_cache:
-                # Stages don't use prompt caching, show 0 for cache columns
-                lines.append(
-                    f"{stage_label:<30s} {'':>5s} {stage.input_tokens:>9,} "
-                    f"{0:>9,} {0:>9,} "
-                    f"{stage.output_tokens:>9,} "
-                    f"{fmt_duration(stage.elapsed_seconds):>8s} ${stage.cost:>6.2f}"
-                )
-            else:
-                lines.append(
-                    f"{stage_label:<35s} {'':>5s} {stage.input_tokens:>10,} "
-                    f"{stage.output_tokens:>10,} {fmt_duration(stage.elapsed_seconds):>10s} "
-                    f"${stage.cost:>7.2f}"
-                )
-        
+            # Stages don't use prompt caching, show 0 for cache columns
+            lines.append(row_fmt.format(
+                label=stage_label, pages="",
+                inp=stage.input_tokens, cw=0, cr=0,
+                out=stage.output_tokens,
+                time=fmt_duration(stage.elapsed_seconds), cost=stage.cost,
+            ))
+
         # Accumulate totals
         total_pages += s.pages
-        total_input += s.total_all_input_tokens
-        total_output += s.total_all_output_tokens
+        total_input += doc_input
+        total_output += doc_output
         total_cache_creation += s.cache_creation_tokens
         total_cache_read += s.cache_read_tokens
-        total_cost += s.total_cost
-        total_elapsed += s.total_elapsed
-
-    if has_cache:
-        lines.append("-" * 100)
-        lines.append(
-            f"{'TOTAL':<30s} {total_pages:>5d} {total_input:>9,} "
-            f"{total_cache_creation:>9,} {total_cache_read:>9,} "
-            f"{total_output:>9,} "
-            f"{fmt_duration(total_elapsed):>8s} ${total_cost:>6.2f}"
-        )
-    else:
-        lines.append("-" * 85)
-        lines.append(
-            f"{'TOTAL':<35s} {total_pages:>5d} {total_input:>10,} "
-            f"{total_output:>10,} {fmt_duration(total_elapsed):>10s} "
-            f"${total_cost:>7.2f}"
-        )
+        total_cost += doc_cost
+        total_elapsed += doc_elapsed
+
+    lines.append(rule)
+    lines.append(row_fmt.format(
+        label="TOTAL", pages=total_pages, inp=total_input,
+        cw=total_cache_creation, cr=total_cache_read, out=total_output,
+        time=fmt_duration(total_elapsed), cost=total_cost,
+    ))
 
     return "\n".join(lines)
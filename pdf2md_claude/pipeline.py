@@ -40,7 +40,7 @@ from pdf2md_claude.claude_api import ClaudeApi
 from pdf2md_claude.converter import ConversionResult, PdfConverter
 from pdf2md_claude.formatter import FormatMarkdownStep
 from pdf2md_claude.images import ImageExtractor, ImageMode
-from pdf2md_claude.markers import IMAGE_AI_DESCRIPTION_BLOCK_RE
+from pdf2md_claude.markers import strip_ai_description_blocks
 from pdf2md_claude.merger import merge_chunks, merge_continued_tables
 from pdf2md_claude.models import DocumentUsageStats, ModelConfig, StageCost
 from pdf2md_claude.table_fixer import FixTablesStep
@@ -173,11 +173,14 @@ class ExtractImagesStep:
     bounding-box regions from the source PDF and injects
     ``![caption](path)`` references into the markdown.
 
-    Skipped when ``ctx.pdf_path`` is ``None``.
+    Skipped when ``ctx.pdf_path`` is ``None``.  *max_workers* is passed
+    to the extractor: ``1`` renders in-process, ``None`` picks a worker
+    count automatically.
     """
 
     image_mode: ImageMode = ImageMode.AUTO
     render_dpi: int | None = None
+    max_workers: int | None = 1
 
     @property
     def name(self) -> str:
@@ -197,6 +200,7 @@ class ExtractImagesStep:
             ctx.pdf_path, images_dir,
             image_mode=self.image_mode,
             render_dpi=self.render_dpi,
+            max_workers=self.max_workers,
         )
         ctx.markdown = extractor.extract_and_inject(ctx.markdown)
 
@@ -223,8 +227,11 @@ class StripAIDescriptionsStep:
         return "strip-ai"
 
     def run(self, ctx: ProcessingContext) -> None:
-        ctx.markdown = IMAGE_AI_DESCRIPTION_BLOCK_RE.sub("", ctx.markdown)
-        ctx.markdown = _CONSECUTIVE_BLANK_LINES_RE.sub("\n\n", ctx.markdown)
+        markdown = strip_ai_description_blocks(ctx.markdown)
+        # Substring pre-check: most documents have no 3+ newline runs.
+        if "\n\n\n" in markdown:
+            markdown = _CONSECUTIVE_BLANK_LINES_RE.sub("\n\n", markdown)
+        ctx.markdown = markdown
 
 
 @dataclass
@@ -325,6 +332,7 @@ class ConversionPipeline:
         system_prompt: str | None = None,
         image_mode: ImageMode = ImageMode.AUTO,
         image_dpi: int | None = None,
+        image_workers: int | None = 1,
         no_images: bool = False,
         strip_ai_descriptions: bool = False,
         no_format: bool = False,
@@ -338,6 +346,7 @@ class ConversionPipeline:
         # Step configuration
         self._image_mode = image_mode
         self._image_dpi = image_dpi
+        self._image_workers = image_workers
         self._no_images = no_images
         self._strip_ai_descriptions = strip_ai_descriptions
         self._no_format = no_format
@@ -376,6 +385,7 @@ class ConversionPipeline:
             steps.append(ExtractImagesStep(
                 image_mode=self._image_mode,
                 render_dpi=self._image_dpi,
+                max_workers=self._image_workers,
             ))
         if self._strip_ai_descriptions:
             steps.append(StripAIDescriptionsStep())
@@ -19,7 +19,7 @@ from typing import TYPE_CHECKING
 
 from pdf2md_claude.claude_api import ClaudeApi, ApiResponse
 from pdf2md_claude.converter import extract_pdf_pages
-from pdf2md_claude.markers import TABLE_BLOCK_RE
+from pdf2md_claude.markers import TABLE_BLOCK_RE, iter_table_blocks
 from pdf2md_claude.models import ModelConfig, calculate_cost
 from pdf2md_claude.prompt import TABLE_FIX_SYSTEM_PROMPT
 from pdf2md_claude.validator import find_table_title, table_page_numbers
@@ -82,9 +82,9 @@ def find_complex_tables(markdown: str) -> list[ComplexTable]:
     """
     complex_tables: list[ComplexTable] = []
 
-    for table_match in TABLE_BLOCK_RE.finditer(markdown):
-        _log.debug("  Scanning table at position %d-%d", table_match.start(), table_match.end())
-        table_html = table_match.group(0)
+    for table_start, table_end in iter_table_blocks(markdown):
+        _log.debug("  Scanning table at position %d-%d", table_start, table_end)
+        table_html = markdown[table_start:table_end]
 
         # Check if table contains colspan or rowspan
         if not _HAS_SPAN_RE.search(table_html):
@@ -93,9 +93,9 @@ def find_complex_tables(markdown: str) -> list[ComplexTable]:
 
         # Resolve page numbers and label
         page_numbers = table_page_numbers(
-            markdown, table_match.start(), table_match.end()
+            markdown, table_start, table_end
         )
-        title = find_table_title(markdown, table_match.start())
+        title = find_table_title(markdown, table_start)
         label = title if title else "HTML table"
 
         _log.debug("    Complex table detected: %s (pages: %s, %d chars)", 
@@ -103,8 +103,8 @@ def find_complex_tables(markdown: str) -> list[ComplexTable]:
 
         complex_tables.append(ComplexTable(
             table_html=table_html,
-            match_start=table_match.start(),
-            match_end=table_match.end(),
+            match_start=table_start,
+            match_end=table_end,
             page_numbers=page_numbers,
             label=label,
         ))
@@ -24,13 +24,16 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 from pdf2md_claude.markers import (
-    IMAGE_AI_DESCRIPTION_BLOCK_RE,
     IMAGE_BEGIN,
+    IMAGE_BLOCK_EVENTS_RE,
     IMAGE_END,
     PAGE_BEGIN,
     PAGE_END,
+    PAGE_MARKERS_RE,
     PAGE_SKIP,
-    TABLE_BLOCK_RE,
+    iter_markers,
+    iter_table_blocks,
+    strip_ai_description_blocks,
 )
 
 _log = logging.getLogger("validator")
@@ -164,7 +167,7 @@ def validate_output(markdown: str) -> ValidationResult:
     check_table_column_consistency(markdown, result)
 
     # Add info message about table validation
-    table_count = len(TABLE_BLOCK_RE.findall(markdown))
+    table_count = sum(1 for _ in iter_table_blocks(markdown))
     if table_count > 0:
         result.info.append(
             f"Tables checked: {table_count} table{'s' if table_count != 1 else ''}"
@@ -183,7 +186,7 @@ def validate_output(markdown: str) -> ValidationResult:
 
 def _count_skipped_pages(markdown: str) -> int:
     """Count pages containing a PDF_PAGE_SKIP marker."""
-    return len(PAGE_SKIP.re.findall(markdown))
+    return PAGE_SKIP.count(markdown)
 
 
 def _check_page_markers(markdown: str, result: ValidationResult) -> None:
@@ -226,8 +229,11 @@ def _check_page_markers(markdown: str, result: ValidationResult) -> None:
 
 def _check_page_end_markers(markdown: str, result: ValidationResult) -> None:
     """Verify that PDF_PAGE_END markers match PDF_PAGE_BEGIN markers."""
-    begin_pages = [int(m) for m in _PAGE_MARKER_RE.findall(markdown)]
-    end_pages = [int(m) for m in _PAGE_END_MARKER_RE.findall(markdown)]
+    begin_pages: list[int] = []
+    end_pages: list[int] = []
+    for marker, value, _ in iter_markers(markdown, PAGE_MARKERS_RE):
+        assert value is not None  # PAGE_BEGIN / PAGE_END are valued
+        (begin_pages if marker is PAGE_BEGIN else end_pages).append(int(value))
 
     if not end_pages:
         if begin_pages:
@@ -277,12 +283,12 @@ def _check_image_block_pairing(markdown: str, result: ValidationResult) -> None:
     begin_count = 0
     end_count = 0
 
-    for line in markdown.splitlines():
-        page_match = _PAGE_MARKER_RE.search(line)
-        if page_match:
-            current_page = int(page_match.group(1))
+    for marker, value, _ in iter_markers(markdown, IMAGE_BLOCK_EVENTS_RE):
+        if marker is PAGE_BEGIN:
+            assert value is not None
+            current_page = int(value)
 
-        if IMAGE_BEGIN.re.search(line):
+        elif marker is IMAGE_BEGIN:
             begin_count += 1
             if in_block:
                 loc = f" (page {open_page})" if open_page else ""
@@ -294,7 +300,7 @@ def _check_image_block_pairing(markdown: str, result: ValidationResult) -> None:
             in_block = True
             open_page = current_page
 
-        if IMAGE_END.re.search(line):
+        else:
             end_count += 1
             if not in_block:
                 result.errors.append((
@@ -515,7 +521,8 @@ def _check_missing_tables(markdown: str, result: ValidationResult) -> None:
         pidx = _PageIndex(markdown)
         # Sort numerically for readability.
         for t in sorted(missing, key=int):
-            pages = sorted({pidx.page_at(p) for p in ref_positions[t]} - {None})
+            found = {pidx.page_at(p) for p in ref_positions[t]}
+            pages = sorted(p for p in found if p is not None)
             page_suffix = (
                 f" (referenced on page {', '.join(str(p) for p in pages)})"
                 if pages else ""
@@ -545,7 +552,8 @@ def _check_missing_figures(markdown: str, result: ValidationResult) -> None:
         pidx = _PageIndex(markdown)
         # Sort numerically for readability.
         for f in sorted(missing, key=int):
-            pages = sorted({pidx.page_at(p) for p in ref_positions[f]} - {None})
+            found = {pidx.page_at(p) for p in ref_positions[f]}
+            pages = sorted(p for p in found if p is not None)
             page_suffix = (
                 f" (referenced on page {', '.join(str(p) for p in pages)})"
                 if pages else ""
@@ -698,8 +706,8 @@ def check_table_column_consistency(
     capped at :data:`_MAX_COLUMN_WARNINGS_PER_TABLE` per table.
     """
     pidx: _PageIndex | None = None
-    for table_match in TABLE_BLOCK_RE.finditer(markdown):
-        table_html = table_match.group(0)
+    for table_start, table_end in iter_table_blocks(markdown):
+        table_html = markdown[table_start:table_end]
 
         # --- compute per-section column counts -------------------------
         thead_m = _THEAD_RE.search(table_html)
@@ -728,11 +736,11 @@ def check_table_column_consistency(
         expected = _deterministic_mode(all_counts)
 
         # --- resolve table label and page ------------------------------
-        title = _find_table_title(markdown, table_match.start())
+        title = _find_table_title(markdown, table_start)
         label = title if title else "HTML table"
         if pidx is None:
             pidx = _PageIndex(markdown)
-        page_suffix = pidx.format_page(table_match.start())
+        page_suffix = pidx.format_page(table_start)
 
         # --- header-vs-body width diagnostic ---------------------------
         # Compare the predominant widths of thead and tbody directly.
@@ -791,18 +799,18 @@ def _check_binary_sequences(markdown: str, result: ValidationResult) -> None:
     jumps indicate Claude misread the PDF.
     """
     pidx: _PageIndex | None = None
-    for table_match in TABLE_BLOCK_RE.finditer(markdown):
-        table_html = table_match.group(0)
+    for table_start, table_end in iter_table_blocks(markdown):
+        table_html = markdown[table_start:table_end]
         bin_values = _BINARY_IN_TD_RE.findall(table_html)
 
         if len(bin_values) < 2:
             continue
 
         # Resolve table context (title + page) once per table.
-        title = _find_table_title(markdown, table_match.start())
+        title = _find_table_title(markdown, table_start)
         if pidx is None:
             pidx = _PageIndex(markdown)
-        page_suffix = pidx.format_page(table_match.start())
+        page_suffix = pidx.format_page(table_start)
         label = title if title else "HTML table"
 
         # Convert to integers for comparison.
@@ -919,7 +927,7 @@ def _significant_words(text: str, min_length: int = 5) -> set[str]:
     # Remove AI-generated image descriptions (not from PDF source).
     # Must run before the generic HTML comment strip because the
     # description block is delimited by HTML comment markers.
-    text = IMAGE_AI_DESCRIPTION_BLOCK_RE.sub(" ", text)
+    text = strip_ai_description_blocks(text, " ")
     # Remove HTML comments (includes page markers).
     text = re.sub(r"<!--.*?-->", " ", text, flags=re.DOTALL)
     # Remove HTML tags.
@@ -1043,7 +1051,7 @@ def check_page_fidelity(
 
         for page_num, md_content in sorted(page_contents.items()):
             # Skip pages with PAGE_SKIP marker.
-            if PAGE_SKIP.re.search(md_content):
+            if PAGE_SKIP.contains(md_content):
                 continue
 
             # Extract significant words from markdown.
@@ -85,6 +85,7 @@ class TestConvertArgs:
         assert args.max_pages is None
         assert args.rules is None
         assert args.no_images is False
+        assert args.image_dpi is None
         assert args.strip_ai_descriptions is False
 
     def test_requires_at_least_one_pdf(self):
@@ -1,8 +1,16 @@
 """Unit tests for converter, merger, validator, and prompts."""
 
+import base64
+
+import pymupdf
 import pytest
 
-from pdf2md_claude.converter import _get_context_tail, _remap_page_markers
+from pdf2md_claude.converter import (
+    _Thousands,
+    _get_context_tail,
+    _remap_page_markers,
+    extract_pdf_pages,
+)
 from pdf2md_claude.markers import PAGE_BEGIN, PAGE_END
 from pdf2md_claude.merger import merge_chunks
 from pdf2md_claude.prompt import (
@@ -500,3 +508,63 @@ class TestMergeChunks:
         result = merge_chunks(["Hello", "World"])
         assert "Hello" in result
         assert "World" in result
+
+
+# ---------------------------------------------------------------------------
+# 7. extract_pdf_pages
+# ---------------------------------------------------------------------------
+
+
+def _write_pdf(path, num_pages: int) -> None:
+    """Write a PDF with *num_pages* pages, each labelled with its number."""
+    doc = pymupdf.open()
+    for i in range(1, num_pages + 1):
+        page = doc.new_page()
+        page.insert_text((72, 72), f"Page {i}")
+    doc.save(str(path))
+    doc.close()
+
+
+def _decode_pages(pdf_b64: str) -> list[str]:
+    """Decode base64 PDF and return the stripped text of each page."""
+    doc = pymupdf.open(stream=base64.standard_b64decode(pdf_b64), filetype="pdf")
+    try:
+        return [page.get_text().strip() for page in doc]
+    finally:
+        doc.close()
+
+
+class TestExtractPdfPages:
+    """Tests for extract_pdf_pages() in converter.py."""
+
+    def test_extracts_requested_range(self, tmp_path):
+        """Only the requested pages are present, in order."""
+        pdf = tmp_path / "doc.pdf"
+        _write_pdf(pdf, 5)
+        assert _decode_pages(extract_pdf_pages(pdf, 2, 4)) == [
+            "Page 2", "Page 3", "Page 4",
+        ]
+
+    def test_end_clamped_to_document(self, tmp_path):
+        """A page_end past the last page is clamped."""
+        pdf = tmp_path / "doc.pdf"
+        _write_pdf(pdf, 3)
+        assert _decode_pages(extract_pdf_pages(pdf, 3, 10)) == ["Page 3"]
+
+    def test_empty_range_raises(self, tmp_path):
+        """A range entirely past the end of the document is rejected."""
+        pdf = tmp_path / "doc.pdf"
+        _write_pdf(pdf, 2)
+        with pytest.raises(ValueError):
+            extract_pdf_pages(pdf, 5, 6)
+
+
+class TestThousands:
+    """Tests for the lazy _Thousands logging argument."""
+
+    def test_formats_with_separators(self):
+        assert str(_Thousands(1234567)) == "1,234,567"
+
+    def test_percent_formatting(self):
+        """Works as a ``%s`` logging argument."""
+        assert "%s tokens" % _Thousands(12000) == "12,000 tokens"
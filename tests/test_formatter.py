@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import pytest
 
+from pdf2md_claude import formatter
 from pdf2md_claude.formatter import FormatMarkdownStep, format_markdown, prettify_table
 
 
@@ -165,6 +166,125 @@ class TestPrettifyTable:
         assert "A &amp; B" in result
         assert "1 &lt; 2" in result
 
+    def test_repeated_table_served_from_cache(self) -> None:
+        """Identical table HTML is only parsed once."""
+        html = "<table>\n<tr><td>cached</td></tr>\n</table>"
+        formatter._prettify_table_cached.cache_clear()
+        first = prettify_table(html)
+        assert prettify_table(html) == first
+        info = formatter._prettify_table_cached.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
+    def test_oversize_table_bypasses_cache(self, monkeypatch) -> None:
+        """Tables above the size limit are prettified without caching."""
+        monkeypatch.setattr(formatter, "_PRETTIFY_CACHE_MAX_LEN", 10)
+        formatter._prettify_table_cached.cache_clear()
+        html = "<table>\n<tr><td>big</td></tr>\n</table>"
+        assert "    <td>big</td>" in prettify_table(html)
+        assert formatter._prettify_table_cached.cache_info().currsize == 0
+
+    def test_prettifier_reused_without_leaking_state(self) -> None:
+        """The per-thread prettifier is reused and reset between tables."""
+        assert formatter._get_prettifier() is formatter._get_prettifier()
+        formatter._prettify_table_cached.cache_clear()
+        # Unclosed cell/row in the first table must not affect the second.
+        prettify_table("<table>\n<tr><td>open")
+        assert prettify_table("<table>\n<tr><td>A</td></tr>\n</table>") == (
+            "<table>\n"
+            "  <tr>\n"
+            "    <td>A</td>\n"
+            "  </tr>\n"
+            "</table>"
+        )
+
+    def test_flat_table_fast_path_matches_general(self) -> None:
+        """Flat tables take the fast path with identical output."""
+        html = (
+            '<table class="t">\n'
+            '<tr><th>A</th><th colspan="2">B</th></tr>\n'
+            "<tr><td>1<br>x</td><td>2\n3</td><td>&amp;</td></tr>\n"
+            "</table>"
+        )
+        fast = formatter._prettify_table_fast(html)
+        assert fast is not None
+        assert fast == formatter._TablePrettifier().prettify(html)
+
+    @pytest.mark.parametrize("html", [
+        "<table>\n<thead><tr><th>A</th></tr></thead>\n</table>",
+        "<table>\n<tr><td><em>A</em></td></tr>\n</table>",
+        "<table>\n<tr><td>A</td></tr>\n<!-- PDF_PAGE_END 1 -->\n</table>",
+        "<table>\n<tr><td>A</td>\n</table>",
+        "<table>\nstray<tr><td>A</td></tr>\n</table>",
+    ])
+    def test_non_flat_table_falls_back(self, html: str) -> None:
+        """Anything beyond plain rows of cells uses the general parser."""
+        assert formatter._prettify_table_fast(html) is None
+
+    def test_unclosed_cell_has_no_trailing_whitespace(self) -> None:
+        """A cell flushed before its end tag is still right-stripped."""
+        html = "<table>\n<tr><td>A  <td>B</td></tr>\n</table>"
+        for line in prettify_table(html).splitlines():
+            assert line == line.rstrip()
+
+    @pytest.mark.parametrize("sep", ["\n", "\r\n", "\r"])
+    def test_cell_line_breaks_become_spaces(self, sep: str) -> None:
+        """Line breaks of any style inside a cell become spaces."""
+        for html in (
+            f"<table>\n<tr><td>a{sep}b</td></tr>\n</table>",
+            f"<table>\n<tr><td>a{sep}<em>b</em></td></tr>\n</table>",
+        ):
+            result = prettify_table(html)
+            assert "\r" not in result
+            assert "<td>a" + " " * len(sep) in result
+
+    def test_quoted_gt_in_attribute(self) -> None:
+        """A ``>`` inside a quoted attribute value does not end the tag."""
+        html = '<table>\n<tr><td title="a > b">X</td></tr>\n</table>'
+        result = prettify_table(html)
+        assert '    <td title="a > b">X</td>' in result
+
+    @pytest.mark.parametrize(("td", "expected"), [
+        ("<td colspan=2>", '<td colspan="2">'),
+        ("<td class='x'>", '<td class="x">'),
+        ('<TD COLSPAN="2" RowSpan=3>', '<td colspan="2" rowspan="3">'),
+        ('<td  colspan="2"\n  nowrap>', '<td colspan="2" nowrap>'),
+        ('<td title="a &amp; b">', '<td title="a & b">'),
+    ])
+    def test_attributes_normalized(self, td: str, expected: str) -> None:
+        """Attribute names are lowercased and values re-quoted with ``"``."""
+        for html in (
+            f"<table>\n<tr>{td}A</td></tr>\n</table>",
+            f"<table>\n<tbody><tr>{td}A</td></tr></tbody>\n</table>",
+        ):
+            assert f"    {expected}A</td>" in prettify_table(html)
+
+    def test_unterminated_quote_is_text(self) -> None:
+        """A tag with an unterminated quoted value is kept as text."""
+        html = '<table>\n<tr><td>A</td><td title="oops>B</td></tr>\n</table>'
+        result = prettify_table(html)
+        assert '<td title="oops>B</td></tr>' in result
+
+    def test_bare_less_than_is_text(self) -> None:
+        """A ``<`` that does not start a tag is kept as cell text."""
+        html = "<table>\n<tr><td>1 < 2</td></tr>\n</table>"
+        assert "    <td>1 < 2</td>" in prettify_table(html)
+
+    def test_uppercase_tags_lowercased(self) -> None:
+        """Tag names are normalized to lowercase."""
+        html = "<TABLE>\n<TR><TD>A</TD></TR>\n</TABLE>"
+        assert prettify_table(html) == (
+            "<table>\n"
+            "  <tr>\n"
+            "    <td>A</td>\n"
+            "  </tr>\n"
+            "</table>"
+        )
+
+    def test_self_closing_normalized(self) -> None:
+        """``<br/>`` is normalized to ``<br />``."""
+        html = "<table>\n<tr><td>a<br/>b</td></tr>\n</table>"
+        assert "<td>a<br />b</td>" in prettify_table(html)
+
 
 # ---------------------------------------------------------------------------
 # format_markdown: full pipeline
@@ -198,6 +318,24 @@ class TestFormatMarkdown:
         result = format_markdown(md)
         assert result.count("  <tr>") == 2
 
+    def test_table_not_at_line_start_untouched(self) -> None:
+        """Only tables starting at the beginning of a line are prettified."""
+        md = "Inline <table><tr><td>A</td></tr></table> text.\n"
+        assert format_markdown(md) == md
+
+    def test_unclosed_table_untouched(self) -> None:
+        """A ``<table>`` without a closing tag is left as-is."""
+        md = "<table>\n<tr><td>A</td></tr>\n"
+        assert format_markdown(md) == md
+
+    def test_oversize_table_passed_through(self, monkeypatch, caplog) -> None:
+        """Tables above the size cap are left unformatted with a warning."""
+        monkeypatch.setattr(formatter, "_MAX_TABLE_CHARS", 10)
+        md = "<table>\n<tr><td>A</td></tr>\n</table>\n"
+        with caplog.at_level("WARNING", logger="formatter"):
+            assert format_markdown(md) == md
+        assert "oversize table" in caplog.text
+
     def test_trailing_whitespace_stripped(self) -> None:
         """Trailing spaces on lines are removed."""
         md = "Hello   \nWorld  \n"
@@ -211,6 +349,11 @@ class TestFormatMarkdown:
         result = format_markdown(md)
         assert "A\n\nB\n" == result
 
+    def test_whitespace_only_lines_collapsed(self) -> None:
+        """Blank lines containing only spaces/tabs count toward the run."""
+        md = "A  \n \n\t\nB\n"
+        assert format_markdown(md) == "A\n\nB\n"
+
     def test_single_trailing_newline(self) -> None:
         """Output always ends with exactly one newline."""
         assert format_markdown("text") == "text\n"
@@ -271,6 +414,16 @@ class TestFormatMarkdown:
         """Empty input returns single newline."""
         assert format_markdown("") == "\n"
 
+    def test_already_formatted_returned_unchanged(self) -> None:
+        """Clean text takes the fast path and comes back as-is."""
+        md = "# Title\n\nParagraph.\n"
+        assert format_markdown(md) is md
+
+    def test_fast_path_fixes_trailing_newlines(self) -> None:
+        """The fast path still normalizes the final newline."""
+        assert format_markdown("Para.\n\n") == "Para.\n"
+        assert format_markdown("Para.") == "Para.\n"
+
     def test_no_tables_passthrough(self) -> None:
         """Content without tables is only lightly normalized."""
         md = "# Title\n\nParagraph.\n\n- item 1\n- item 2\n"
@@ -291,6 +444,10 @@ class TestFormatMarkdownStep:
         step = FormatMarkdownStep()
         assert step.name == "format markdown"
 
+    def test_step_has_no_instance_dict(self) -> None:
+        """The step is a slotted dataclass."""
+        assert not hasattr(FormatMarkdownStep(), "__dict__")
+
     def test_step_modifies_context_markdown(self) -> None:
         """Step replaces ctx.markdown with formatted version."""
         from dataclasses import dataclass, field
@@ -1,5 +1,6 @@
 """Unit tests for the images module (IMAGE_RECT parsing, rendering, injection)."""
 
+import os
 import re
 from unittest.mock import MagicMock, patch
 
@@ -7,16 +8,36 @@ import pymupdf
 import pytest
 
 from pdf2md_claude.images import (
+    ImageExtractor,
+    ImageMode,
     ImageRect,
     PageRaster,
+    RenderedImage,
+    _compute_padded_clips,
     _compute_render_dpi,
     _extract_native,
+    _full_page_pixmap,
+    _load_page,
+    _match_page_blocks,
     _match_rasters_to_blocks,
+    _MAX_RENDER_SIDE_PX,
+    _page_rasters,
+    _pixmap_to_png,
+    _plan_single_block,
+    _region_dpi,
+    _region_ext,
+    _region_pixmap,
+    _render_debug_variants,
     _render_region,
     _RENDER_DPI,
+    _write_file,
     inject_image_refs,
     parse_image_rects,
+    render_and_save,
+    render_and_save_parallel,
     render_image_rects,
+    render_image_rects_parallel,
+    save_images,
 )
 from pdf2md_claude.markers import (
     IMAGE_FILENAME_EXAMPLE,
@@ -80,6 +101,21 @@ class TestImageRectRegex:
         m = IMAGE_RECT.re_value.search(marker)
         assert m is None
 
+    @pytest.mark.parametrize("coords", [
+        "0.1.2,0.2,0.8,0.9",
+        "0.1,..,0.8,0.9",
+        "0.....,0.....,0.....,0.....",
+    ])
+    def test_no_match_on_malformed_coords(self, coords):
+        """Coordinates that float() would reject do not match."""
+        m = IMAGE_RECT.re_value.search(f"<!-- IMAGE_RECT {coords} -->")
+        assert m is None
+
+    def test_matches_bare_decimal_point(self):
+        m = IMAGE_RECT.re_value.search("<!-- IMAGE_RECT .5,0,1.,1 -->")
+        assert m is not None
+        assert [float(g) for g in m.groups()] == [0.5, 0.0, 1.0, 1.0]
+
 
 # ---------------------------------------------------------------------------
 # IMAGE_RECT
@@ -340,6 +376,21 @@ class TestParseImageRects:
         assert rects[0].page_num == 10
         assert rects[1].page_num == 10
 
+    def test_caption_whitespace_and_crlf(self):
+        """Caption lines are matched after stripping surrounding whitespace."""
+        md = (
+            "<!-- PDF_PAGE_BEGIN 2 -->\r\n"
+            "<!-- IMAGE_BEGIN -->\r\n"
+            "<!-- IMAGE_RECT 0.1,0.2,0.9,0.8 -->\r\n"
+            "  **Figure 4: Timing**\t\r\n"
+            "**Not the caption**\r\n"
+            "<!-- IMAGE_END -->\r\n"
+        )
+        rects = parse_image_rects(md)
+        assert len(rects) == 1
+        assert rects[0].page_num == 2
+        assert rects[0].caption == "Figure 4: Timing"
+
 
 # ---------------------------------------------------------------------------
 # inject_image_refs()
@@ -414,6 +465,19 @@ class TestInjectImageRefs:
         assert "![Figure 2: Data flow](out.images/img_p003_01.png)" in result
         assert "![Figure 3: Results chart](out.images/img_p004_01.png)" in result
 
+    def test_inline_bold_is_not_a_caption(self):
+        """Only a line that is bold end to end counts as the caption."""
+        md = _SAMPLE_MD_SINGLE.replace(
+            "**Figure 1: Architecture diagram**",
+            "Some **inline** text\n  **Figure 1: Architecture diagram**  ",
+        )
+        image_map = {1: ["img_p001_01.png"]}
+        lines = inject_image_refs(md, image_map, "test.images").split("\n")
+        ref = lines.index(
+            "![Figure 1: Architecture diagram](test.images/img_p001_01.png)"
+        )
+        assert lines[ref - 2] == "  **Figure 1: Architecture diagram**  "
+
     def test_no_image_map_returns_unchanged(self):
         result = inject_image_refs(_SAMPLE_MD_SINGLE, {}, "test.images")
         assert result == _SAMPLE_MD_SINGLE
@@ -478,6 +542,33 @@ class TestInjectImageRefs:
         assert "![Figure 1: No rect](test.images/img_p001_01.png)" in result2
 
 
+    def test_text_outside_blocks_untouched(self):
+        """Text around blocks, including CRLF and trailing newlines, is kept."""
+        md = (
+            "intro\r\n\n"
+            + _SAMPLE_MD_SINGLE
+            + "\n\ntrailing text\n\n"
+        )
+        image_map = {1: ["img_p001_01.png"]}
+        result = inject_image_refs(md, image_map, "test.images")
+        assert result.startswith("intro\r\n\n<!-- PDF_PAGE_BEGIN 1 -->")
+        assert result.endswith("<!-- PDF_PAGE_END 1 -->\n\ntrailing text\n\n")
+        assert result.count("img_p001_01.png") == 1
+
+    def test_no_image_blocks_returns_input(self):
+        md = "<!-- PDF_PAGE_BEGIN 1 -->\n**Bold**\n<!-- PDF_PAGE_END 1 -->"
+        image_map = {1: ["img_p001_01.png"]}
+        assert inject_image_refs(md, image_map, "test.images") is md
+
+    def test_unclosed_block_passed_through(self):
+        md = (
+            "<!-- PDF_PAGE_BEGIN 1 -->\n"
+            "<!-- IMAGE_BEGIN -->\n"
+            "**Figure 1**\n"
+        )
+        image_map = {1: ["img_p001_01.png"]}
+        assert inject_image_refs(md, image_map, "test.images") == md
+
 # ---------------------------------------------------------------------------
 # _compute_render_dpi()
 # ---------------------------------------------------------------------------
@@ -497,16 +588,49 @@ class TestComputeRenderDpi:
         assert _compute_render_dpi(150) == 150
 
 
+# ---------------------------------------------------------------------------
+# _compute_padded_clips()
+# ---------------------------------------------------------------------------
+
+
+class TestComputePaddedClips:
+    """Tests for normalized → absolute clip conversion."""
+
+    def test_pads_and_scales(self):
+        page = MagicMock()
+        page.rect = pymupdf.Rect(0, 0, 200, 100)
+        blocks = [ImageRect(page_num=1, x0=0.25, y0=0.5, x1=0.75, y1=0.75)]
+        (clip,) = _compute_padded_clips(blocks, page)
+        assert clip.x0 == pytest.approx(48)
+        assert clip.y0 == pytest.approx(49)
+        assert clip.x1 == pytest.approx(152)
+        assert clip.y1 == pytest.approx(76)
+
+    def test_clamps_to_page(self):
+        page = MagicMock()
+        page.rect = pymupdf.Rect(0, 0, 200, 100)
+        blocks = [
+            ImageRect(page_num=1, x0=0.0, y0=0.0, x1=1.0, y1=1.0),
+            ImageRect(page_num=1, x0=-0.5, y0=0.2, x1=1.5, y1=0.3),
+        ]
+        clips = _compute_padded_clips(blocks, page)
+        assert tuple(clips[0]) == (0, 0, 200, 100)
+        assert clips[1].x0 == 0
+        assert clips[1].x1 == 200
+
+
 # ---------------------------------------------------------------------------
 # _match_rasters_to_blocks()
 # ---------------------------------------------------------------------------
 
 
-def _make_raster(x0, y0, x1, y1, xref=1, smask=0, width=100, height=100):
+def _make_raster(
+    x0, y0, x1, y1, xref=1, smask=0, width=100, height=100, stream_filter="",
+):
     """Helper to create a PageRaster with given placement rect."""
     return PageRaster(
         xref=xref, smask=smask, width=width, height=height,
-        rect=pymupdf.Rect(x0, y0, x1, y1),
+        rect=pymupdf.Rect(x0, y0, x1, y1), stream_filter=stream_filter,
     )
 
 
@@ -551,6 +675,63 @@ class TestMatchRastersToBlocks:
         result = _match_rasters_to_blocks([r], [clip])
         assert result[0] == []
 
+    def test_touching_edges_not_included(self):
+        """Rects sharing only an edge have zero overlap area."""
+        r = _make_raster(100, 0, 200, 100, xref=7)
+        clip = pymupdf.Rect(0, 0, 100, 100)
+        result = _match_rasters_to_blocks([r], [clip])
+        assert result[0] == []
+
+    def test_matches_pairwise_overlap_area(self):
+        """Result agrees with ``Rect.intersects`` for every pair."""
+        rasters = [
+            _make_raster(x, y, x + 120, y + 80, xref=i)
+            for i, (x, y) in enumerate(
+                (x, y) for x in range(0, 500, 70) for y in range(0, 700, 90)
+            )
+        ]
+        clips = [
+            pymupdf.Rect(x, y, x + 150, y + 150)
+            for x in range(0, 450, 110) for y in range(0, 650, 130)
+        ]
+        result = _match_rasters_to_blocks(rasters, clips)
+        for bi, clip in enumerate(clips):
+            expected = [r for r in rasters if clip.intersects(r.rect)]
+            assert result[bi] == expected
+
+    def test_small_page_matches_dense_page(self, monkeypatch):
+        """The sweep-line path and the plain scan agree."""
+        from pdf2md_claude import images
+
+        rasters = [
+            _make_raster(x, 0, x + 60, 60, xref=i)
+            for i, x in enumerate(range(900, -1, -50))
+        ]
+        clips = [pymupdf.Rect(x, 10, x + 100, 50) for x in range(0, 1000, 75)]
+        dense = _match_rasters_to_blocks(rasters, clips)
+        monkeypatch.setattr(images, "_RASTER_INDEX_MIN_PAIRS", 10**9)
+        assert _match_rasters_to_blocks(rasters, clips) == dense
+
+    def test_sweep_handles_nested_and_degenerate_clips(self, monkeypatch):
+        """A narrow clip inside a wide one still sees its rasters."""
+        from pdf2md_claude import images
+
+        monkeypatch.setattr(images, "_RASTER_INDEX_MIN_PAIRS", 0)
+        rasters = [
+            _make_raster(10, 10, 40, 40, xref=1),
+            _make_raster(300, 10, 340, 40, xref=2),
+            _make_raster(120, 10, 160, 40, xref=3),
+        ]
+        clips = [
+            pymupdf.Rect(0, 0, 400, 50),    # spans all three
+            pymupdf.Rect(100, 0, 200, 50),  # starts later, ends earlier
+            pymupdf.Rect(150, 0, 140, 50),  # degenerate
+        ]
+        result = _match_rasters_to_blocks(rasters, clips)
+        assert [r.xref for r in result[0]] == [1, 2, 3]
+        assert [r.xref for r in result[1]] == [3]
+        assert result[2] == []
+
 
 # ---------------------------------------------------------------------------
 # Multi-format filenames
@@ -642,6 +823,85 @@ class TestExtractNative:
         assert result is not None
         assert result[1] == "png"
 
+    def test_cache_extracts_each_xref_once(self):
+        """Repeated placements of one xref hit the cache."""
+        doc = MagicMock()
+        doc.extract_image.return_value = {"image": b"LOGO", "ext": "png"}
+        cache = {}
+        a = _make_raster(0, 0, 50, 50, xref=7)
+        b = _make_raster(0, 500, 50, 550, xref=7)
+        assert _extract_native(doc, a, cache) == (b"LOGO", "png")
+        assert _extract_native(doc, b, cache) == (b"LOGO", "png")
+        doc.extract_image.assert_called_once_with(7)
+
+    def test_cache_remembers_failures(self):
+        doc = MagicMock()
+        doc.extract_image.return_value = None
+        cache = {}
+        raster = _make_raster(0, 0, 50, 50, xref=8)
+        assert _extract_native(doc, raster, cache) is None
+        assert _extract_native(doc, raster, cache) is None
+        doc.extract_image.assert_called_once_with(8)
+
+    def test_smask_skips_extract_image(self):
+        """Compositing reads pixmaps directly, not the encoded bytes."""
+        doc = MagicMock()
+        raster = _make_raster(0, 0, 100, 100, xref=10, smask=20)
+        with patch("pdf2md_claude.images.pymupdf") as mock_pymupdf:
+            mock_pymupdf.Pixmap.side_effect = RuntimeError("bad image")
+            assert _extract_native(doc, raster) is None
+        doc.extract_image.assert_not_called()
+
+    def test_max_pixels_skips_oversized_native(self):
+        """Rasters above the pixel cap are not decoded at all."""
+        doc = MagicMock()
+        raster = _make_raster(0, 0, 72, 72, xref=3, width=4000, height=4000)
+        assert _extract_native(doc, raster, max_pixels=600 * 600) is None
+        doc.extract_image.assert_not_called()
+
+    def test_max_pixels_keeps_right_sized_native(self):
+        doc = MagicMock()
+        doc.extract_image.return_value = {"image": b"JPEG", "ext": "jpeg"}
+        raster = _make_raster(0, 0, 72, 72, xref=3, width=600, height=600)
+        assert _extract_native(doc, raster, max_pixels=600 * 600) == (
+            b"JPEG", "jpeg",
+        )
+
+    def test_plan_caps_native_at_explicit_dpi(self):
+        """With cap_native, a 4000 px raster on a 1-inch rect is rendered."""
+        doc = MagicMock()
+        doc.extract_image.return_value = {"image": b"BIG", "ext": "jpeg"}
+        raster = _make_raster(0, 0, 72, 72, xref=3, width=4000, height=4000)
+        clip = pymupdf.Rect(0, 0, 100, 100)
+        plan = _plan_single_block(
+            doc, clip, [raster], [raster], ImageMode.AUTO, 300,
+            cap_native=True,
+        )
+        assert plan == raster.rect
+        plan = _plan_single_block(
+            doc, clip, [raster], [raster], ImageMode.AUTO, 300,
+        )
+        assert plan == (b"BIG", "jpeg")
+
+    def test_native_block_is_never_rendered(self, tmp_path, monkeypatch):
+        """A single matched raster is copied out without any page render."""
+        pdf_path = tmp_path / "doc.pdf"
+        _write_pdf(pdf_path, 1)
+        monkeypatch.setattr(
+            pymupdf.Page, "get_pixmap",
+            MagicMock(side_effect=AssertionError("page was rendered")),
+        )
+        doc = pymupdf.open(str(pdf_path))
+        try:
+            xref = doc[0].get_images()[0][0]
+            stored = doc.extract_image(xref)
+            result = render_image_rects(doc, _SAMPLE_RECTS[1:2])
+        finally:
+            doc.close()
+        assert len(result) == 1
+        assert result[0].image_bytes == stored["image"]
+        assert result[0].filename.endswith("." + stored["ext"])
+
     def test_high_dpi_native_still_extracted(self):
         """High-DPI native image (600 DPI) → still extracted natively.
 
@@ -684,27 +944,182 @@ class TestRenderRegion:
         assert img_bytes == b"\x89PNG_DATA"
         page.get_pixmap.assert_called_once()
 
-    def test_cmyk_converted_to_rgb(self):
-        """CMYK pixmap (n - alpha > 3) → converted to RGB then PNG."""
-        page = MagicMock()
-        cmyk_pix = MagicMock()
-        cmyk_pix.n = 5  # CMYK + alpha
-        cmyk_pix.alpha = 1  # 5 - 1 = 4 > 3 → CMYK
-        page.get_pixmap.return_value = cmyk_pix
+    def test_requests_rgb_from_mupdf(self):
+        """Regions are rasterized straight to RGB, no conversion pass."""
+        page = _mock_page()
+        _render_region(page, pymupdf.Rect(0, 0, 100, 100), 150)
+        kwargs = page.get_pixmap.call_args.kwargs
+        assert kwargs["colorspace"] is pymupdf.csRGB
+        assert kwargs["alpha"] is False
+
+    def test_cmyk_page_renders_rgb_png(self):
+        doc = pymupdf.open()
+        page = doc.new_page(width=100, height=100)
+        page.draw_rect(page.rect, fill=(0, 0, 0, 1), color=None)  # CMYK
+        img_bytes, _ = _render_region(page, page.rect, 72)
+        pix = pymupdf.Pixmap(img_bytes)
+        assert (pix.n, pix.alpha) == (3, 0)
+        doc.close()
+
+    def test_large_region_rendered_at_capped_dpi(self):
+        """A region too large at the requested DPI is scaled down to fit."""
+        page = _mock_page()
+        clip = pymupdf.Rect(0, 0, 612, 792)     # Letter page, 11 in tall
+        _render_region(page, clip, 600)
+        dpi = page.get_pixmap.call_args.kwargs["dpi"]
+        assert dpi == _region_dpi(clip, 600) < 600
+        assert 792 * dpi / 72 <= _MAX_RENDER_SIDE_PX
+
+    def test_capped_region_not_cropped_from_page_pixmap(self):
+        page = _mock_page()
+        page_pix = MagicMock()
+        clip = pymupdf.Rect(0, 0, 612, 792)
+        _render_region(page, clip, 600, page_pix)
+        page.get_pixmap.assert_called_once()
 
-        with patch("pdf2md_claude.images.pymupdf") as mock_pymupdf:
-            rgb_pix = MagicMock()
-            rgb_pix.n = 3
-            rgb_pix.alpha = 0
-            rgb_pix.tobytes.return_value = b"RGB_PNG"
-            mock_pymupdf.Pixmap.return_value = rgb_pix
-            mock_pymupdf.csRGB = pymupdf.csRGB
+    @pytest.mark.parametrize(
+        ("stream_filter", "smask", "expected"),
+        [
+            ("DCTDecode", 0, "jpeg"),
+            ("JPXDecode", 0, "jpeg"),
+            ("FlateDecode", 0, "png"),
+            ("DCTDecode", 9, "png"),     # masked: needs transparency
+        ],
+    )
+    def test_region_ext(self, stream_filter, smask, expected):
+        raster = _make_raster(
+            0, 0, 10, 10, smask=smask, stream_filter=stream_filter,
+        )
+        assert _region_ext([raster]) == expected
+
+    def test_region_ext_png_for_composites_and_vectors(self):
+        photo = _make_raster(0, 0, 10, 10, stream_filter="DCTDecode")
+        assert _region_ext([photo, photo]) == "png"
+        assert _region_ext([]) == "png"
+
+    def test_snap_of_jpeg_raster_renders_jpeg(self, tmp_path):
+        pdf_path = tmp_path / "photo.pdf"
+        doc = pymupdf.open()
+        page = doc.new_page(width=200, height=200)
+        pix = pymupdf.Pixmap(pymupdf.csRGB, pymupdf.IRect(0, 0, 40, 40))
+        pix.set_rect(pix.irect, (200, 120, 40))
+        page.insert_image(
+            pymupdf.Rect(10, 10, 110, 90), stream=pix.tobytes("jpeg"),
+        )
+        doc.save(str(pdf_path))
+        doc.close()
+
+        rects = [ImageRect(page_num=1, x0=0.1, y0=0.1, x1=0.5, y1=0.4)]
+        doc = pymupdf.open(str(pdf_path))
+        try:
+            rendered = render_image_rects(doc, rects, ImageMode.SNAP, 72)
+            saved = render_and_save(
+                doc, rects, tmp_path / "out", ImageMode.SNAP, 72,
+            )
+        finally:
+            doc.close()
+        assert rendered[0].filename == "img_p001_01.jpeg"
+        assert rendered[0].image_bytes[:3] == b"\xff\xd8\xff"
+        assert saved == {1: ["img_p001_01.jpeg"]}
+        assert (tmp_path / "out" / "img_p001_01.jpeg").read_bytes() == (
+            rendered[0].image_bytes
+        )
 
-            from pdf2md_claude.images import _render_region as fn
-            img_bytes, ext = fn(page, pymupdf.Rect(0, 0, 100, 100), 150)
+    def test_small_region_keeps_requested_dpi(self):
+        clip = pymupdf.Rect(0, 0, 72, 72)
+        assert _region_dpi(clip, 600) == 600
 
-        assert ext == "png"
-        assert img_bytes == b"RGB_PNG"
+    def test_cmyk_xref_pixmap_converted_to_rgb(self):
+        """Pixmaps built from image xrefs can still be CMYK."""
+        cmyk = pymupdf.Pixmap(pymupdf.csCMYK, pymupdf.IRect(0, 0, 4, 4), 1)
+        pix = pymupdf.Pixmap(_pixmap_to_png(cmyk))
+        assert (pix.n, pix.alpha) == (4, 1)
+
+
+# ---------------------------------------------------------------------------
+# _render_debug_variants()
+# ---------------------------------------------------------------------------
+
+
+def _mock_page():
+    page = MagicMock()
+    pix = MagicMock()
+    pix.n = 3
+    pix.alpha = 0
+    pix.tobytes.return_value = b"\x89PNG"
+    page.get_pixmap.return_value = pix
+    return page
+
+
+class TestRenderDebugVariants:
+    """Tests for render deduplication across debug variants."""
+
+    def test_no_rasters_renders_clip_once(self):
+        page = _mock_page()
+        clip = pymupdf.Rect(0, 0, 100, 100)
+        ir = ImageRect(page_num=1, x0=0, y0=0, x1=0.5, y1=0.5)
+        variants = _render_debug_variants(MagicMock(), page, clip, ir, [], 72)
+        assert [v[0] for v in variants] == ["auto", "snap", "bbox"]
+        assert page.get_pixmap.call_count == 1
+
+    def test_native_fallback_renders_snap_once(self):
+        page = _mock_page()
+        doc = MagicMock()
+        doc.extract_image.return_value = None
+        clip = pymupdf.Rect(0, 0, 100, 100)
+        ir = ImageRect(page_num=1, x0=0, y0=0, x1=0.5, y1=0.5)
+        raster = _make_raster(10, 10, 90, 90)
+        _render_debug_variants(doc, page, clip, ir, [raster], 72)
+        # snap rect (shared by auto fallback and snap) + bbox clip.
+        assert page.get_pixmap.call_count == 2
+
+    def test_auto_variant_applies_native_cap(self):
+        """The auto variant falls back to a render exactly like AUTO mode."""
+        page = _mock_page()
+        doc = MagicMock()
+        doc.extract_image.return_value = {"image": b"BIG", "ext": "jpeg"}
+        clip = pymupdf.Rect(0, 0, 100, 100)
+        ir = ImageRect(page_num=1, x0=0, y0=0, x1=0.5, y1=0.5)
+        raster = _make_raster(0, 0, 72, 72, xref=3, width=4000, height=4000)
+        variants = _render_debug_variants(
+            doc, page, clip, ir, [raster], 300, cap_native=True,
+        )
+        assert variants[0][1] != b"BIG"
+        doc.extract_image.assert_not_called()
+        variants = _render_debug_variants(doc, page, clip, ir, [raster], 300)
+        assert variants[0][1] == b"BIG"
+
+    def test_photo_snap_renders_jpeg_and_bbox_png(self):
+        """Snap/auto renders use the AUTO/SNAP format; bbox stays PNG."""
+        page = _mock_page()
+        doc = MagicMock()
+        doc.extract_image.return_value = None
+        clip = pymupdf.Rect(0, 0, 100, 100)
+        ir = ImageRect(page_num=1, x0=0, y0=0, x1=0.5, y1=0.5)
+        raster = _make_raster(10, 10, 90, 90, stream_filter="DCTDecode")
+        variants = _render_debug_variants(doc, page, clip, ir, [raster], 72)
+        assert [v[2] for v in variants] == ["jpeg", "jpeg", "png"]
+
+    def test_info_reports_scaled_down_dpi(self):
+        """Variant info shows the DPI the region was actually rendered at."""
+        page = _mock_page()
+        clip = pymupdf.Rect(0, 0, 1000, 1000)
+        ir = ImageRect(page_num=1, x0=0, y0=0, x1=1, y1=1)
+        variants = _render_debug_variants(MagicMock(), page, clip, ir, [], 600)
+        effective = _region_dpi(clip, 600)
+        assert effective < 600
+        for _, _, _, info in variants:
+            assert info.endswith(f"@ {effective} DPI")
+
+    def test_snap_equal_to_clip_within_rounding_renders_once(self):
+        page = _mock_page()
+        doc = MagicMock()
+        doc.extract_image.return_value = None
+        clip = pymupdf.Rect(0, 0, 100, 100)
+        ir = ImageRect(page_num=1, x0=0, y0=0, x1=0.5, y1=0.5)
+        raster = _make_raster(0.0001, 0, 100.0001, 100)
+        _render_debug_variants(doc, page, clip, ir, [raster], 72)
+        assert page.get_pixmap.call_count == 1
 
 
 # ---------------------------------------------------------------------------
@@ -758,3 +1173,493 @@ class TestRenderImageRectsEdgeCases:
 
         assert len(result) == 1
         assert result[0].image_bytes == b"\x89PNG"
+
+
+# ---------------------------------------------------------------------------
+# render_image_rects_parallel()
+# ---------------------------------------------------------------------------
+
+
+def _write_pdf(path, n_pages):
+    """Write a PDF with a filled vector rect on every page.
+
+    Page 1 also carries an embedded raster image in its upper half.
+    """
+    doc = pymupdf.open()
+    for i in range(n_pages):
+        page = doc.new_page(width=200, height=200)
+        page.draw_rect(
+            pymupdf.Rect(20 + i * 10, 20, 120 + i * 10, 120),
+            color=(1, 0, 0), fill=(0, 0, 1),
+        )
+        if i == 0:
+            pix = pymupdf.Pixmap(pymupdf.csRGB, pymupdf.IRect(0, 0, 40, 40))
+            pix.set_rect(pix.irect, (0, 200, 0))
+            page.insert_image(pymupdf.Rect(10, 10, 110, 90), pixmap=pix)
+    doc.save(str(path))
+    doc.close()
+
+
+_SAMPLE_RECTS = [
+    ImageRect(page_num=3, x0=0.1, y0=0.1, x1=0.6, y1=0.6),
+    ImageRect(page_num=1, x0=0.1, y0=0.1, x1=0.5, y1=0.4),
+    ImageRect(page_num=1, x0=0.5, y0=0.5, x1=0.9, y1=0.9),
+    ImageRect(page_num=2, x0=0.0, y0=0.0, x1=1.0, y1=1.0),
+]
+
+
+class TestRenderImageRectsParallel:
+    """Process-parallel rendering matches the sequential path."""
+
+    def test_same_output_as_sequential(self, tmp_path):
+        pdf_path = tmp_path / "doc.pdf"
+        _write_pdf(pdf_path, 3)
+        rects = _SAMPLE_RECTS
+        doc = pymupdf.open(str(pdf_path))
+        try:
+            expected = render_image_rects(doc, rects, render_dpi=72)
+        finally:
+            doc.close()
+
+        result = render_image_rects_parallel(
+            pdf_path, rects, render_dpi=72, max_workers=2,
+        )
+        assert [r.filename for r in result] == [
+            r.filename for r in expected
+        ]
+        assert [r.image_bytes for r in result] == [
+            r.image_bytes for r in expected
+        ]
+
+    def test_empty_rects_returns_empty(self, tmp_path):
+        assert render_image_rects_parallel(tmp_path / "missing.pdf", []) == []
+
+    def test_pool_spawns_workers(self, tmp_path):
+        from pdf2md_claude import images
+
+        with images._render_pool(tmp_path / "doc.pdf", 1) as executor:
+            assert executor._mp_context.get_start_method() == "spawn"
+
+    def test_single_worker_off_main_thread(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from pdf2md_claude import images
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(images._get_max_workers).result() == 1
+
+    def test_worker_opens_pdf_once_for_all_pages(self, tmp_path, monkeypatch):
+        from pdf2md_claude import images
+
+        pdf_path = tmp_path / "doc.pdf"
+        _write_pdf(pdf_path, 3)
+        opened = []
+        real_open = pymupdf.open
+        monkeypatch.setattr(
+            images.pymupdf, "open",
+            lambda *a: opened.append(a) or real_open(*a),
+        )
+        monkeypatch.setattr(images, "_worker_doc", None)
+        monkeypatch.setattr(images, "_worker_native_cache", {})
+        images._init_worker(pdf_path)
+        try:
+            result = [
+                ri
+                for page_num, blocks in sorted(
+                    images._group_rects_by_page(_SAMPLE_RECTS).items()
+                )
+                for ri in images._render_page(
+                    page_num, blocks, ImageMode.AUTO, 72,
+                )
+            ]
+        finally:
+            images._worker_doc.close()
+        assert len(opened) == 1
+        assert [ri.filename for ri in result] == [
+            "img_p001_01.png", "img_p001_02.png",
+            "img_p002_01.png", "img_p003_01.png",
+        ]
+
+
+# ---------------------------------------------------------------------------
+# render_and_save()
+# ---------------------------------------------------------------------------
+
+
+class TestRenderAndSave:
+    """Streaming render matches render_image_rects() + save_images()."""
+
+    @pytest.mark.parametrize(
+        "mode", [ImageMode.AUTO, ImageMode.SNAP, ImageMode.BBOX],
+    )
+    def test_same_files_as_two_step(self, tmp_path, mode):
+        pdf_path = tmp_path / "doc.pdf"
+        _write_pdf(pdf_path, 3)
+        doc = pymupdf.open(str(pdf_path))
+        try:
+            expected_map = save_images(
+                render_image_rects(doc, _SAMPLE_RECTS, mode, render_dpi=72),
+                tmp_path / "two_step",
+            )
+            result_map = render_and_save(
+                doc, _SAMPLE_RECTS, tmp_path / "fused", mode, render_dpi=72,
+            )
+        finally:
+            doc.close()
+
+        assert result_map == expected_map
+        for names in result_map.values():
+            for name in names:
+                assert (tmp_path / "fused" / name).read_bytes() == (
+                    tmp_path / "two_step" / name
+                ).read_bytes()
+
+    def test_duplicate_regions_rendered_once(self, tmp_path, monkeypatch):
+        from pdf2md_claude import images
+
+        pdf_path = tmp_path / "doc.pdf"
+        _write_pdf(pdf_path, 2)
+        rects = [_SAMPLE_RECTS[3], _SAMPLE_RECTS[3]]     # same figure twice
+        calls = []
+        real = images._region_pixmap
+        monkeypatch.setattr(
+            images, "_region_pixmap",
+            lambda *a: calls.append(a) or real(*a),
+        )
+        doc = pymupdf.open(str(pdf_path))
+        try:
+            rendered = render_image_rects(doc, rects, render_dpi=72)
+            saved = render_and_save(doc, rects, tmp_path / "out", render_dpi=72)
+        finally:
+            doc.close()
+        assert len(calls) == 2          # once per path
+        assert [ri.filename for ri in rendered] == saved[2] == [
+            "img_p002_01.png", "img_p002_02.png",
+        ]
+        assert rendered[0].image_bytes == rendered[1].image_bytes
+        first, second = (tmp_path / "out" / f for f in saved[2])
+        assert first.read_bytes() == second.read_bytes()
+        assert os.path.samefile(first, second)
+
+    def test_removes_stale_images(self, tmp_path):
+        pdf_path = tmp_path / "doc.pdf"
+        _write_pdf(pdf_path, 1)
+        out = tmp_path / "out"
+        out.mkdir()
+        (out / "img_p009_01.png").write_bytes(b"stale")
+        (out / "notes.txt").write_text("keep")
+        doc = pymupdf.open(str(pdf_path))
+        try:
+            render_and_save(doc, _SAMPLE_RECTS[1:2], out, render_dpi=72)
+        finally:
+            doc.close()
+        assert not (out / "img_p009_01.png").exists()
+        assert (out / "notes.txt").exists()
+
+    def test_debug_mode_rejected(self, tmp_path):
+        with pytest.raises(ValueError, match="debug"):
+            render_and_save(
+                MagicMock(), _SAMPLE_RECTS, tmp_path, ImageMode.DEBUG,
+            )
+
+
+class TestRenderAndSaveParallel:
+    """Process-parallel save matches the sequential render_and_save()."""
+
+    def test_same_files_as_sequential(self, tmp_path):
+        pdf_path = tmp_path / "doc.pdf"
+        _write_pdf(pdf_path, 3)
+        doc = pymupdf.open(str(pdf_path))
+        try:
+            expected_map = render_and_save(
+                doc, _SAMPLE_RECTS, tmp_path / "seq", render_dpi=72,
+            )
+        finally:
+            doc.close()
+
+        result_map = render_and_save_parallel(
+            pdf_path, _SAMPLE_RECTS, tmp_path / "par",
+            render_dpi=72, max_workers=2,
+        )
+        assert result_map == expected_map
+        for names in result_map.values():
+            for name in names:
+                assert (tmp_path / "par" / name).read_bytes() == (
+                    tmp_path / "seq" / name
+                ).read_bytes()
+
+    def test_identical_images_linked_across_pages(self, tmp_path):
+        """Same dedupe rule as render_and_save(): one file per content."""
+        pdf_path = tmp_path / "doc.pdf"
+        _write_pdf(pdf_path, 3)
+        # A blank corner renders to the same PNG on every page.
+        rects = [
+            ImageRect(page_num=p, x0=0.8, y0=0.8, x1=0.95, y1=0.95)
+            for p in (1, 2, 2, 3)
+        ]
+        result_map = render_and_save_parallel(
+            pdf_path, rects, tmp_path / "out", render_dpi=72, max_workers=2,
+        )
+        paths = [
+            tmp_path / "out" / name
+            for names in result_map.values() for name in names
+        ]
+        assert len(paths) == 4
+        assert len({path.stat().st_ino for path in paths}) == 1
+        assert sorted(os.listdir(tmp_path / "out")) == sorted(
+            path.name for path in paths
+        )
+
+    def test_debug_mode_rejected(self, tmp_path):
+        with pytest.raises(ValueError, match="debug"):
+            render_and_save_parallel(
+                tmp_path / "doc.pdf", _SAMPLE_RECTS, tmp_path,
+                ImageMode.DEBUG,
+            )
+
+
+# ---------------------------------------------------------------------------
+# save_images()
+# ---------------------------------------------------------------------------
+
+
+class TestSaveImages:
+    """Tests for writing rendered images and cleaning old ones."""
+
+    def test_write_file_truncates_existing_file(self, tmp_path):
+        """Raw-fd writes replace a longer file left at the same name."""
+        path = tmp_path / "img_p001_01.png"
+        _write_file(path, b"x" * 100)
+        _write_file(path, b"short")
+        assert path.read_bytes() == b"short"
+
+    def test_cleanup_only_touches_image_files(self, tmp_path):
+        (tmp_path / "img_p002_01.png").write_bytes(b"stale")
+        (tmp_path / "img_p003_01.png").mkdir()  # directory, not a file
+        (tmp_path / "readme.md").write_text("keep")
+        rendered = [RenderedImage(
+            page_num=1, index=0, image_bytes=b"new",
+            filename="img_p001_01.png",
+        )]
+        assert save_images(rendered, tmp_path) == {1: ["img_p001_01.png"]}
+        assert (tmp_path / "img_p001_01.png").read_bytes() == b"new"
+        assert not (tmp_path / "img_p002_01.png").exists()
+        assert (tmp_path / "img_p003_01.png").is_dir()
+        assert (tmp_path / "readme.md").exists()
+
+    def test_writes_many_images(self, tmp_path):
+        rendered = [
+            RenderedImage(
+                page_num=p, index=i, image_bytes=f"{p}-{i}".encode(),
+                filename=IMAGE_FILENAME_FORMAT.format(
+                    page=p, idx=i + 1, ext="png",
+                ),
+            )
+            for p in (1, 2) for i in range(20)
+        ]
+        result = save_images(rendered, tmp_path)
+        assert result[1] == [r.filename for r in rendered[:20]]
+        assert result[2] == [r.filename for r in rendered[20:]]
+        for r in rendered:
+            assert (tmp_path / r.filename).read_bytes() == r.image_bytes
+
+    def _logo_images(self):
+        return [
+            RenderedImage(
+                page_num=p, index=0, image_bytes=b"LOGO",
+                filename=IMAGE_FILENAME_FORMAT.format(page=p, idx=1, ext="png"),
+            )
+            for p in (1, 2, 3)
+        ]
+
+    def test_identical_images_hard_linked(self, tmp_path):
+        rendered = self._logo_images()
+        save_images(rendered, tmp_path)
+        inodes = {(tmp_path / r.filename).stat().st_ino for r in rendered}
+        assert len(inodes) == 1
+        for r in rendered:
+            assert (tmp_path / r.filename).read_bytes() == b"LOGO"
+
+    def test_link_failure_falls_back_to_write(self, tmp_path):
+        rendered = self._logo_images()
+        with patch("pdf2md_claude.images.os.link", side_effect=OSError):
+            save_images(rendered, tmp_path)
+        for r in rendered:
+            assert (tmp_path / r.filename).read_bytes() == b"LOGO"
+
+
+# ---------------------------------------------------------------------------
+# Full-page render reuse
+# ---------------------------------------------------------------------------
+
+
+class TestFullPagePixmap:
+    """Tests for rendering a page once and cropping regions from it."""
+
+    def _page(self, tmp_path):
+        pdf_path = tmp_path / "doc.pdf"
+        _write_pdf(pdf_path, 1)
+        doc = pymupdf.open(str(pdf_path))
+        return doc, doc[0]
+
+    def test_not_used_for_few_regions(self, tmp_path):
+        doc, page = self._page(tmp_path)
+        try:
+            assert _full_page_pixmap(page, 72, 2) is None
+            assert _full_page_pixmap(page, 72, 3) is not None
+        finally:
+            doc.close()
+
+    def test_not_used_above_pixel_budget(self, tmp_path, monkeypatch):
+        from pdf2md_claude import images
+
+        doc, page = self._page(tmp_path)
+        monkeypatch.setattr(images, "_FULL_PAGE_MAX_PIXELS", 100)
+        try:
+            assert _full_page_pixmap(page, 72, 10) is None
+        finally:
+            doc.close()
+
+    def test_crop_matches_direct_render_geometry(self, tmp_path):
+        doc, page = self._page(tmp_path)
+        try:
+            page_pix = _full_page_pixmap(page, 144, 3)
+            for clip in (
+                pymupdf.Rect(20.3, 30.7, 180.2, 160.9),
+                pymupdf.Rect(0, 0, 200, 200),
+                pymupdf.Rect(150, 150, 250, 250),  # runs off the page
+            ):
+                direct = page.get_pixmap(clip=clip, dpi=144)
+                cropped = _region_pixmap(page, clip, 144, page_pix)
+                assert cropped.irect == direct.irect
+                assert cropped.n == direct.n
+                assert cropped.xres == direct.xres
+        finally:
+            doc.close()
+
+
+# ---------------------------------------------------------------------------
+# _load_page()
+# ---------------------------------------------------------------------------
+
+
+class TestLoadPage:
+    """Tests for the caller-owned page LRU."""
+
+    def test_reuses_cached_page(self):
+        doc = MagicMock()
+        cache = {}
+        first = _load_page(doc, 2, cache)
+        assert _load_page(doc, 2, cache) is first
+        doc.__getitem__.assert_called_once_with(2)
+
+    def test_evicts_least_recently_used(self, monkeypatch):
+        from pdf2md_claude import images
+
+        monkeypatch.setattr(images, "_PAGE_CACHE_SIZE", 2)
+        doc = MagicMock()
+        cache = {}
+        _load_page(doc, 0, cache)
+        _load_page(doc, 1, cache)
+        _load_page(doc, 0, cache)   # 0 becomes most recent
+        _load_page(doc, 2, cache)   # evicts 1
+        assert list(cache) == [0, 2]
+
+    def test_without_cache_loads_every_time(self):
+        doc = MagicMock()
+        _load_page(doc, 0)
+        _load_page(doc, 0)
+        assert doc.__getitem__.call_count == 2
+
+
+# ---------------------------------------------------------------------------
+# _page_rasters() / _match_page_blocks()
+# ---------------------------------------------------------------------------
+
+
+class TestPageRasters:
+    """Tests for the caller-owned raster index cache."""
+
+    def test_indexes_once_per_page(self, tmp_path, monkeypatch):
+        from pdf2md_claude import images
+
+        pdf_path = tmp_path / "doc.pdf"
+        _write_pdf(pdf_path, 1)
+        calls = []
+        original = images._index_page_rasters
+        monkeypatch.setattr(
+            images, "_index_page_rasters",
+            lambda page: calls.append(page.number) or original(page),
+        )
+        cache = {}
+        for _ in range(2):
+            doc = pymupdf.open(str(pdf_path))
+            try:
+                rasters = _page_rasters(doc[0], cache)
+            finally:
+                doc.close()
+            assert len(rasters) == 1
+        assert calls == [0]
+
+    def test_page_without_rasters_skips_matching(self, tmp_path, monkeypatch):
+        from pdf2md_claude import images
+
+        pdf_path = tmp_path / "doc.pdf"
+        _write_pdf(pdf_path, 2)
+        monkeypatch.setattr(
+            images, "_match_rasters_to_blocks",
+            MagicMock(side_effect=AssertionError("matching not skipped")),
+        )
+        doc = pymupdf.open(str(pdf_path))
+        try:
+            _, clips, rasters, matches = _match_page_blocks(
+                doc, 2, _SAMPLE_RECTS[3:], ImageMode.AUTO,
+            )
+        finally:
+            doc.close()
+        assert rasters == []
+        assert matches == {0: []}
+        assert len(clips) == 1
+
+
+
+# ---------------------------------------------------------------------------
+# ImageExtractor
+# ---------------------------------------------------------------------------
+
+
+class TestImageExtractor:
+    """Tests for choosing in-process or pooled page rendering."""
+
+    _RECTS = [
+        ImageRect(page_num=p, x0=0.1, y0=0.1, x1=0.5, y1=0.5)
+        for p in range(1, 5)
+    ]
+
+    def _extract(self, tmp_path, monkeypatch, **kwargs):
+        from pdf2md_claude import images
+
+        pdf_path = tmp_path / "doc.pdf"
+        _write_pdf(pdf_path, 4)
+        monkeypatch.setattr(images, "parse_image_rects", lambda _: self._RECTS)
+        monkeypatch.setattr(images, "_get_max_workers", lambda: 8)
+        sequential = MagicMock(return_value={})
+        parallel = MagicMock(return_value={})
+        monkeypatch.setattr(images, "render_and_save", sequential)
+        monkeypatch.setattr(images, "render_and_save_parallel", parallel)
+        ImageExtractor(pdf_path, tmp_path / "out", **kwargs).extract_and_inject(
+            "markdown",
+        )
+        return sequential, parallel
+
+    def test_renders_in_process_by_default(self, tmp_path, monkeypatch):
+        sequential, parallel = self._extract(tmp_path, monkeypatch)
+        sequential.assert_called_once()
+        parallel.assert_not_called()
+
+    def test_auto_workers_use_pool(self, tmp_path, monkeypatch):
+        sequential, parallel = self._extract(
+            tmp_path, monkeypatch, max_workers=None,
+        )
+        sequential.assert_not_called()
+        assert parallel.call_args.kwargs["max_workers"] == 8
@@ -9,13 +9,22 @@ from pdf2md_claude.markers import (
     IMAGE_AI_DESC_END,
     IMAGE_AI_DESCRIPTION_BLOCK_RE,
     IMAGE_BEGIN,
+    IMAGE_CAPTION,
     IMAGE_END,
+    IMAGE_EVENTS_RE,
     IMAGE_RECT,
     PAGE_BEGIN,
     PAGE_END,
     PAGE_SKIP,
+    TABLE_BLOCK_RE,
     TABLE_CONTINUE,
     MarkerDef,
+    _to_non_capturing,
+    iter_markers,
+    iter_table_blocks,
+    markers_re,
+    strip_ai_description_blocks,
+    table_tag_offsets,
 )
 
 
@@ -227,6 +236,22 @@ class TestMarkerDefFrozen:
         with pytest.raises(AttributeError):
             PAGE_BEGIN.tag = "CHANGED"  # type: ignore[misc]
 
+    def test_regexes_compiled_at_construction(self):
+        marker = MarkerDef("X_TEST", _value_re=r"(\d+)", _value_fmt="{0}")
+        assert {"re", "re_value", "re_value_groups", "re_value_line"} <= set(
+            vars(marker)
+        )
+        assert "re" in vars(MarkerDef("Y_TEST"))
+
+    def test_literals_built_at_construction(self):
+        marker = MarkerDef("Z_TEST")
+        assert vars(marker)["marker"] == "<!-- Z_TEST -->"
+        assert {"example", "prompt_template"} <= set(vars(marker))
+
+    def test_equality_ignores_compiled_regexes(self):
+        assert MarkerDef("X_TEST") == MarkerDef("X_TEST")
+        assert hash(MarkerDef("X_TEST")) == hash(MarkerDef("X_TEST"))
+
 
 # ---------------------------------------------------------------------------
 # IMAGE_BEGIN / IMAGE_END valueless markers
@@ -507,3 +532,170 @@ class TestImageRectReValueGroups:
 
         result = IMAGE_RECT.re_value_groups.sub(scale, text)
         assert result == "<!-- IMAGE_RECT REPLACED -->"
+
+
+class TestMarkersRe:
+    """markers_re / iter_markers scan several markers in one pass."""
+
+    def test_lastgroup_names_marker(self):
+        pattern = markers_re(PAGE_BEGIN, PAGE_END)
+        m = pattern.search("x <!-- PDF_PAGE_END 4 --> y")
+        assert m is not None
+        assert m.lastgroup == PAGE_END.tag
+
+    def test_document_order_and_values(self):
+        text = (
+            "<!-- PDF_PAGE_BEGIN 1 -->\n"
+            "<!-- IMAGE_BEGIN -->\n"
+            "<!-- IMAGE_END -->\n"
+            "<!-- PDF_PAGE_END 1 -->\n"
+        )
+        events = [(m, v) for m, v, _ in iter_markers(text)]
+        assert events == [
+            (PAGE_BEGIN, "1"),
+            (IMAGE_BEGIN, None),
+            (IMAGE_END, None),
+            (PAGE_END, "1"),
+        ]
+
+    def test_restricted_pattern_ignores_other_markers(self):
+        text = "<!-- PDF_PAGE_BEGIN 2 --><!-- IMAGE_BEGIN -->"
+        pattern = markers_re(IMAGE_BEGIN)
+        events = [m for m, _, _ in iter_markers(text, pattern)]
+        assert events == [IMAGE_BEGIN]
+
+    def test_match_span_covers_marker(self):
+        text = "ab<!-- PDF_PAGE_SKIP -->cd"
+        [(_, value, match)] = list(iter_markers(text))
+        assert value is None
+        assert match.group(0) == PAGE_SKIP.marker
+
+    def test_image_events_include_rect_and_caption(self):
+        text = (
+            "<!-- IMAGE_BEGIN -->\n"
+            "<!-- IMAGE_RECT 0.1,0.2,0.5,0.6 -->\n"
+            "  **Figure 1 - Layout**  \n"
+            "<!-- IMAGE_END -->\n"
+        )
+        events = [
+            (m.lastgroup, m.group(m.lastindex + 1))
+            for m in IMAGE_EVENTS_RE.finditer(text)
+            if m.lastgroup != IMAGE_BEGIN.tag and m.lastgroup != IMAGE_END.tag
+        ]
+        assert events == [
+            (IMAGE_RECT.tag, "0.1,0.2,0.5,0.6"),
+            (IMAGE_CAPTION, "Figure 1 - Layout"),
+        ]
+
+
+class TestMarkerDefLiteralScans:
+    """contains / count / find_all_spans agree with the ``.re`` regex."""
+
+    @pytest.mark.parametrize("text", [
+        "",
+        "no markers here",
+        "<!-- TABLE_CONTINUE -->",
+        "a<!-- TABLE_CONTINUE -->b<!-- TABLE_CONTINUE -->",
+        "<!--TABLE_CONTINUE-->",
+        "x <!-- TABLE_CONTINUE --> y <!--  TABLE_CONTINUE\n-->",
+        "prose mentioning TABLE_CONTINUE <!-- TABLE_CONTINUE -->",
+    ])
+    def test_matches_regex(self, text):
+        regex = TABLE_CONTINUE.re
+        assert TABLE_CONTINUE.contains(text) == (
+            regex.search(text) is not None
+        )
+        assert TABLE_CONTINUE.count(text) == len(regex.findall(text))
+        assert TABLE_CONTINUE.find_all_spans(text) == [
+            m.span() for m in regex.finditer(text)
+        ]
+
+    def test_spans_slice_to_marker(self):
+        text = f"a{IMAGE_BEGIN.marker}b{IMAGE_BEGIN.marker}"
+        spans = IMAGE_BEGIN.find_all_spans(text)
+        assert [text[s:e] for s, e in spans] == [IMAGE_BEGIN.marker] * 2
+
+
+class TestStripAIDescriptionBlocks:
+    """strip_ai_description_blocks matches the block regex substitution."""
+
+    _B = "<!-- IMAGE_AI_GENERATED_DESCRIPTION_BEGIN -->"
+    _E = "<!-- IMAGE_AI_GENERATED_DESCRIPTION_END -->"
+
+    @pytest.mark.parametrize("text", [
+        "",
+        "plain text",
+        f"a{_B}\n> desc\n{_E}b",
+        f"a{_B}x{_E}b{_B}y{_E}c",
+        f"a{_B}orphan",
+        f"a{_E}x{_B}y{_E}z",
+        f"a{_B}x{_B}y{_E}z",
+        f"a{_B}x{_E}b{_B}unclosed",
+        "a<!--IMAGE_AI_GENERATED_DESCRIPTION_BEGIN-->x"
+        f"{_E}b{_B}y{_E}c",
+    ])
+    @pytest.mark.parametrize("repl", ["", " "])
+    def test_matches_regex(self, text, repl):
+        expected = IMAGE_AI_DESCRIPTION_BLOCK_RE.sub(repl, text)
+        assert strip_ai_description_blocks(text, repl) == expected
+
+
+class TestToNonCapturing:
+    """_to_non_capturing rewrites only real capturing groups."""
+
+    @pytest.mark.parametrize("pattern, expected", [
+        (r"(\d+)", r"(?:\d+)"),
+        (r"([0-9.]+),([0-9.]+)", r"(?:[0-9.]+),(?:[0-9.]+)"),
+        (r"(?:x)(y)", r"(?:x)(?:y)"),
+        (r"(?P<n>x)(?=y)", r"(?P<n>x)(?=y)"),
+        (r"\((x)\)", r"\((?:x)\)"),
+        (r"[()](x)", r"[()](?:x)"),
+        (r"[]()](x)", r"[]()](?:x)"),
+        (r"[^]()](x)", r"[^]()](?:x)"),
+        (r"[\]()](x)", r"[\]()](?:x)"),
+    ])
+    def test_rewrite(self, pattern, expected):
+        assert _to_non_capturing(pattern) == expected
+
+    @pytest.mark.parametrize("pattern", [
+        r"(\d+)", r"(a(b)c)", r"[(]+(x)\((y)",
+    ])
+    def test_result_has_no_groups(self, pattern):
+        assert re.compile(_to_non_capturing(pattern)).groups == 0
+
+
+class TestTableTagOffsets:
+    """table_tag_offsets finds the same tags as case-insensitive regexes."""
+
+    @pytest.mark.parametrize("text", [
+        "",
+        "<table><TABLE class=x></Table></table>",
+        "<tablex><table_x><table-x></table>",
+        "İ<Table>non-ascii lower-case growth</TABLE>",
+    ])
+    def test_matches_regex(self, text):
+        expected = (
+            [m.start() for m in re.finditer(r"<table\b", text, re.I)],
+            [m.start() for m in re.finditer(r"</table>", text, re.I)],
+        )
+        assert table_tag_offsets(text) == expected
+
+
+class TestIterTableBlocks:
+    """iter_table_blocks yields the same spans as TABLE_BLOCK_RE."""
+
+    @pytest.mark.parametrize("text", [
+        "",
+        "no tables",
+        "<table><tr><td>1</td></tr></table>",
+        "a<TABLE class='x'>\n<tr></tr></Table>b<table>c</table>",
+        "<tablex>not a table</table><table>yes</table>",
+        "<table_x>no</table>",
+        "<table>unclosed",
+        "<table no close bracket",
+        "</table><table>ok</table></table>",
+        "İ<table>non-ascii lower-case growth</table>",
+    ])
+    def test_matches_regex(self, text):
+        expected = [m.span() for m in TABLE_BLOCK_RE.finditer(text)]
+        assert list(iter_table_blocks(text)) == expected
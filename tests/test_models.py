@@ -1,9 +1,12 @@
 """Unit tests for models.py (DocumentUsageStats, StageCost, format_summary)."""
 
+import pytest
+
 from pdf2md_claude.models import (
     DocumentUsageStats,
     StageCost,
     SONNET_4_5,
+    calculate_cost,
     format_summary,
 )
 
@@ -225,3 +228,43 @@ class TestFormatSummary:
         assert "5,000" in conv_lines[0]  # base input
         assert "2,500" in conv_lines[0]  # base output
         assert "$   0.25" in conv_lines[0] or "$ 0.25" in conv_lines[0]  # base cost
+
+
+class TestCalculateCost:
+    """Tests for calculate_cost() per-request pricing."""
+
+    def test_base_rates(self):
+        p = SONNET_4_5.pricing
+        cost = calculate_cost(
+            SONNET_4_5, input_tokens=10_000, output_tokens=2_000,
+            cache_creation_tokens=4_000, cache_read_tokens=6_000,
+        )
+        expected = (
+            10_000 * p.input_per_mtok
+            + 4_000 * p.input_per_mtok * p.cache_write_multiplier
+            + 6_000 * p.input_per_mtok * p.cache_read_multiplier
+            + 2_000 * p.output_per_mtok
+        ) / 1_000_000
+        assert cost == pytest.approx(expected)
+
+    def test_long_context_rates_apply_to_all_tokens(self):
+        p = SONNET_4_5.pricing
+        half = p.long_ctx_threshold // 2 + 1
+        cost = calculate_cost(
+            SONNET_4_5, input_tokens=half, output_tokens=1_000,
+            cache_read_tokens=half,
+        )
+        expected = (
+            half * p.long_ctx_input_per_mtok
+            + half * p.long_ctx_input_per_mtok * p.cache_read_multiplier
+            + 1_000 * p.long_ctx_output_per_mtok
+        ) / 1_000_000
+        assert cost == pytest.approx(expected)
+
+    def test_threshold_is_exclusive(self):
+        p = SONNET_4_5.pricing
+        cost = calculate_cost(
+            SONNET_4_5, input_tokens=p.long_ctx_threshold, output_tokens=0,
+        )
+        expected = p.long_ctx_threshold * p.input_per_mtok / 1_000_000
+        assert cost == pytest.approx(expected)
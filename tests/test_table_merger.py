@@ -381,3 +381,39 @@ class TestMarkerInsideOpenTable:
         assert "OFF" in result
         assert "DOWN" in result
         assert TABLE_CONTINUE.re.search(result) is None
+
+    def test_open_table_marker_before_continuation(self):
+        """An intra-table marker is still detected after a later splice."""
+        md = """\
+<!-- PDF_PAGE_BEGIN 59 -->
+
+<table>
+<thead><tr><th>Name</th><th>Opcode</th></tr></thead>
+<tbody>
+<tr><td>OFF</td><td>0x00</td></tr>
+
+<!-- TABLE_CONTINUE -->
+
+<tr><td>UP</td><td>0x01</td></tr>
+</tbody>
+</table>
+
+<!-- PDF_PAGE_END 59 -->
+
+<!-- PDF_PAGE_BEGIN 60 -->
+
+<!-- TABLE_CONTINUE -->
+
+<table>
+<thead><tr><th>Name</th><th>Opcode</th></tr></thead>
+<tbody>
+<tr><td>DOWN</td><td>0x02</td></tr>
+</tbody>
+</table>
+
+<!-- PDF_PAGE_END 60 -->"""
+        result = merge_continued_tables(md)
+
+        assert _count_tables(result) == 1
+        assert _count_rows(result) == 4
+        assert TABLE_CONTINUE.re.search(result) is None